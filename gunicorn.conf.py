@@ -0,0 +1,50 @@
+"""gunicorn settings, picked up from the working directory.
+
+Sets up the prometheus_client multiprocess directory the workers share,
+see website/metrics.py.
+
+The application is loaded once in the master and the workers are forked
+from it, so a restarted dyno imports Django and the project only once.
+Loading it opens no connections (see i_cant_chat/wsgi.py), every worker
+opens its own and warms them up before taking requests.
+"""
+import os
+import shutil
+import tempfile
+
+
+# must be set before anything imports prometheus_client: it picks the
+# multiprocess value class on import, and with preload_app the workers
+# inherit the master's modules
+os.environ.setdefault(
+    'prometheus_multiproc_dir',
+    os.path.join(tempfile.gettempdir(), 'i-cant-chat-metrics')
+)
+# the preloaded app creates its samples before on_starting runs
+os.makedirs(os.environ['prometheus_multiproc_dir'], exist_ok=True)
+
+preload_app = True
+
+
+def on_starting(server):
+    # samples of a previous run would be summed up with the new ones
+    path = os.environ['prometheus_multiproc_dir']
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    # nothing should be open yet, but a connection shared with the master
+    # would be used by several processes at once
+    from django.db import connections
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    from website.warmup import warm_up
+    warm_up()
@@ -3,6 +3,19 @@ ASGI config for i_cant_chat project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+ASGI deployment mode: set ``ASYNC_SERVING = True`` in the settings, so the
+username chat and Discord auth urls are routed to the async views, and run
+uvicorn workers under gunicorn instead of the default web process:
+
+    web: gunicorn i_cant_chat.asgi:application -k uvicorn.workers.UvicornWorker
+
+Each worker then keeps many Discord calls in flight on one event loop
+instead of blocking a whole sync worker per round-trip. Compare both modes
+with ``python manage.py bench_serving``.
+
+The live feed Server-Sent Events stream (website/streaming.py) is served
+here in front of Django, WSGI deployments long-poll instead.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
 """
@@ -13,4 +26,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'i_cant_chat.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# imported once Django is set up
+from website.streaming import EventStreamRouter  # noqa: E402
+
+application = EventStreamRouter(django_application)
@@ -1,9 +1,8 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
-from .settings import DEBUG
-
-admin_url = 'admin/' if DEBUG else "vhod/tolko/dlya/geev/ah/ty/pidoras/suka/TRUMP/VECHEN/"
+admin_url = 'admin/' if settings.DEBUG else "vhod/tolko/dlya/geev/ah/ty/pidoras/suka/TRUMP/VECHEN/"
 
 urlpatterns = [
     path('', include('website.urls')),
@@ -1,7 +1,8 @@
 """
 WSGI config for i_cant_chat project.
 
-It exposes the WSGI callable as a module-level variable named ``application``.
+It exposes the WSGI callable as a module-level variable named ``application``,
+built by ``create_app()``. gunicorn preloads it, see gunicorn.conf.py.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.0/howto/deployment/wsgi/
@@ -11,6 +12,12 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'i_cant_chat.settings')
 
-application = get_wsgi_application()
+def create_app():
+    """Sets Django up and returns the WSGI application. Opens no database
+    or HTTP connections, so gunicorn can preload it in the master."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'i_cant_chat.settings')
+    return get_wsgi_application()
+
+
+application = create_app()
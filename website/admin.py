@@ -1,17 +1,115 @@
 from django.contrib import admin
-from website.models import DiscordToken, DiscordUser, UsernameMessage
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from website.models import (
+    DiscordRateLimit, DiscordToken, DiscordUser, DynamicUsername,
+    UsernameChangeJob, UsernameMessage
+)
+
+
+# pages past this many rows are reached with the "older" link
+COUNT_LIMIT = 10000
+CURSOR_PARAM = 'id__lt'
+
+
+class EstimatedCountPaginator(Paginator):
+    """Takes the row estimate of Postgres for a whole table and counts
+    filtered lists up to COUNT_LIMIT rows, never the whole table"""
+
+    def _estimate(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if queryset.query.where or connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        # -1 or nothing until the table is analyzed
+        return int(row[0]) if row and row[0] > COUNT_LIMIT else None
+
+    @cached_property
+    def count(self):
+        estimate = self._estimate()
+        if estimate is not None:
+            return estimate
+        return self.object_list.order_by()[:COUNT_LIMIT].count()
+
+
+class CursorChangeList(ChangeList):
+    def get_results(self, request):
+        super().get_results(request)
+        # evaluated here and reused by the template
+        results = list(self.result_list)
+        self.older_url = None
+        if len(results) == self.list_per_page:
+            self.older_url = self.get_query_string(
+                {CURSOR_PARAM: results[-1].pk}, [PAGE_VAR]
+            )
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelist for tables too big for COUNT(*) and deep OFFSETs: the
+    count is estimated and the "older" link continues below the last id
+    of the page"""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ('-id',)
+    change_list_template = 'admin/website/cursor_change_list.html'
+
+    def get_changelist(self, request, **kwargs):
+        return CursorChangeList
 
 
 class DiscordTokenAdmin(admin.ModelAdmin):
     readonly_fields = (
-        'last_time_updated', 'expires_in', 'is_expired', 'valid_till'
+        'last_time_updated', 'expires_in', 'expires_at', 'is_expired',
+        'valid_till'
     )
 
 
-class DiscordUserAdmin(admin.ModelAdmin):
+class DiscordUserAdmin(LargeTableAdmin):
+    list_display = ('id', 'discord_user_id', 'username', 'user')
+    list_select_related = ('user',)
+    raw_id_fields = ('user', 'token')
+    search_fields = ('=discord_user_id',)
     readonly_fields = ('avatar_url',)
 
 
+class UsernameMessageAdmin(LargeTableAdmin):
+    list_display = ('id', 'text', 'discord_user', 'sent')
+    # DiscordUser.__str__ falls back to the user
+    list_select_related = ('discord_user__user',)
+    raw_id_fields = ('discord_user',)
+    search_fields = ('=discord_user__discord_user_id',)
+    date_hierarchy = 'sent'
+
+
+class DiscordRateLimitAdmin(admin.ModelAdmin):
+    list_display = ('key', 'bucket', 'remaining', 'limit', 'reset_at')
+
+
+class UsernameChangeJobAdmin(LargeTableAdmin):
+    list_display = ('id', 'text', 'status', 'attempts', 'run_after', 'created')
+    list_filter = ('status',)
+    raw_id_fields = ('discord_user', 'message')
+
+
+class DynamicUsernameAdmin(admin.ModelAdmin):
+    list_display = ('discord_user', 'interval', 'position', 'is_active', 'next_run_at')
+    list_select_related = ('discord_user__user',)
+    list_filter = ('is_active',)
+    raw_id_fields = ('discord_user',)
+
+
 admin.site.register(DiscordToken, DiscordTokenAdmin)
 admin.site.register(DiscordUser, DiscordUserAdmin)
-admin.site.register(UsernameMessage)
+admin.site.register(UsernameMessage, UsernameMessageAdmin)
+admin.site.register(DiscordRateLimit, DiscordRateLimitAdmin)
+admin.site.register(UsernameChangeJob, UsernameChangeJobAdmin)
+admin.site.register(DynamicUsername, DynamicUsernameAdmin)
@@ -6,3 +6,8 @@ class WebsiteConfig(AppConfig):
 
     def ready(self):
         import website.signals
+
+        from website import metrics
+        from website.services.discord_api import BaseDiscordApi, CircuitBreaker
+        BaseDiscordApi.add_call_listener(metrics.observe_discord_call)
+        CircuitBreaker.add_state_listener(metrics.observe_breaker_state)
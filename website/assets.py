@@ -0,0 +1,206 @@
+"""Build step of the static files, run by `manage.py build_assets`.
+
+The pages use a small part of Bootstrap, so its stylesheet is purged of
+the rules none of our templates or scripts can match and is shipped in
+one file with styles.css. The header font is cut down to the glyphs the
+site can show, the scripts are concatenated and stripped of comments and
+indentation. The results are written to static/dist and committed, so
+collectstatic picks them up like any other static file: the storage set
+by django_heroku gives them hashed names with gzip and brotli variants,
+and whitenoise serves hashed names with immutable cache headers.
+"""
+import gzip
+import re
+
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+# classes added by Bootstrap's own scripts and so never found in our sources
+SAFELIST = (
+    "show", "showing", "collapse", "collapsing", "collapsed", "fade", "active",
+    "disabled", "focus", "navbar-collapse", "navbar-toggler", "dropdown-menu"
+)
+# at-rules holding other rules, the rest (@font-face, @keyframes...) are kept
+NESTED_AT_RULES = ("@media", "@supports", "@document")
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_STRING_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+_NOT_RE = re.compile(r":not\([^)]*\)")
+_WORD_RE = re.compile(r"[A-Za-z_][\w-]*")
+_SOURCE_MAP_RE = re.compile(r"^//# sourceMappingURL=.*$", re.M)
+
+
+def collect_names(sources: Iterable[str]) -> Set[str]:
+    """Every word of the sources counts as a class name in use, so a class
+    set from a template or built in a script is never purged by mistake"""
+    names = set(SAFELIST)
+    for source in sources:
+        names.update(_WORD_RE.findall(source))
+    return names
+
+
+def _split_rules(css: str) -> List[Tuple[str, Optional[str]]]:
+    """Top level (prelude, body) pairs, body is None for statements like
+    @charset and @import"""
+    rules = []
+    depth, start, body_start, quote = 0, 0, 0, None
+    for i, char in enumerate(css):
+        if quote:
+            if char == quote and css[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                body_start = i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((css[start:body_start].strip(), css[body_start + 1:i]))
+                start = i + 1
+        elif char == ";" and depth == 0:
+            rules.append((css[start:i].strip(), None))
+            start = i + 1
+    return rules
+
+
+def _split_selectors(prelude: str) -> List[str]:
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def _selector_used(selector: str, names: Set[str]) -> bool:
+    # `.btn:not(.disabled)` matches exactly when `disabled` is not used
+    classes = _CLASS_RE.findall(_NOT_RE.sub("", selector))
+    return all(name in names for name in classes)
+
+
+def purge_css(css: str, names: Set[str]) -> str:
+    """Drops the selectors needing a class out of `names` and the rules left
+    without selectors"""
+    kept = []
+    for prelude, body in _split_rules(_COMMENT_RE.sub("", css)):
+        if body is None:
+            kept.append(prelude + ";")
+        elif prelude.startswith(NESTED_AT_RULES):
+            inner = purge_css(body, names)
+            if inner:
+                kept.append(prelude + "{" + inner + "}")
+        elif prelude.startswith("@"):
+            kept.append(prelude + "{" + body + "}")
+        else:
+            selectors = [
+                selector for selector in _split_selectors(prelude)
+                if _selector_used(selector, names)
+            ]
+            if selectors:
+                kept.append(",".join(selectors) + "{" + body + "}")
+    return "".join(kept)
+
+
+def _minify_css_code(code: str) -> str:
+    code = re.sub(r"\s+", " ", code)
+    # a space before ":" is a descendant combinator and has to stay
+    code = re.sub(r"\s*([{};,>])\s*", r"\1", code)
+    return re.sub(r":\s+", ":", code)
+
+
+def minify_css(css: str) -> str:
+    parts = _STRING_RE.split(_COMMENT_RE.sub("", css))
+    # odd parts are the string literals
+    css = "".join(
+        part if i % 2 else _minify_css_code(part) for i, part in enumerate(parts)
+    )
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(source: str) -> str:
+    """Removes comments and indentation. Line breaks stay where they were,
+    so automatic semicolon insertion works the same way"""
+    out = []
+    i, length = 0, len(source)
+    last = ""  # the last significant character, tells a regex from a division
+    while i < length:
+        char = source[i]
+        if char in "\"'`":
+            end = i + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == "\\" else 1
+            out.append(source[i:end + 1])
+            i, last = end + 1, char
+        elif source.startswith("//", i):
+            i = source.find("\n", i)
+            i = length if i == -1 else i
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+            out.append(" ")
+        elif char == "/" and (not last or last in "(,=:[!&|?{};+-*%<>~^"):
+            end, in_class = i + 1, False
+            while end < length and (in_class or source[end] != "/"):
+                if source[end] == "\\":
+                    end += 1
+                elif source[end] == "[":
+                    in_class = True
+                elif source[end] == "]":
+                    in_class = False
+                end += 1
+            out.append(source[i:end + 1])
+            i, last = end + 1, "/"
+        elif char.isspace():
+            end = i
+            while end < length and source[end].isspace():
+                end += 1
+            out.append("\n" if "\n" in source[i:end] else " ")
+            i = end
+        else:
+            out.append(char)
+            i, last = i + 1, char
+
+    code = "".join(out)
+    code = re.sub(r" ?\n[ \n]*", "\n", code)
+    return code.strip()
+
+
+def strip_source_map(source: str) -> str:
+    # the maps are not shipped with the bundle
+    return _SOURCE_MAP_RE.sub("", source).strip()
+
+
+def subset_font(path: str, output: str, text: str, unicodes: Iterable[int]):
+    """Writes a woff2 font with the glyphs of `text` and `unicodes` only.
+    Needs fontTools and brotli, raises ImportError without them."""
+    from fontTools import subset
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.drop_tables += ["FFTM", "webf"]
+    font = subset.load_font(path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text, unicodes=unicodes)
+    subsetter.subset(font)
+    subset.save_font(font, output, options)
+
+
+def compressed_sizes(content: bytes) -> Tuple[int, int, Optional[int]]:
+    """Raw, gzip and brotli sizes, brotli is None without the module"""
+    try:
+        import brotli
+    except ImportError:
+        brotli_size = None
+    else:
+        brotli_size = len(brotli.compress(content))
+    return len(content), len(gzip.compress(content, 9)), brotli_size
@@ -0,0 +1,40 @@
+"""The signed in user loaded with a single cached query.
+
+django.contrib.auth loads the User on every request and the views then
+look its DiscordUser up. CachedUserBackend loads both with one
+select_related query kept in the selector cache, the receivers in
+website.signals drop the entry when either row changes. The query is
+cached only when the selector cache is shared between the workers,
+otherwise it runs on every request. It is used with
+CachedAuthenticationMiddleware in place of the stock ones:
+
+    AUTHENTICATION_BACKENDS = ['website.auth.CachedUserBackend']
+    MIDDLEWARE = [..., 'website.middleware.CachedAuthenticationMiddleware', ...]
+
+The session itself can be kept out of the database too, see
+website.sessions.
+"""
+from typing import Optional
+
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+from website.models import DiscordUser
+from website.selectors import get_discord_user, get_session_user
+
+
+class CachedUserBackend(ModelBackend):
+    def get_user(self, user_id):
+        user = get_session_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+
+def get_request_discord_user(request) -> Optional[DiscordUser]:
+    """DiscordUser of the signed in user, None for anonymous users"""
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    if User.discord_user.is_cached(user):
+        # loaded along with the user by CachedUserBackend
+        return getattr(user, 'discord_user', None)
+    return get_discord_user(user.username)
@@ -0,0 +1,143 @@
+"""Read-through cache for website.selectors.
+
+Backed by the SELECTOR_CACHE_ALIAS entry of CACHES when it is configured
+(use a shared backend there to share entries between workers), otherwise
+by a private bounded LRU local-memory cache. Entries are dropped by the
+receivers in website.signals when the rows change and expire after
+SELECTOR_CACHE_TIMEOUT seconds in any case. SELECTOR_CACHE_ENABLED = False
+turns the cache off. Selectors marked shared_only are cached with a
+shared backend only: a worker keeping its own copy would not see the
+receivers of the other workers run.
+
+A shared backend also keeps versions of groups of entries kept
+elsewhere, like the template fragments of a user's pages: bump_version()
+is cheaper than finding and deleting every entry of the group. Versions
+bumped by other processes are not seen in a private cache, so there are
+none without a shared backend and such groups are not cached at all.
+"""
+import threading
+import time
+
+from collections import defaultdict
+from functools import wraps
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+CACHE_ALIAS = getattr(settings, 'SELECTOR_CACHE_ALIAS', 'selectors')
+CACHE_TIMEOUT = getattr(settings, 'SELECTOR_CACHE_TIMEOUT', 300)
+CACHE_MAX_ENTRIES = getattr(settings, 'SELECTOR_CACHE_MAX_ENTRIES', 2000)
+
+# cache.get() returns None for misses, so cached None results are wrapped
+_NONE = '__none__'
+
+_cache = None
+_stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+_stats_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'SELECTOR_CACHE_ENABLED', True)
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        if CACHE_ALIAS in settings.CACHES:
+            _cache = caches[CACHE_ALIAS]
+        else:
+            _cache = LocMemCache('website-selectors', {
+                'TIMEOUT': CACHE_TIMEOUT,
+                'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES}
+            })
+    return _cache
+
+
+def is_shared() -> bool:
+    """Whether the workers see the same entries"""
+    return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+
+def make_key(name: str, *args) -> str:
+    return ":".join(["selector", name, *map(str, args)])
+
+
+def _count(name: str, outcome: str):
+    with _stats_lock:
+        _stats[name][outcome] += 1
+
+
+def cached_selector(name: str, timeout: int = None, shared_only: bool = False):
+    """Caches the selector result under its positional arguments"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            if not is_enabled() or shared_only and not is_shared():
+                return func(*args)
+
+            cache = get_cache()
+            key = make_key(name, *args)
+            result = cache.get(key)
+            if result is not None:
+                _count(name, 'hits')
+                return None if result == _NONE else result
+
+            _count(name, 'misses')
+            result = func(*args)
+            cache.set(
+                key, _NONE if result is None else result,
+                CACHE_TIMEOUT if timeout is None else timeout
+            )
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate(name: str, *args):
+    if is_enabled():
+        get_cache().delete(make_key(name, *args))
+
+
+def _now_version() -> int:
+    # milliseconds, so a version evicted and created again is still newer
+    # than the entries made under the old one
+    return int(time.time() * 1000)
+
+
+def has_versions() -> bool:
+    return is_enabled() and is_shared()
+
+
+def get_version(name: str, *args) -> Optional[int]:
+    """Current version of a group, None without a shared cache"""
+    if not has_versions():
+        return None
+
+    cache = get_cache()
+    key = make_key('version', name, *args)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _now_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(name: str, *args):
+    if has_versions():
+        cache = get_cache()
+        key = make_key('version', name, *args)
+        cache.set(key, max(_now_version(), (cache.get(key) or 0) + 1), None)
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    with _stats_lock:
+        return {name: dict(counts) for name, counts in _stats.items()}
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
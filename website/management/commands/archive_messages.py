@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from website.services.archive import (
+    ARCHIVE_BATCH_SIZE, archive_messages, get_retention
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves nickname messages older than MESSAGE_RETENTION_DAYS into "
+        "the archive table in batches. Safe to interrupt and run again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int,
+                            help="Overrides MESSAGE_RETENTION_DAYS.")
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE,
+                            help="Rows moved per transaction.")
+
+    def handle(self, *args, **options):
+        retention = get_retention()
+        if options['days'] is not None:
+            retention = timedelta(days=options['days'])
+        if retention is None:
+            raise CommandError(
+                "MESSAGE_RETENTION_DAYS is not set, pass --days to archive anyway."
+            )
+
+        archived = archive_messages(retention, batch_size=options['batch_size'])
+        self.stdout.write(f"Archived {archived} message(s).")
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from website.services.stats import BACKFILL_CHUNK_SIZE, backfill
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the usage rollups of the stats page from the nickname "
+        "messages in the database, a chunk of ids at a time. Archived "
+        "messages are not in the database and drop out of the rollups."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=BACKFILL_CHUNK_SIZE,
+                            help="Message ids aggregated per transaction.")
+
+    def handle(self, *args, **options):
+        counted = backfill(chunk_size=options['chunk_size'])
+        self.stdout.write(f"Counted {counted} message(s).")
@@ -0,0 +1,85 @@
+import os
+import resource
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.utils import timezone
+
+from website.models import UsernameMessage
+from website.testing import test_database
+
+
+def current_rss() -> int:
+    """Resident set size of the process in bytes"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        # not Linux, the peak is the best there is
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills a throwaway test database with nickname messages and streams "
+        "them through the staff-wide export, reporting throughput and the "
+        "resident memory before and during the export."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10_000_000)
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--formats', default='ndjson,csv')
+        parser.add_argument('--batch-size', type=int, default=10_000,
+                            help="Rows inserted per query while filling.")
+
+    def handle(self, *args, **options):
+        with test_database():
+            self.fill(options['rows'], options['users'], options['batch_size'])
+
+            staff = User.objects.create(username='staff', is_staff=True)
+            client = Client()
+            client.force_login(staff)
+            for export_format in options['formats'].split(','):
+                self.export(client, export_format)
+
+    def fill(self, rows, users, batch_size):
+        started = time.perf_counter()
+        discord_users = [
+            User.objects.create(username=str(1000 + i)).discord_user
+            for i in range(users)
+        ]
+        sent = timezone.now()
+        for start in range(0, rows, batch_size):
+            UsernameMessage.objects.bulk_create([
+                UsernameMessage(
+                    discord_user=discord_users[i % users], text=f'nickname {i}',
+                    sent=sent
+                )
+                for i in range(start, min(start + batch_size, rows))
+            ])
+        self.stdout.write(
+            f"Filled {rows} rows in {time.perf_counter() - started:.1f} s"
+        )
+
+    def export(self, client, export_format):
+        rss_before = peak_rss = current_rss()
+        started = time.perf_counter()
+        response = client.get('/export/messages/all/', {'format': export_format})
+        size = lines = 0
+        for chunk in response.streaming_content:
+            size += len(chunk)
+            lines += chunk.count(b"\n")
+            peak_rss = max(peak_rss, current_rss())
+        response.close()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{export_format:7} {lines} lines  {size / 2 ** 20:8.1f} MB  "
+            f"{elapsed:6.1f} s  {lines / elapsed:9.0f} rows/s  "
+            f"RSS {rss_before / 2 ** 20:.1f} MB before, "
+            f"peak {peak_rss / 2 ** 20:.1f} MB "
+            f"(+{(peak_rss - rss_before) / 2 ** 20:.1f} MB)"
+        )
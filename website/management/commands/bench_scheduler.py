@@ -0,0 +1,74 @@
+import random
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from website.services.scheduler import TimerScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the dynamic username scheduler overhead: scheduling the "
+        "rotations and popping/rescheduling them over simulated ticks, "
+        "without database or Discord calls."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rotations', type=int, default=10000)
+        parser.add_argument('--ticks', type=int, default=600,
+                            help="Simulated one-second ticks.")
+        parser.add_argument('--min-interval', type=int, default=60)
+        parser.add_argument('--max-interval', type=int, default=3600)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rotations = options['rotations']
+        rng = random.Random(0)
+        intervals = [
+            rng.randint(options['min_interval'], options['max_interval'])
+            for _ in range(rotations)
+        ]
+
+        first_runs = [rng.uniform(0, interval) for interval in intervals]
+
+        tracemalloc.start()
+        scheduler = self.build(first_runs)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del scheduler
+
+        started = time.perf_counter()
+        scheduler = self.build(first_runs)
+        schedule_time = time.perf_counter() - started
+
+        fired = 0
+        tick_times = []
+        for now in range(options['ticks']):
+            started = time.perf_counter()
+            due = scheduler.pop_due(now, options['batch_size'])
+            for rotation in due:
+                scheduler.schedule(rotation, now + intervals[rotation])
+            tick_times.append(time.perf_counter() - started)
+            fired += len(due)
+
+        per_10k = 10000 / rotations
+        tick_total = sum(tick_times)
+        self.stdout.write(
+            f"rotations: {rotations}, ticks: {options['ticks']}, fired: {fired}\n"
+            f"initial schedule: {schedule_time * 1000:.1f} ms "
+            f"({schedule_time * per_10k * 1000:.1f} ms per 10k)\n"
+            f"heap memory: {memory / 1024:.0f} KiB "
+            f"({memory * per_10k / 1024:.0f} KiB per 10k)\n"
+            f"avg tick: {tick_total / len(tick_times) * 1e6:.1f} us "
+            f"({tick_total / len(tick_times) * per_10k * 1e6:.1f} us per 10k), "
+            f"max tick: {max(tick_times) * 1e6:.1f} us\n"
+            f"per fired rotation: {tick_total / max(fired, 1) * 1e6:.2f} us"
+        )
+
+    @staticmethod
+    def build(first_runs) -> TimerScheduler:
+        scheduler = TimerScheduler()
+        for rotation, when in enumerate(first_runs):
+            scheduler.schedule(rotation, when)
+        return scheduler
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from website.services.discord_api import AsyncDiscordApi, DiscordApi
+from website.testing import FakeDiscordServer, percentile
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares how many username changes per second the WSGI path "
+        "(a fixed number of blocking workers) and the ASGI path (one event "
+        "loop) push through a Discord stand-in with the given latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--latency', type=float, default=0.1,
+                            help="Simulated Discord latency, seconds.")
+        parser.add_argument('--workers', type=int, default=3,
+                            help="Sync gunicorn workers of the WSGI path.")
+        parser.add_argument('--concurrency', type=int, default=200,
+                            help="In-flight calls of the ASGI worker.")
+
+    def handle(self, *args, **options):
+        with FakeDiscordServer(latency=options['latency']) as discord:
+            discord.add_user('token', '1', 'nickname')
+
+            self.report('wsgi', self.run_sync(discord, options))
+            self.report('asgi', asyncio.run(self.run_async(discord, options)))
+
+    def run_sync(self, discord, options):
+        workers = options['workers']
+        api = DiscordApi('id', 'secret', api_url=discord.api_url,
+                         pool_size=workers)
+
+        def call(i):
+            start = time.perf_counter()
+            api.change_username('token', f'name {i}')
+            return time.perf_counter() - start
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            latencies = list(pool.map(call, range(options['requests'])))
+        api.close()
+        return latencies, time.perf_counter() - started
+
+    async def run_async(self, discord, options):
+        concurrency = options['concurrency']
+        api = AsyncDiscordApi('id', 'secret', api_url=discord.api_url,
+                              pool_size=concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(i):
+            async with semaphore:
+                start = time.perf_counter()
+                await api.change_username('token', f'name {i}')
+                return time.perf_counter() - start
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(
+            *(call(i) for i in range(options['requests']))
+        )
+        elapsed = time.perf_counter() - started
+        await api.close()
+        return latencies, elapsed
+
+    def report(self, name, result):
+        latencies, elapsed = result
+        latencies = sorted(latencies)
+        self.stdout.write(
+            f"{name}: {len(latencies) / elapsed:8.1f} req/s  "
+            f"p50 {percentile(latencies, 50) * 1000:7.1f} ms  "
+            f"p95 {percentile(latencies, 95) * 1000:7.1f} ms  "
+            f"total {elapsed:.2f} s"
+        )
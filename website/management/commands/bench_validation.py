@@ -0,0 +1,60 @@
+import random
+import string
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+
+from website.validators import nickname_error, validate_nickname
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures how fast nickname candidates are validated, both with "
+        "nickname_error() and with the raising validate_nickname()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--names', type=int, default=1_000_000)
+        parser.add_argument('--invalid-share', type=float, default=0.3,
+                            help="Share of candidates breaking a rule.")
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        names = self.generate(options['names'], options['invalid_share'],
+                              random.Random(options['seed']))
+
+        started = time.perf_counter()
+        invalid = sum(nickname_error(name) is not None for name in names)
+        self.report('nickname_error', len(names), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for name in names:
+            try:
+                validate_nickname(name)
+            except ValidationError:
+                pass
+        self.report('validate_nickname', len(names), time.perf_counter() - started)
+
+        self.stdout.write(f"{invalid} of {len(names)} candidates rejected")
+
+    @staticmethod
+    def generate(count, invalid_share, rng):
+        alphabet = string.ascii_letters + string.digits + " _-.абвгдеёжз"
+        broken = ["@", "#", ":", "`", "everyone", "HERE", "ＤｉｓｃｏｒｄＴａｇ"]
+        names = []
+        for _ in range(count):
+            name = "".join(rng.choices(alphabet, k=rng.randint(2, 32)))
+            if rng.random() < invalid_share:
+                if rng.random() < 0.5:
+                    name = name[:20] + rng.choice(broken)
+                else:
+                    name = rng.choice(["x", "x" * 40])
+            names.append(name)
+        return names
+
+    def report(self, name, count, elapsed):
+        self.stdout.write(
+            f"{name:18} {count / elapsed:12.0f} names/s  "
+            f"{elapsed / count * 1e9:8.0f} ns/name  total {elapsed:.2f} s"
+        )
@@ -0,0 +1,212 @@
+import json
+import threading
+import time
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from website.models import DiscordToken
+from website.services import discord
+from website.services.discord_api import DiscordApi, _api_options
+from website.testing import FakeDiscordServer, percentile, test_database
+
+
+VIEWS = ('discord_auth', 'change_username', 'index')
+
+
+class Command(BaseCommand):
+    help = (
+        "Drives the discord_auth, change_username and index views at a fixed "
+        "concurrency against a Discord stand-in and a throwaway test "
+        "database, and reports throughput, latency percentiles and queries "
+        "per request. Results can be saved with --output and checked "
+        "against a previous run with --compare."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200,
+                            help="Requests per view.")
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--views', default=",".join(VIEWS),
+                            help="Comma separated, any of: " + ", ".join(VIEWS))
+        parser.add_argument('--latency', type=float, default=0.05,
+                            help="Simulated Discord latency, seconds.")
+        parser.add_argument('--error-rate', type=float, default=0.0,
+                            help="Share of Discord calls answered with 500.")
+        parser.add_argument('--rate-limit', default=None,
+                            help="Discord rate limit as REQUESTS/SECONDS, "
+                                 "e.g. 2/1, applied per route and token.")
+        parser.add_argument('--output', default=None,
+                            help="Write the results to this JSON file.")
+        parser.add_argument('--compare', default=None,
+                            help="JSON results of a previous run.")
+        parser.add_argument('--threshold', type=float, default=0.1,
+                            help="Allowed relative regression for --compare.")
+
+    def handle(self, *args, **options):
+        views = [view for view in options['views'].split(",") if view]
+        unknown = set(views) - set(VIEWS)
+        if unknown:
+            raise CommandError(f"Unknown views: {', '.join(sorted(unknown))}")
+
+        rate_limit = None
+        if options['rate_limit']:
+            requests, seconds = options['rate_limit'].split("/")
+            rate_limit = (int(requests), float(seconds))
+
+        fake = FakeDiscordServer(
+            latency=options['latency'], rate_limit=rate_limit,
+            error_rate=options['error_rate']
+        )
+        with fake, test_database():
+            api = DiscordApi('id', 'secret', **dict(
+                _api_options(), api_url=fake.api_url,
+                pool_size=options['concurrency']
+            ))
+            with mock.patch.object(discord, 'get_api', return_value=api):
+                users = self.create_users(fake, options['concurrency'])
+                results = {
+                    view: self.run_view(view, users, options)
+                    for view in views
+                }
+            api.close()
+
+        for view, result in results.items():
+            self.report(view, result)
+
+        document = {
+            'created': timezone.now().isoformat(),
+            'options': {
+                name: options[name] for name in (
+                    'requests', 'concurrency', 'latency', 'error_rate',
+                    'rate_limit'
+                )
+            },
+            'views': results
+        }
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(document, output, indent=2)
+
+        if options['compare']:
+            with open(options['compare']) as baseline:
+                self.compare(json.load(baseline), document, options['threshold'])
+
+    def create_users(self, fake, count):
+        """A Discord user with its own token for every client thread"""
+        users = []
+        for i in range(count):
+            discord_id = str(1000 + i)
+            user = User.objects.create(username=discord_id)
+            user.discord_user.token = DiscordToken.objects.create(
+                access_token=f'token-{i}', token_type='Bearer',
+                expires_in=timedelta(days=7), refresh_token=f'refresh-{i}',
+                scope='identify', redirect_uri='http://testserver/discord/auth'
+            )
+            user.discord_user.save()
+            fake.add_user(f'token-{i}', discord_id, f'user {i}')
+            users.append(user)
+
+        # returning users log in, every exchanged code belongs to the first
+        fake.oauth_user = fake.users['token-0']
+        return users
+
+    def request(self, view, client, i):
+        if view == 'discord_auth':
+            return client.get('/discord/auth/', {'code': f'code-{i}'})
+        if view == 'change_username':
+            return client.post('/api/username-chat/', {'username': f'name {i}'})
+        return client.get('/')
+
+    @staticmethod
+    def is_error(response) -> bool:
+        if response.status_code >= 400:
+            return True
+        if response.get('Content-Type') == 'application/json':
+            return response.json().get('status') == 'error'
+        return False
+
+    def run_view(self, view, users, options):
+        requests = iter(range(options['requests']))
+        lock = threading.Lock()
+        samples = []
+
+        def worker(user):
+            client = Client()
+            if view != 'discord_auth':
+                client.force_login(user)
+            try:
+                while True:
+                    with lock:
+                        i = next(requests, None)
+                    if i is None:
+                        return
+
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        response = self.request(view, client, i)
+                        elapsed = time.perf_counter() - start
+                    samples.append(
+                        (elapsed, len(queries.captured_queries), self.is_error(response))
+                    )
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(user,)) for user in users]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(sample[0] for sample in samples)
+        return {
+            'requests': len(samples),
+            'errors': sum(sample[2] for sample in samples),
+            'throughput': len(samples) / elapsed,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p95_ms': percentile(latencies, 95) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'queries_per_request': sum(sample[1] for sample in samples) / len(samples)
+        }
+
+    def report(self, view, result):
+        self.stdout.write(
+            f"{view:16} {result['throughput']:8.1f} req/s  "
+            f"p50 {result['p50_ms']:7.1f} ms  "
+            f"p95 {result['p95_ms']:7.1f} ms  "
+            f"p99 {result['p99_ms']:7.1f} ms  "
+            f"{result['queries_per_request']:5.1f} queries/req  "
+            f"{result['errors']} errors"
+        )
+
+    def compare(self, baseline, current, threshold):
+        regressions = []
+        for view, result in current['views'].items():
+            old = baseline['views'].get(view)
+            if old is None:
+                continue
+
+            # (metric, higher is better)
+            for metric, higher_is_better in (('throughput', True), ('p95_ms', False),
+                                             ('queries_per_request', False)):
+                change = (result[metric] - old[metric]) / (old[metric] or 1)
+                regressed = -change > threshold if higher_is_better else change > threshold
+                self.stdout.write(
+                    f"{view:16} {metric:20} {old[metric]:9.1f} -> "
+                    f"{result[metric]:9.1f} ({change:+.1%})"
+                    + ("  REGRESSION" if regressed else "")
+                )
+                if regressed:
+                    regressions.append(f"{view} {metric}")
+
+        if regressions:
+            raise CommandError("Performance regressed: " + ", ".join(regressions))
@@ -0,0 +1,145 @@
+import os
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from website import assets
+
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+STATIC_DIR = os.path.join(APP_DIR, 'static')
+TEMPLATES_DIR = os.path.join(APP_DIR, 'templates')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+
+BOOTSTRAP_CSS = 'css/bootstrap/bootstrap.css'
+STYLESHEETS = ('css/styles.css',)
+# already minified, taken as is
+VENDOR_SCRIPTS = ('js/jquery-3.5.1.min.js', 'js/bootstrap/bootstrap.bundle.min.js')
+SCRIPTS = ('js/main.js', 'js/api.js')
+FONT = 'fonts/UniSansHeavy.ttf'
+FONT_UNICODES = (
+    list(range(0x20, 0x7f))        # Basic Latin
+    + list(range(0xa0, 0x100))     # Latin-1
+    + list(range(0x400, 0x460))    # Cyrillic
+    + list(range(0x2010, 0x2027))  # dashes, quotes, ellipsis
+)
+
+# what base.html used to load, popper came from a CDN on top of it
+PREVIOUS_PAGE = (
+    'css/bootstrap/bootstrap.min.css', 'css/styles.css', FONT,
+    'js/jquery-3.5.1.min.js', 'js/bootstrap/bootstrap.min.js',
+    'js/main.js', 'js/api.js'
+)
+PAGE = ('dist/site.css', 'dist/fonts/UniSansHeavy.woff2', 'dist/app.js')
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds static/dist: Bootstrap purged of unused rules with styles.css "
+        "in site.css, the header font subset to woff2 and the scripts bundled "
+        "in app.js. Prints the page weight before and after."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--collect', action='store_true',
+                            help="Run collectstatic afterwards to write the "
+                                 "hashed and compressed files.")
+
+    def handle(self, *args, **options):
+        os.makedirs(os.path.join(DIST_DIR, 'fonts'), exist_ok=True)
+        templates = self.read_templates()
+        scripts = [self.read(name) for name in SCRIPTS]
+
+        font_url = self.build_font("".join(templates + scripts))
+        self.build_css(templates + scripts, font_url)
+        self.build_js(scripts)
+
+        page = PAGE if font_url else (PAGE[0], FONT, PAGE[2])
+        self.report(PREVIOUS_PAGE, page)
+        if options['collect']:
+            call_command('collectstatic', interactive=False, verbosity=0)
+            self.stdout.write(f"Collected to {settings.STATIC_ROOT}")
+
+    def build_font(self, text):
+        name = os.path.splitext(os.path.basename(FONT))[0] + '.woff2'
+        try:
+            assets.subset_font(
+                os.path.join(STATIC_DIR, FONT),
+                os.path.join(DIST_DIR, 'fonts', name), text, FONT_UNICODES
+            )
+        except ImportError:
+            self.stderr.write(
+                "fontTools and brotli are needed to subset the font, "
+                "site.css keeps the full one"
+            )
+            return None
+        return f'fonts/{name}'
+
+    def build_css(self, sources, font_url):
+        names = assets.collect_names(sources)
+        css = [assets.minify_css(assets.purge_css(self.read(BOOTSTRAP_CSS), names))]
+        for name in STYLESHEETS:
+            # dist/ is one level deeper than css/, ../ keeps pointing to static/
+            stylesheet = self.read(name)
+            if font_url:
+                stylesheet = stylesheet.replace(
+                    f'url("../{FONT}") format("opentype")',
+                    f'url("{font_url}") format("woff2"), '
+                    f'url("../{FONT}") format("truetype")'
+                )
+            css.append(assets.minify_css(stylesheet))
+        self.write('site.css', "\n".join(css))
+
+    def build_js(self, scripts):
+        bundle = [assets.strip_source_map(self.read(name)) for name in VENDOR_SCRIPTS]
+        bundle += [assets.minify_js(script) for script in scripts]
+        self.write('app.js', ";\n".join(bundle) + "\n")
+
+    def report(self, before, after):
+        totals = []
+        for title, names in (("before", before), ("after", after)):
+            total = [0, 0, 0]
+            for name in names:
+                with open(os.path.join(STATIC_DIR, name), 'rb') as file:
+                    sizes = assets.compressed_sizes(file.read())
+                self.stdout.write(f"  {name:40} " + self.format_sizes(sizes))
+                total = [
+                    (t + s) if s is not None else None for t, s in zip(total, sizes)
+                ]
+            self.stdout.write(f"{title:42} " + self.format_sizes(total))
+            totals.append(total)
+
+        (raw, gz, br), (new_raw, new_gz, new_br) = totals
+        self.stdout.write(
+            f"Page weight: {raw / 1024:.1f} KB -> {new_raw / 1024:.1f} KB raw, "
+            f"{gz / 1024:.1f} KB -> {new_gz / 1024:.1f} KB gzip"
+            + (f", {br / 1024:.1f} KB -> {new_br / 1024:.1f} KB brotli"
+               if br is not None else "")
+        )
+
+    @staticmethod
+    def format_sizes(sizes):
+        return "  ".join(
+            f"{label} {size / 1024:7.1f} KB" if size is not None else f"{label}       -"
+            for label, size in zip(("raw", "gzip", "br"), sizes)
+        )
+
+    @staticmethod
+    def read_templates():
+        templates = []
+        for root, _, files in os.walk(TEMPLATES_DIR):
+            for name in files:
+                with open(os.path.join(root, name), encoding='utf-8') as file:
+                    templates.append(file.read())
+        return templates
+
+    @staticmethod
+    def read(name):
+        with open(os.path.join(STATIC_DIR, name), encoding='utf-8') as file:
+            return file.read()
+
+    @staticmethod
+    def write(name, content):
+        with open(os.path.join(DIST_DIR, name), 'w', encoding='utf-8') as file:
+            file.write(content)
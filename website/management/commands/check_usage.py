@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from website.services.stats import check_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks the usage rollups of the stats page against each other and "
+        "against the nickname messages. Fails if they disagree, "
+        "`manage.py backfill_usage` rebuilds them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', type=parse_date, default=None,
+                            help="First day to compare with the messages, "
+                                 "YYYY-MM-DD. Defaults to the first day "
+                                 "fully in the database.")
+
+    def handle(self, *args, **options):
+        problems = check_rollups(options['since'])
+        for problem in problems:
+            self.stderr.write(problem)
+        if problems:
+            raise CommandError(f"{len(problems)} disagreement(s) found.")
+        self.stdout.write("The rollups agree with the messages.")
@@ -0,0 +1,47 @@
+import time
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from website.services import idempotency
+from website.services.ratelimit import RateLimiter
+from website.services.tokens import delete_orphaned_tokens, refresh_expiring_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Refreshes Discord tokens shortly before they expire, so requests "
+        "do not wait for an OAuth round-trip, and deletes orphaned expired "
+        "tokens, finished rate limit buckets and expired idempotency keys."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--leeway', type=int, default=900,
+                            help="Refresh tokens expiring within this many seconds.")
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--workers', type=int, default=4,
+                            help="Concurrent refreshes per batch.")
+        parser.add_argument('--loop', type=int, default=0,
+                            help="Repeat every N seconds instead of exiting.")
+
+    def handle(self, *args, **options):
+        while True:
+            refreshed, failed = refresh_expiring_tokens(
+                timedelta(seconds=options['leeway']),
+                batch_size=options['batch_size'],
+                workers=options['workers']
+            )
+            deleted = delete_orphaned_tokens()
+            purged = RateLimiter.purge()
+            expired_keys = idempotency.purge()
+            self.stdout.write(
+                f"Refreshed {refreshed} token(s), {failed} failed, "
+                f"deleted {deleted} orphaned token(s), "
+                f"purged {purged} rate limit bucket(s) "
+                f"and {expired_keys} idempotency key(s)."
+            )
+
+            if not options['loop']:
+                return
+            time.sleep(options['loop'])
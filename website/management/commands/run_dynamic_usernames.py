@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from website.services.dynamic_username import DynamicUsernameRunner
+
+
+class Command(BaseCommand):
+    help = "Applies dynamic username rotations when they are due."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help="Due rotations applied per tick.")
+        parser.add_argument('--workers', type=int, default=4,
+                            help="Concurrent Discord calls per tick.")
+        parser.add_argument('--sync-interval', type=float, default=5.0,
+                            help="Seconds between reloads of changed rotations.")
+        parser.add_argument('--once', action='store_true',
+                            help="Apply the due rotations and exit.")
+
+    def handle(self, *args, **options):
+        runner = DynamicUsernameRunner(
+            batch_size=options['batch_size'], workers=options['workers']
+        )
+        loaded = runner.sync()
+        self.stdout.write(f"Loaded {loaded} rotation(s).")
+        synced = time.monotonic()
+
+        try:
+            while True:
+                applied = runner.tick()
+                if applied:
+                    self.stdout.write(f"Applied {applied} rotation(s).")
+
+                if options['once']:
+                    return
+
+                if time.monotonic() - synced >= options['sync_interval']:
+                    runner.sync()
+                    synced = time.monotonic()
+
+                # a full batch means more rotations are probably due
+                if applied < options['batch_size']:
+                    time.sleep(runner.seconds_to_next_run(options['sync_interval']))
+        finally:
+            runner.close()
@@ -0,0 +1,39 @@
+import time
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from website.services.jobs import claim_jobs, requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "Applies queued username changes. Run as many processes as needed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10)
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help="Seconds to sleep when the queue is empty.")
+        parser.add_argument('--stale-after', type=int, default=300,
+                            help="Seconds after which a running job of a "
+                                 "dead worker is queued again.")
+        parser.add_argument('--once', action='store_true',
+                            help="Process the due jobs and exit.")
+
+    def handle(self, *args, **options):
+        stale_after = timedelta(seconds=options['stale_after'])
+
+        while True:
+            requeued = requeue_stale_jobs(stale_after)
+            if requeued:
+                self.stdout.write(f"Requeued {requeued} stale job(s).")
+
+            jobs = claim_jobs(options['batch_size'])
+            for job in jobs:
+                run_job(job)
+                self.stdout.write(f"Job {job.pk}: {job.status}")
+
+            if options['once']:
+                return
+            if not jobs:
+                time.sleep(options['poll_interval'])
@@ -0,0 +1,89 @@
+"""Prometheus metrics of the website, served by website.views.metrics.
+
+Every gunicorn worker keeps its own samples. To sum them up across the
+workers prometheus_client runs in multiprocess mode: the
+`prometheus_multiproc_dir` environment variable points to a directory
+the workers write their samples to, gunicorn.conf.py sets it up and
+cleans up after dead workers. Without it the samples of the current
+process are served.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess
+)
+
+
+MULTIPROC_DIR_ENV = 'prometheus_multiproc_dir'
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, float('inf'))
+
+REQUESTS = Counter(
+    'website_requests_total', "Handled requests.",
+    ['view', 'method', 'status']
+)
+REQUEST_LATENCY = Histogram(
+    'website_request_duration_seconds', "Request handling time.", ['view']
+)
+REQUEST_QUERIES = Histogram(
+    'website_request_db_queries', "Database queries per request.", ['view'],
+    buckets=QUERY_BUCKETS
+)
+REQUEST_QUERY_TIME = Histogram(
+    'website_request_db_duration_seconds', "Database time per request.",
+    ['view']
+)
+DISCORD_CALL_LATENCY = Histogram(
+    'website_discord_call_duration_seconds',
+    "Discord API call time by endpoint and response status.",
+    ['endpoint', 'status']
+)
+
+DISCORD_BREAKER_STATE = Gauge(
+    'website_discord_breaker_state',
+    "Discord API circuit breaker: 0 closed, 1 half open, 2 open.",
+    # one sample per live worker, child_exit drops the dead ones
+    multiprocess_mode='liveall'
+)
+DISCORD_BREAKER_OPENED = Counter(
+    'website_discord_breaker_opened_total',
+    "Times the Discord API circuit breaker opened."
+)
+BREAKER_STATES = {'closed': 0, 'half_open': 1, 'open': 2}
+
+
+def observe_request(view: str, method: str, status: int, seconds: float,
+                    queries: int, query_seconds: float):
+    REQUESTS.labels(view, method, str(status)).inc()
+    REQUEST_LATENCY.labels(view).observe(seconds)
+    REQUEST_QUERIES.labels(view).observe(queries)
+    REQUEST_QUERY_TIME.labels(view).observe(query_seconds)
+
+
+def observe_discord_call(route: str, seconds: float, status: int = None):
+    # calls without a response are timeouts and connection errors
+    DISCORD_CALL_LATENCY \
+        .labels(route, str(status) if status is not None else 'error') \
+        .observe(seconds)
+
+
+def observe_breaker_state(state: str):
+    DISCORD_BREAKER_STATE.set(BREAKER_STATES[state])
+    if state == 'open':
+        DISCORD_BREAKER_OPENED.inc()
+
+
+def get_registry() -> CollectorRegistry:
+    if MULTIPROC_DIR_ENV not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render() -> bytes:
+    return generate_latest(get_registry())
+
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.db import connection
+
+from website import metrics
+
+
+class QueryTimer:
+    """connection.execute_wrapper() counting queries and their time"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """Records latency and database usage of every request per URL name.
+
+    Goes first in MIDDLEWARE so the time of the other middleware counts:
+
+        MIDDLEWARE = ['website.middleware.MetricsMiddleware', ...]
+
+    Only queries made in the request thread are seen, so async views
+    report the queries they do not hand over to sync_to_async.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # the way MiddlewareMixin stays async in an async chain
+        if asyncio.iscoroutinefunction(self.get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        queries = QueryTimer()
+        start = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        self._observe(request, response, time.perf_counter() - start, queries)
+        return response
+
+    async def __acall__(self, request):
+        queries = QueryTimer()
+        start = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = await self.get_response(request)
+        self._observe(request, response, time.perf_counter() - start, queries)
+        return response
+
+    @staticmethod
+    def _observe(request, response, seconds: float, queries: QueryTimer):
+        match = request.resolver_match
+        metrics.observe_request(
+            match.view_name if match is not None else '<unresolved>',
+            request.method, response.status_code, seconds,
+            queries.count, queries.seconds
+        )
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware for website.auth.CachedUserBackend.
+
+    Sessions started before the backend was set up name ModelBackend,
+    which is not configured any more. They are moved to the new backend
+    instead of being signed out.
+    """
+    MODEL_BACKEND = 'django.contrib.auth.backends.ModelBackend'
+    CACHED_BACKEND = 'website.auth.CachedUserBackend'
+
+    def process_request(self, request):
+        session = request.session
+        if session.get(BACKEND_SESSION_KEY) == self.MODEL_BACKEND \
+                and self.MODEL_BACKEND not in settings.AUTHENTICATION_BACKENDS \
+                and self.CACHED_BACKEND in settings.AUTHENTICATION_BACKENDS:
+            session[BACKEND_SESSION_KEY] = self.CACHED_BACKEND
+        super().process_request(request)
+
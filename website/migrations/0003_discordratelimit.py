@@ -0,0 +1,24 @@
+# Generated by Django 3.1.14 on 2026-10-18 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0002_usernamemessage_sent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscordRateLimit',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=128, unique=True)),
+                ('bucket', models.CharField(blank=True, max_length=64)),
+                ('limit', models.PositiveIntegerField(default=1)),
+                ('remaining', models.IntegerField(default=0)),
+                ('reset_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.1.14 on 2026-10-18 16:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0003_discordratelimit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsernameChangeJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.CharField(max_length=32)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('error', models.TextField(blank=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('discord_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='username_jobs', to='website.discorduser')),
+                ('message', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job', to='website.usernamemessage')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='usernamechangejob',
+            index=models.Index(fields=['status', 'run_after'], name='website_use_status_ed9aaf_idx'),
+        ),
+    ]
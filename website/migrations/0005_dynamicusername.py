@@ -0,0 +1,28 @@
+# Generated by Django 3.1.14 on 2026-10-18 17:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0004_usernamechangejob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DynamicUsername',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('usernames', models.TextField()),
+                ('interval', models.DurationField()),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+                ('next_run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated', models.DateTimeField(auto_now=True, db_index=True)),
+                ('discord_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='dynamic_username', to='website.discorduser')),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.1.14 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+def fill_expires_at(apps, schema_editor):
+    DiscordToken = apps.get_model('website', 'DiscordToken')
+    DiscordToken.objects.update(
+        expires_at=models.F('last_time_updated') + models.F('expires_in')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0005_dynamicusername'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discordtoken',
+            name='expires_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(fill_expires_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='discordtoken',
+            name='expires_at',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0006_discordtoken_expires_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usernamemessage',
+            index=models.Index(fields=['discord_user', '-sent', '-id'], name='website_use_discord_47817f_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.1.14 on 2026-10-18 20:05
+
+from django.db import migrations, models
+import website.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0007_usernamemessage_history_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usernamemessage',
+            name='text',
+            field=models.CharField(max_length=32, validators=[website.validators.validate_nickname]),
+        ),
+    ]
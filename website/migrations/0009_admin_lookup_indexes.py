@@ -0,0 +1,22 @@
+# Generated by Django 3.1.14 on 2026-10-18 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0008_usernamemessage_text_validators'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='discorduser',
+            name='discord_user_id',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='usernamemessage',
+            index=models.Index(fields=['sent'], name='website_use_sent_d40ba5_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.1.14 on 2026-10-19 00:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0009_admin_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyUsage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('messages', models.PositiveIntegerField(default=0)),
+                ('users', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='NicknameUsage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.CharField(max_length=32, unique=True)),
+                ('uses', models.PositiveIntegerField(db_index=True, default=0)),
+                ('last_used', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserDailyUsage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(db_index=True)),
+                ('messages', models.PositiveIntegerField(default=0)),
+                ('discord_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_usage', to='website.discorduser')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='userdailyusage',
+            constraint=models.UniqueConstraint(fields=('discord_user', 'date'), name='unique_user_daily_usage'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.1.14 on 2026-10-19 02:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0011_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedMessage',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('text', models.CharField(max_length=32)),
+                ('sent', models.DateTimeField()),
+                ('discord_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_messages', to='website.discorduser')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedmessage',
+            index=models.Index(fields=['discord_user', '-sent', '-id'], name='website_arc_discord_cf50e2_idx'),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.utils import timezone
 from django.contrib.auth.models import User
@@ -6,6 +6,8 @@ from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from website.validators import validate_nickname
+
 
 class DiscordToken(models.Model):
     """Discord's user token for authentication"""
@@ -13,18 +15,32 @@ class DiscordToken(models.Model):
     token_type = models.CharField(max_length=20)
     last_time_updated = models.DateTimeField(auto_now=True)
     expires_in = models.DurationField()
+    # stored so the sweeper can find expiring tokens with an index scan
+    expires_at = models.DateTimeField(db_index=True)
     refresh_token = models.CharField(max_length=128)
     scope = models.CharField(max_length=20)
     redirect_uri = models.TextField()
 
+    def set_expiry(self, expires_in: timedelta):
+        self.expires_in = expires_in
+        self.expires_at = timezone.now() + expires_in
+
+    def save(self, *args, **kwargs):
+        if self.expires_at is None:
+            self.set_expiry(self.expires_in)
+        super().save(*args, **kwargs)
+
     @property
     def valid_till(self):
-        return self.last_time_updated + self.expires_in
+        return self.expires_at
     
     @property
     def is_expired(self) -> bool:
         return self.valid_till < timezone.now()
 
+    def expires_within(self, leeway: timedelta) -> bool:
+        return self.valid_till < timezone.now() + leeway
+
     def __str__(self) -> str:
         return f"{self.access_token} \
         ({self.last_time_updated} - {self.valid_till})"
@@ -44,7 +60,10 @@ class DiscordUser(models.Model):
         null=True, blank=True
     )
     username = models.CharField(max_length=32, null=True, blank=True)
-    discord_user_id = models.CharField(max_length=64, null=True, blank=True)
+    # sign in, the selectors and the admin search look users up by it
+    discord_user_id = models.CharField(
+        max_length=64, null=True, blank=True, db_index=True
+    )
     avatar = models.CharField(max_length=512, null=True, blank=True)
 
     @property
@@ -69,27 +88,191 @@ class UsernameMessage(models.Model):
         on_delete=models.CASCADE,
         related_name='messages'
     )
-    text = models.CharField(max_length=32)
+    text = models.CharField(max_length=32, validators=[validate_nickname])
     sent = models.DateTimeField(auto_now_add=True)
 
-    def clean_fields(self, exclude=None):
-        super().clean_fields(exclude)
+    class Meta:
+        indexes = [
+            # history is read newest first, pk breaks ties between equal dates
+            models.Index(fields=['discord_user', '-sent', '-id']),
+            # the admin date hierarchy and the retention cutoff
+            models.Index(fields=['sent']),
+        ]
+
+    def __str__(self) -> str:
+        return f"({self.sent}) {self.text} by {self.discord_user}"
+
+
+class ArchivedMessage(models.Model):
+    """UsernameMessage moved out of the history table, see
+    website.services.archive"""
+    # the id the message had, history cursors keep working across the move
+    id = models.IntegerField(primary_key=True)
+    discord_user = models.ForeignKey(
+        DiscordUser,
+        on_delete=models.CASCADE,
+        related_name='archived_messages'
+    )
+    text = models.CharField(max_length=32)
+    sent = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['discord_user', '-sent', '-id']),
+        ]
+
+    def __str__(self) -> str:
+        return f"({self.sent}) {self.text} by {self.discord_user} (archived)"
 
-        restricted_words = {
-            "everyone", "here", "discordtag", "@", "#", ":", "`"
-        }
 
-        if not (2 <= len(self.text) <= 32):
-            raise ValidationError(
-                "Длинна никнейма должна быть от 2х до 32х симовлов."
-            )
+class DiscordRateLimit(models.Model):
+    """Discord rate limit bucket state shared by all worker processes"""
+    key = models.CharField(max_length=128, unique=True)
+    bucket = models.CharField(max_length=64, blank=True)
+    limit = models.PositiveIntegerField(default=1)
+    remaining = models.IntegerField(default=0)
+    reset_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.key}: {self.remaining}/{self.limit} till {self.reset_at}"
+
+
+class UsernameChangeJob(models.Model):
+    """Username change queued by the API and applied by a worker process"""
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    )
+
+    discord_user = models.ForeignKey(
+        DiscordUser,
+        on_delete=models.CASCADE,
+        related_name='username_jobs'
+    )
+    text = models.CharField(max_length=32)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=QUEUED
+    )
+    message = models.OneToOneField(
+        UsernameMessage,
+        on_delete=models.SET_NULL,
+        related_name='job',
+        null=True, blank=True
+    )
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+        ]
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.DONE, self.FAILED)
 
+    def __str__(self) -> str:
+        return f"({self.status}) {self.text} by {self.discord_user_id}"
+
+
+class DynamicUsername(models.Model):
+    """Rotation of nicknames applied one by one every @interval"""
+    discord_user = models.OneToOneField(
+        DiscordUser,
+        on_delete=models.CASCADE,
+        related_name='dynamic_username'
+    )
+    # one nickname per line
+    usernames = models.TextField()
+    interval = models.DurationField()
+    position = models.PositiveIntegerField(default=0)
+    is_active = models.BooleanField(default=True)
+    next_run_at = models.DateTimeField(default=timezone.now)
+    # the scheduler only reloads rotations changed by users since last sync
+    updated = models.DateTimeField(auto_now=True, db_index=True)
+
+    @property
+    def username_list(self) -> list:
+        return self.usernames.splitlines()
+
+    @property
+    def current_username(self) -> str:
+        usernames = self.username_list
+        return usernames[self.position % len(usernames)]
+
+    def __str__(self) -> str:
+        return f"{self.discord_user}: {len(self.username_list)} every {self.interval}"
+
+
+class DailyUsage(models.Model):
+    """Nickname changes and active users of a day, kept by website.services.stats"""
+    date = models.DateField(unique=True)
+    messages = models.PositiveIntegerField(default=0)
+    users = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.date}: {self.messages} by {self.users}"
+
+
+class UserDailyUsage(models.Model):
+    """Nickname changes of a user in a day, a row means the user was active"""
+    discord_user = models.ForeignKey(
+        DiscordUser,
+        on_delete=models.CASCADE,
+        related_name='daily_usage'
+    )
+    date = models.DateField(db_index=True)
+    messages = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['discord_user', 'date'], name='unique_user_daily_usage'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.date}: {self.messages} by {self.discord_user_id}"
+
+
+class NicknameUsage(models.Model):
+    """How many times a nickname was set, by anyone"""
+    text = models.CharField(max_length=32, unique=True)
+    uses = models.PositiveIntegerField(default=0, db_index=True)
+    last_used = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.text}: {self.uses}"
+
+
+class IdempotencyKey(models.Model):
+    """Response of an API call made with an Idempotency-Key header"""
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys'
+    )
+    key = models.CharField(max_length=255)
+    # the key may be used again only with the same arguments
+    request_hash = models.CharField(max_length=64)
+    # None while the first request with the key runs
+    response = models.JSONField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
 
-        if any(word in str(self.text).lower() for word in restricted_words):
-            raise ValidationError(
-                "Никнейм не должен содержать следующие символы: '" + 
-                "', '".join(restricted_words) + "'."
-            )
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='unique_idempotency_key'),
+        ]
 
     def __str__(self) -> str:
-        return f"({self.sent}) {self.text} by {self.discord_user}"
\ No newline at end of file
+        return f"{self.key} by {self.user_id} till {self.expires_at}"
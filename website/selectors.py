@@ -1,7 +1,28 @@
-from typing import Iterable
-from website.models import DiscordUser, DiscordToken, UsernameMessage
+import binascii
 
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.template.defaultfilters import date as format_date
+from django.utils import timezone
+
+from website import cache
+from website.models import (
+    DailyUsage, DiscordUser, DiscordToken, NicknameUsage, UserDailyUsage,
+    UsernameChangeJob, UsernameMessage
+)
+from website.services.archive import get_archived_messages
+
+
+# how many of the last messages of a user are kept in the cache
+CACHED_MESSAGES_COUNT = 10
+
+
+@cache.cached_selector('discord_user')
 def get_discord_user(discord_user_id: str) -> DiscordUser:
     try:
         return DiscordUser.objects.get(discord_user_id=discord_user_id)
@@ -9,17 +30,214 @@ def get_discord_user(discord_user_id: str) -> DiscordUser:
         return None
 
 
+# a stale copy would keep a deactivated user signed in on other workers
+@cache.cached_selector('session_user', shared_only=True)
+def get_session_user(user_pk: int) -> Optional[User]:
+    """The user with its DiscordUser, see website.auth"""
+    return User.objects \
+        .select_related('discord_user') \
+        .filter(pk=user_pk) \
+        .first()
+
+
+# tokens are refreshed by other workers too, keep them for a short time only
+@cache.cached_selector('user_token', timeout=30)
 def get_user_token(discord_user_id: str) -> DiscordToken:
     try:
         return DiscordToken.objects \
             .select_related('discord_user') \
             .get(discord_user__discord_user_id=discord_user_id)
-    except DiscordUser.DoesNotExist:
+    except DiscordToken.DoesNotExist:
         return None
 
 
-def get_username_messages(discord_user_id: str, count: int) -> Iterable[UsernameMessage]:
-    return UsernameMessage.objects \
-        .order_by('-sent') \
-        .select_related('discord_user') \
-        .filter(discord_user__discord_user_id=discord_user_id)[:count]
+def _query_username_messages(discord_user_pk: int, count: int,
+                             before: Tuple[datetime, int] = None) -> List[UsernameMessage]:
+    # served by the (discord_user, -sent, -id) index, no OFFSET and no join
+    messages = UsernameMessage.objects \
+        .filter(discord_user_id=discord_user_pk) \
+        .order_by('-sent', '-id')
+    if before is not None:
+        sent, pk = before
+        messages = messages.filter(Q(sent__lt=sent) | Q(sent=sent, id__lt=pk))
+    return list(messages[:count])
+
+
+# jobs, runners and other workers store messages too
+@cache.cached_selector('username_messages', shared_only=True)
+def _get_last_username_messages(discord_user_pk: int) -> List[UsernameMessage]:
+    return _query_username_messages(discord_user_pk, CACHED_MESSAGES_COUNT)
+
+
+def get_username_messages(discord_user: DiscordUser, count: int) -> List[UsernameMessage]:
+    if discord_user is None:
+        return []
+    if count <= CACHED_MESSAGES_COUNT:
+        return _get_last_username_messages(discord_user.pk)[:count]
+    return _query_username_messages(discord_user.pk, count)
+
+
+def encode_message_cursor(message: UsernameMessage) -> str:
+    value = f"{message.sent.isoformat()}|{message.pk}"
+    return urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_message_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Raises ValueError if @cursor was not made by encode_message_cursor"""
+    try:
+        sent, pk = urlsafe_b64decode(cursor.encode()).decode().split("|")
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError(f"Bad cursor: {cursor}")
+    return datetime.fromisoformat(sent), int(pk)
+
+
+def next_message_cursor(messages: List[UsernameMessage], count: int) -> Optional[str]:
+    """Cursor of the page after @messages, None if it was the last one"""
+    if len(messages) < count:
+        return None
+    return encode_message_cursor(messages[-1])
+
+
+def get_username_messages_page(discord_user: DiscordUser, count: int,
+                               cursor: str = None,
+                               archive: bool = False) -> Tuple[List[UsernameMessage], Optional[str]]:
+    """Returns @count messages older than @cursor and the next page cursor.
+    With @archive the history goes on with the archived messages once the
+    database has no more."""
+    before = decode_message_cursor(cursor) if cursor else None
+    if discord_user is None:
+        return [], None
+
+    # one extra row tells if there is a next page
+    messages = _query_username_messages(discord_user.pk, count + 1, before)
+    if archive and len(messages) <= count:
+        messages += get_archived_messages(
+            discord_user.pk, count + 1 - len(messages),
+            (messages[-1].sent, messages[-1].pk) if messages else before
+        )
+    page = messages[:count]
+    next_cursor = encode_message_cursor(page[-1]) if len(messages) > count else None
+    return page, next_cursor
+
+
+# the stats are read from the rollups of website.services.stats and may be
+# a minute late
+@cache.cached_selector('daily_usage', timeout=60)
+def get_daily_usage(days: int) -> List[DailyUsage]:
+    """Usage of the last @days days, newest first, days without any are
+    left out"""
+    since = timezone.localdate() - timedelta(days=days - 1)
+    return list(DailyUsage.objects.filter(date__gte=since).order_by('-date'))
+
+
+@cache.cached_selector('top_nicknames', timeout=60)
+def get_top_nicknames(count: int) -> List[NicknameUsage]:
+    return list(NicknameUsage.objects.order_by('-uses', 'text')[:count])
+
+
+@cache.cached_selector('active_users', timeout=60)
+def get_active_users(days: int) -> int:
+    since = timezone.localdate() - timedelta(days=days - 1)
+    return UserDailyUsage.objects \
+        .filter(date__gte=since) \
+        .values('discord_user_id') \
+        .distinct() \
+        .count()
+
+
+EXPORT_FIELDS = ('id', 'discord_user_id', 'text', 'sent')
+
+
+def iter_username_messages(discord_user_pk: int = None, since: datetime = None,
+                           until: datetime = None,
+                           chunk_size: int = 2000) -> Iterator[tuple]:
+    """Rows of EXPORT_FIELDS in id order, all users if @discord_user_pk is
+    None. Rows are fetched @chunk_size at a time and no model instances are
+    made, memory use does not depend on the number of rows."""
+    messages = UsernameMessage.objects.order_by('pk')
+    if discord_user_pk is not None:
+        messages = messages.filter(discord_user_id=discord_user_pk)
+    if since is not None:
+        messages = messages.filter(sent__gte=since)
+    if until is not None:
+        messages = messages.filter(sent__lt=until)
+    return messages \
+        .values_list('pk', 'discord_user__discord_user_id', 'text', 'sent') \
+        .iterator(chunk_size=chunk_size)
+
+
+def get_username_job(discord_user_id: str, job_id: int) -> UsernameChangeJob:
+    try:
+        return UsernameChangeJob.objects.get(
+            pk=job_id, discord_user__discord_user_id=discord_user_id
+        )
+    except UsernameChangeJob.DoesNotExist:
+        return None
+
+
+def get_feed_cursor(discord_user_pk: int) -> str:
+    """Cursor of the live feed pointing at the current state"""
+    last_message_id = UsernameMessage.objects \
+        .filter(discord_user_id=discord_user_pk) \
+        .order_by('-id') \
+        .values_list('id', flat=True) \
+        .first()
+    return encode_feed_cursor(last_message_id or 0, timezone.now())
+
+
+def encode_feed_cursor(message_id: int, jobs_since: datetime) -> str:
+    return f"{message_id}:{jobs_since.timestamp():.6f}"
+
+
+def decode_feed_cursor(cursor: str) -> Tuple[int, datetime]:
+    """Raises ValueError if @cursor was not made by encode_feed_cursor"""
+    message_id, jobs_since = cursor.split(":")
+    return int(message_id), datetime.fromtimestamp(
+        float(jobs_since), timezone.utc if settings.USE_TZ else None
+    )
+
+
+def get_feed_events(discord_user_pk: int, cursor: str) -> Tuple[List[Dict], str]:
+    """New messages and job updates of a user since @cursor.
+
+    Two indexed queries, cheap enough to be repeated every second by
+    every open tab. Returns the events and the cursor to continue from.
+    """
+    message_id, jobs_since = decode_feed_cursor(cursor)
+
+    messages = list(
+        UsernameMessage.objects
+            .filter(discord_user_id=discord_user_pk, id__gt=message_id)
+            .order_by('id')
+    )
+    jobs = list(
+        UsernameChangeJob.objects
+            .filter(discord_user_id=discord_user_pk, updated__gt=jobs_since)
+            .order_by('updated')
+    )
+
+    events = [
+        {
+            'type': 'message',
+            'id': message.pk,
+            'text': message.text,
+            'sent': format_date(message.sent, settings.DATETIME_FORMAT)
+        }
+        for message in messages
+    ] + [
+        {
+            'type': 'job',
+            'job': job.pk,
+            'status': job.status,
+            'text': job.text,
+            'error': job.error,
+            'date': format_date(job.updated, settings.DATETIME_FORMAT)
+        }
+        for job in jobs
+    ]
+
+    if messages:
+        message_id = messages[-1].pk
+    if jobs:
+        jobs_since = jobs[-1].updated
+    return events, encode_feed_cursor(message_id, jobs_since)
@@ -10,3 +10,10 @@ class ServiceError(Exception):
 
     def __str__(self):
         return f"\n{self.text}:\n{self.details}\n"
+
+
+class ServiceRetryError(ServiceError):
+    """Temporary failure, the operation may be retried in @retry_after seconds"""
+    def __init__(self, text, details="", retry_after: float = 0):
+        self.retry_after = retry_after
+        super().__init__(text, details)
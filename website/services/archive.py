@@ -0,0 +1,105 @@
+"""Retention of UsernameMessage rows.
+
+Messages older than MESSAGE_RETENTION_DAYS are moved out of the history
+table into ArchivedMessage, which keeps the ids and is indexed the same
+way, so the history reads on into the archive with one more query. Each
+batch is copied and deleted in one transaction: an interrupted run loses
+nothing and the next one carries on.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from website import cache
+from website.models import ArchivedMessage, DiscordUser, UsernameChangeJob, UsernameMessage
+
+
+ARCHIVE_BATCH_SIZE = 1000
+
+
+def get_retention() -> Optional[timedelta]:
+    """None keeps the messages forever"""
+    days = getattr(settings, 'MESSAGE_RETENTION_DAYS', None)
+    return timedelta(days=days) if days is not None else None
+
+
+def _copy_messages(messages: List[UsernameMessage]):
+    ArchivedMessage.objects.bulk_create([
+        ArchivedMessage(
+            id=message.pk, discord_user_id=message.discord_user_id,
+            text=message.text, sent=message.sent
+        )
+        for message in messages
+    ])
+
+
+def _delete_messages(messages: List[UsernameMessage]):
+    """Runs in the transaction of the batch"""
+    pks = [message.pk for message in messages]
+    # the raw DELETE skips on_delete, SET_NULL of the jobs is done by hand
+    UsernameChangeJob.objects.filter(message_id__in=pks).update(message=None)
+    # QuerySet.delete() would load every row for the post_delete receivers,
+    # the caches are dropped once per batch instead
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(UsernameMessage._meta.db_table)}"
+            f" WHERE id IN ({', '.join(['%s'] * len(pks))})",
+            pks
+        )
+
+
+def _invalidate(messages: List[UsernameMessage]):
+    discord_user_pks = {message.discord_user_id for message in messages}
+    owners = DiscordUser.objects \
+        .filter(pk__in=discord_user_pks) \
+        .values_list('pk', 'user_id')
+    for discord_user_pk, user_pk in owners:
+        cache.invalidate('username_messages', discord_user_pk)
+        cache.bump_version('page', user_pk)
+
+
+def archive_messages(older_than: timedelta,
+                     batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Moves the messages sent more than @older_than ago to the archive.
+    Returns the number of archived messages."""
+    cutoff = timezone.now() - older_than
+    archived = 0
+    while True:
+        # ids grow with `sent`, so the oldest rows come first in pk order
+        messages = list(
+            UsernameMessage.objects
+                .filter(sent__lt=cutoff)
+                .order_by('pk')[:batch_size]
+        )
+        if not messages:
+            return archived
+
+        with transaction.atomic():
+            _copy_messages(messages)
+            _delete_messages(messages)
+
+        _invalidate(messages)
+        archived += len(messages)
+
+
+def get_archived_messages(discord_user_pk: int, count: int,
+                          before: Tuple[datetime, int] = None) -> List[UsernameMessage]:
+    """Up to @count archived messages of a user older than @before, newest
+    first"""
+    archived = ArchivedMessage.objects \
+        .filter(discord_user_id=discord_user_pk) \
+        .order_by('-sent', '-id')
+    if before is not None:
+        sent, pk = before
+        archived = archived.filter(Q(sent__lt=sent) | Q(sent=sent, id__lt=pk))
+    return [
+        UsernameMessage(
+            id=message.pk, discord_user_id=discord_user_pk,
+            text=message.text, sent=message.sent
+        )
+        for message in archived[:count]
+    ]
@@ -1,122 +1,357 @@
+import asyncio
+import math
+import threading
+import weakref
 from datetime import timedelta
+from functools import wraps
+from typing import Optional
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
+from django.db import close_old_connections, transaction
 
-from website.services import ServiceError
-from website.services.discord_api import API, DiscordApiError, DiscordTokenType
+from website import cache
+from website.services import ServiceError, ServiceRetryError
+from website.services.discord_api import (
+    CircuitOpen, DiscordApiError, DiscordRateLimited, DiscordTokenType,
+    DiscordUnavailable, DiscordUserType, get_api, get_async_api
+)
 from website.models import DiscordToken, DiscordUser, UsernameMessage
+from website.validators import nickname_error, normalize_nickname
 
 
 def get_auth_url(redirect_uri: str) -> str:
-    return API.get_auth_url(redirect_uri)
+    return get_api().get_auth_url(redirect_uri)
 
 
-def create_token(code: str, redirect_uri: str) -> DiscordToken:
+# a profile Discord returned the same as last time is not written again
+PROFILE_CACHE_TIMEOUT = getattr(settings, 'DISCORD_PROFILE_CACHE_TIMEOUT', 60 * 60)
+
+
+def _profile_key(discord_user_id: str) -> str:
+    return cache.make_key('discord_profile', discord_user_id)
+
+
+def cache_profile(user: DiscordUserType):
+    if cache.is_enabled():
+        cache.get_cache().set(
+            _profile_key(user.id), tuple(user), PROFILE_CACHE_TIMEOUT
+        )
+
+
+def get_cached_profile(discord_user_id: str) -> Optional[DiscordUserType]:
+    if not cache.is_enabled():
+        return None
+    profile = cache.get_cache().get(_profile_key(discord_user_id))
+    return DiscordUserType(*profile) if profile is not None else None
+
+
+def _refresh_profile(user: DiscordUserType) -> bool:
+    """Caches @user, returns False if the cached profile was the same.
+    A private cache does not see the changes other workers stored, so
+    only a shared one is trusted."""
+    changed = not cache.is_shared() or get_cached_profile(user.id) != user
+    cache_profile(user)
+    return changed
+
+
+def _token_error(e: DiscordApiError) -> ServiceError:
+    if isinstance(e, CircuitOpen):
+        return ServiceRetryError(
+            "Discord временно недоступен.",
+            f"Повторите попытку через {math.ceil(e.retry_after)} сек.",
+            retry_after=e.retry_after
+        )
+    return ServiceError("Ошибка получения токена.", str(e))
+
+
+def _profile_error(e: DiscordApiError) -> ServiceError:
+    if isinstance(e, CircuitOpen):
+        return _token_error(e)
+    return ServiceError(
+        "Ошибка получения информации о владельце токена.", str(e)
+    )
+
+
+def sign_in(code: str, redirect_uri: str) -> User:
+    """Exchanges OAuth @code and stores the token and the Discord profile.
+
+    Both Discord round-trips are made before anything is written, then
+    the rows are stored in one transaction with targeted writes only.
+    The owner of the token is always asked from Discord, the sign in
+    fails while Discord is unavailable.
+    """
     try:
-        token: DiscordTokenType = API.get_access_token(code, redirect_uri)
+        token: DiscordTokenType = get_api().get_access_token(code, redirect_uri)
     except DiscordApiError as e:
-        raise ServiceError("Ошибка получения токена.", str(e))
-
-    token_object, created = DiscordToken.objects.get_or_create(
-        access_token=token.access_token,
-        defaults={
-            'token_type': token.token_type,
-            'expires_in': timedelta(seconds=int(token.expires_in)),
-            'refresh_token': token.refresh_token,
-            'scope': token.scope,
-            'redirect_uri': redirect_uri
-        }
-    )
+        raise _token_error(e)
 
-    return token_object
+    try:
+        user: DiscordUserType = get_api().get_user(token.access_token)
+    except DiscordApiError as e:
+        raise _profile_error(e)
 
+    return _save_sign_in(token, redirect_uri, user, _refresh_profile(user))
 
-def refresh_token(token: DiscordToken):
-    """Modifies @token if everything is going ok, returns NO_ERROR"""
-    # do not perform this operation if token is not expired
-    if not token.is_expired:
-        return
 
+async def asign_in(code: str, redirect_uri: str) -> User:
     try:
-        new_token: DiscordTokenType = API.refresh_token(
-            token.refresh_token,
-            token.redirect_uri
+        token: DiscordTokenType = await get_async_api().get_access_token(
+            code, redirect_uri
         )
+    except DiscordApiError as e:
+        raise _token_error(e)
 
-        token.access_token = new_token.access_token
-        token.refresh_token = new_token.refresh_token
-        token.expires_in = timedelta(seconds=int(new_token.expires_in))
-        token.save()
+    try:
+        user: DiscordUserType = await get_async_api().get_user(token.access_token)
     except DiscordApiError as e:
-        raise ServiceError("Ошибка обновления токена.", str(e))
+        raise _profile_error(e)
 
+    profile_changed = await sync_to_async(_refresh_profile)(user)
+    return await sync_to_async(_save_sign_in)(
+        token, redirect_uri, user, profile_changed
+    )
 
-def unexpired_token_required(func):
-    def wrapper(*args, **kwargs):
-        token = args[0]
 
-        if not (isinstance(token, DiscordToken)):
-            raise ServiceError(
-                "Неверный тип токена.",
-                f"Попытка воспользоваться токеном с типом {type(token)}."
+def _save_sign_in(token: DiscordTokenType, redirect_uri: str,
+                  user: DiscordUserType, profile_changed: bool = True) -> User:
+    profile = {'username': user.username, 'avatar': user.avatar}
+
+    with transaction.atomic():
+        # every exchanged code gets a new access token, nothing to look up
+        token_object = DiscordToken.objects.create(
+            access_token=token.access_token,
+            token_type=token.token_type,
+            expires_in=timedelta(seconds=int(token.expires_in)),
+            refresh_token=token.refresh_token,
+            scope=token.scope,
+            redirect_uri=redirect_uri
+        )
+
+        user_object = User.objects.filter(username=user.id).first()
+        if user_object is None:
+            user_object = User(username=user.id)
+            # picked up by the create_discord_user receiver
+            user_object.discord_profile = dict(profile, token=token_object)
+            user_object.save()
+            return user_object
+
+        # the replaced token is left orphaned, `manage.py refresh_tokens`
+        # removes it once it expires
+        updated = DiscordUser.objects \
+            .filter(user_id=user_object.pk) \
+            .update(token=token_object, discord_user_id=user.id,
+                    **(profile if profile_changed else {}))
+        if not updated:
+            DiscordUser.objects.create(
+                user=user_object, discord_user_id=user.id,
+                token=token_object, **profile
             )
 
-        if token.is_expired:
+    # update() bypasses the post_save receivers
+    cache.invalidate('discord_user', user.id)
+    cache.invalidate('user_token', user.id)
+    cache.invalidate('session_user', user_object.pk)
+    cache.bump_version('page', user_object.pk)
+    return user_object
+
+
+class _RefreshLock:
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+# token pk -> lock, entries go away once no thread waits for them
+_refresh_locks = weakref.WeakValueDictionary()
+_refresh_locks_guard = threading.Lock()
+
+
+def _get_refresh_lock(token_pk: int) -> _RefreshLock:
+    with _refresh_locks_guard:
+        refresh_lock = _refresh_locks.get(token_pk)
+        if refresh_lock is None:
+            refresh_lock = _refresh_locks[token_pk] = _RefreshLock()
+        return refresh_lock
+
+
+def refresh_token(token: DiscordToken, leeway: timedelta = timedelta(0)):
+    """Modifies @token if everything is going ok, returns NO_ERROR
+
+    Concurrent callers for the same token are coalesced: threads of this
+    process wait on a per-token lock, other processes on the row lock,
+    and whoever comes second reuses the already refreshed token instead
+    of spending its (now used) refresh token again.
+    """
+    # do not perform this operation if token does not expire within @leeway
+    if not token.expires_within(leeway):
+        return
+
+    refresh_lock = _get_refresh_lock(token.pk)
+    with refresh_lock.lock, transaction.atomic():
+        try:
+            current = DiscordToken.objects.select_for_update().get(pk=token.pk)
+        except DiscordToken.DoesNotExist:
             raise ServiceError(
-                "Срок использования токена истек.",
-                "Попытка воспользоваться токеном с истекшим сроком давности."
+                "Ошибка обновления токена.", "Токен удален из базы."
             )
 
-        return func(*args, **kwargs)
-    return wrapper
+        if current.expires_within(leeway):
+            try:
+                new_token: DiscordTokenType = get_api().refresh_token(
+                    current.refresh_token,
+                    current.redirect_uri
+                )
+            except DiscordApiError as e:
+                raise ServiceError("Ошибка обновления токена.", str(e))
 
+            _update_token(current, new_token)
 
-@unexpired_token_required
-def create_user(token: DiscordToken) -> DiscordUser:
+    _copy_token(current, token)
+
+
+async def arefresh_token(token: DiscordToken, leeway: timedelta = timedelta(0)):
+    if not token.expires_within(leeway):
+        return
+
+    # the refresh holds a row lock for the OAuth round-trip, so it runs
+    # in its own thread instead of blocking the shared database thread
+    await sync_to_async(_refresh_in_thread, thread_sensitive=False)(token, leeway)
+
+
+def _refresh_in_thread(token: DiscordToken, leeway: timedelta):
     try:
-        user: DiscordUserType = API.get_user(token.access_token)
-    except DiscordApiError as e:
+        refresh_token(token, leeway)
+    finally:
+        close_old_connections()
+
+
+def _update_token(token: DiscordToken, new_token: DiscordTokenType):
+    token.access_token = new_token.access_token
+    token.refresh_token = new_token.refresh_token
+    token.set_expiry(timedelta(seconds=int(new_token.expires_in)))
+    token.save()
+
+
+def _copy_token(source: DiscordToken, token: DiscordToken):
+    for field in ('access_token', 'refresh_token', 'expires_in',
+                  'expires_at', 'last_time_updated'):
+        setattr(token, field, getattr(source, field))
+
+
+def _check_token(token):
+    if not (isinstance(token, DiscordToken)):
         raise ServiceError(
-            "Ошибка получения информации о владельце токена.", str(e)
+            "Неверный тип токена.",
+            f"Попытка воспользоваться токеном с типом {type(token)}."
         )
 
-    try:
-        user_object = User.objects.get(username=user.id)
-    except User.DoesNotExist:
-        user_object = User(username=user.id)
-        user_object.save()
-        user_object.discord_user.token = token
-
-    # remove old token if it has been updated
-    old_token = user_object.discord_user.token
-    if old_token.is_expired:
-        old_token.delete()
-    
-    user_object.discord_user.token = token
-    user_object.discord_user.username = user.username
-    user_object.discord_user.avatar = user.avatar
-    user_object.save()
+    if token.is_expired:
+        raise ServiceError(
+            "Срок использования токена истек.",
+            "Попытка воспользоваться токеном с истекшим сроком давности."
+        )
 
-    return user_object
 
+def unexpired_token_required(func):
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            _check_token(args[0])
+            return await func(*args, **kwargs)
+        return async_wrapper
 
-@unexpired_token_required
-def create_username_message(token: DiscordToken, username: str) -> UsernameMessage:
-    username_message = UsernameMessage(
-        discord_user=token.discord_user, text=username
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        _check_token(args[0])
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _rate_limit_error(e: DiscordRateLimited) -> ServiceRetryError:
+    return ServiceRetryError(
+        "Слишком много запросов к Discord.",
+        f"Повторите попытку через {math.ceil(e.retry_after)} сек.",
+        retry_after=e.retry_after
     )
 
-    try:
-        username_message.full_clean()
-    except ValidationError as e:
-        raise ServiceError(
-            "Ошибка форматирования никнейма", ",".join(e)
-        )
+
+def _change_error(e: DiscordApiError) -> ServiceError:
+    if isinstance(e, CircuitOpen):
+        return _token_error(e)
+    if isinstance(e, DiscordUnavailable):
+        # 5xx or no answer, the same change may succeed later
+        return ServiceRetryError("Discord временно недоступен.", str(e))
+    return ServiceError("Ошибка изменения никнейма.", str(e))
+
+
+def build_username_message(token: DiscordToken, username: str) -> UsernameMessage:
+    # full_clean() would also query the database for the foreign key
+    error = nickname_error(username)
+    if error is not None:
+        raise ServiceError("Ошибка форматирования никнейма", error)
+
+    # the normalized nickname is the one stored and sent to Discord
+    return UsernameMessage(
+        discord_user=token.discord_user, text=normalize_nickname(username)
+    )
+
+
+def is_current_username(discord_user: DiscordUser, username: str) -> bool:
+    # DiscordUser.username is what Discord answered at sign in or on the
+    # last change. The cached token may predate a change made by another
+    # worker, so the row is read again.
+    discord_user.refresh_from_db(fields=['username'])
+    return discord_user.username is not None \
+        and normalize_nickname(username) == discord_user.username
+
+
+def _store_current_username(discord_user: DiscordUser, username: str):
+    if discord_user.username != username:
+        discord_user.username = username
+        # the receivers drop the cached user and token
+        discord_user.save(update_fields=['username'])
+
+
+@unexpired_token_required
+def create_username_message(token: DiscordToken, username: str) -> Optional[UsernameMessage]:
+    """Returns None without calling Discord if @username is already set"""
+    username_message = build_username_message(token, username)
+    if is_current_username(token.discord_user, username):
+        return None
 
     try:
-        user: DiscordUserType = API.change_username(token.access_token, username)
+        user: DiscordUserType = get_api().change_username(
+            token.access_token, username_message.text
+        )
+        cache_profile(user)
+        _store_current_username(token.discord_user, user.username)
         username_message.save()
         return username_message
+    except DiscordRateLimited as e:
+        raise _rate_limit_error(e)
+    except DiscordApiError as e:
+        raise _change_error(e)
+
+
+@unexpired_token_required
+async def acreate_username_message(token: DiscordToken, username: str) -> Optional[UsernameMessage]:
+    username_message = await sync_to_async(build_username_message)(
+        token, username
+    )
+    if await sync_to_async(is_current_username)(token.discord_user, username):
+        return None
+
+    try:
+        user: DiscordUserType = await get_async_api().change_username(
+            token.access_token, username_message.text
+        )
+    except DiscordRateLimited as e:
+        raise _rate_limit_error(e)
     except DiscordApiError as e:
-        raise ServiceError("Ошибка изменения никнейма.", str(e))
+        raise _change_error(e)
+
+    await sync_to_async(cache_profile)(user)
+    await sync_to_async(_store_current_username)(token.discord_user, user.username)
+    await sync_to_async(username_message.save)()
+    return username_message
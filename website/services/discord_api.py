@@ -1,11 +1,28 @@
+"""Discord API clients.
+
+requests and httpx are imported when the first client is used, and the
+shared clients are built by get_api() and get_async_api() on first use:
+the gunicorn master (see gunicorn.conf.py) and the management commands
+that never call Discord do not pay for them, and no connection pool is
+created before the workers fork.
+"""
+import asyncio
+import threading
+import time
 import urllib.parse
-import requests
+import weakref
 
 from functools import lru_cache
 from collections import namedtuple
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from django.conf import settings
 
-from i_cant_chat.settings import CLIENT_ID, CLIENT_SECRET
+from website.services.ratelimit import RateLimited, RateLimiter
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
 
 
 DiscordUserType = namedtuple('DiscordUserType', ['id', 'username', 'avatar'])
@@ -23,101 +40,547 @@ class DiscordApiError(Exception):
         return f"({self.code}) {self.message}"
 
 
-class DiscordApi:
+class DiscordRateLimited(DiscordApiError):
+    def __init__(self, retry_after: float, is_global: bool = False,
+                 message="You are being rate limited."):
+        super().__init__(message, code=429)
+        self.retry_after = retry_after
+        self.is_global = is_global
+
+
+class DiscordUnavailable(DiscordApiError):
+    """Timeouts, connection errors and 5xx responses: Discord itself fails"""
+
+
+class CircuitOpen(DiscordUnavailable):
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Discord API is unavailable, calls are paused for {retry_after:.0f}s."
+        )
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Stops calling Discord after @threshold failures in a row.
+
+    While open every call fails fast with CircuitOpen instead of holding
+    a worker for the whole timeout. After @reset_timeout seconds one call
+    is let through: its success closes the breaker, its failure opens it
+    again. The state is kept per process.
+    """
+    CLOSED, HALF_OPEN, OPEN = 'closed', 'half_open', 'open'
+    # callables of (state), see add_state_listener
+    _state_listeners = []
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def add_state_listener(cls, listener):
+        """@listener(state) is called whenever a breaker changes its state"""
+        if listener not in cls._state_listeners:
+            cls._state_listeners.append(listener)
+
+    def _set_state(self, state: str):
+        # called with the lock held
+        if state != self.state:
+            self.state = state
+            for listener in self._state_listeners:
+                listener(state)
+
+    def before_call(self):
+        """Raises CircuitOpen if the call must not be made"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            now = time.monotonic()
+            retry_after = self._opened_at + self.reset_timeout - now
+            if retry_after <= 0:
+                # this call is the trial one, the others keep failing fast;
+                # a trial that never reported back is replaced after a while
+                self._opened_at = now
+                self._set_state(self.HALF_OPEN)
+                return
+            raise CircuitOpen(retry_after)
+
+    def record(self, status: Optional[int]):
+        """@status of the response, None if no response came back"""
+        with self._lock:
+            if status is not None and status < 500:
+                self._failures = 0
+                self._set_state(self.CLOSED)
+                return
+
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(self.OPEN)
+
+    def reset(self):
+        with self._lock:
+            self._failures = 0
+            self._set_state(self.CLOSED)
+
+
+class CallStats:
+    """Per-endpoint latency statistics, safe to update from many threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Dict[str, float]] = {}
+
+    def record(self, endpoint: str, seconds: float, status: Optional[int]):
+        with self._lock:
+            stats = self._calls.setdefault(endpoint, {
+                'count': 0, 'errors': 0, 'total': 0.0,
+                'min': seconds, 'max': seconds
+            })
+            stats['count'] += 1
+            stats['total'] += seconds
+            stats['min'] = min(stats['min'], seconds)
+            stats['max'] = max(stats['max'], seconds)
+            if status is None or status >= 400:
+                stats['errors'] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                endpoint: dict(stats, avg=stats['total'] / stats['count'])
+                for endpoint, stats in self._calls.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+
+
+class BaseDiscordApi:
+    """Endpoints, payloads and response parsing shared by both transports"""
     API_URL = 'https://discord.com/api/v6'
     USER_OAUTH2_URL = "/oauth2/authorize?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code&scope=identify%20email"
     TOKEN_URL = "/oauth2/token"
+    USER_URL = "/users/@me"
+    # needs no token, a cheap call to open a pooled connection with
+    GATEWAY_URL = "/gateway"
+    USER_AGENT = "ICantChatDiscordApi (i-cant-chat.herokuapp.com, 1)"
+    DEFAULT_HEADERS = {
+        "User-Agent": USER_AGENT,
+        # fractional X-RateLimit-Reset-After values
+        "X-RateLimit-Precision": "millisecond"
+    }
+    # callables of (route, seconds, status), see add_call_listener
+    _call_listeners = []
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self, client_id: str, client_secret: str,
+                 api_url: str = API_URL, pool_size: int = 10,
+                 timeout: Tuple[float, float] = (3.05, 10.0),
+                 rate_limiter: Optional[RateLimiter] = None,
+                 breaker: Optional[CircuitBreaker] = None):
         self._client_id = client_id
         self._client_secret = client_secret
-    
+        self._api_url = api_url.rstrip('/')
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker
+        self.stats = CallStats()
+
+    @classmethod
+    def add_call_listener(cls, listener):
+        """@listener(route, seconds, status) is called after every Discord
+        call of every instance, status is None if no response came back"""
+        if listener not in cls._call_listeners:
+            cls._call_listeners.append(listener)
+
+    def _record_call(self, route: str, seconds: float, status: Optional[int]):
+        self.stats.record(route, seconds, status)
+        if self.breaker is not None:
+            self.breaker.record(status)
+        for listener in self._call_listeners:
+            listener(route, seconds, status)
+
+    def _check_breaker(self):
+        if self.breaker is not None:
+            self.breaker.before_call()
+
+    @staticmethod
+    def raise_for_server_error(response):
+        if response.status_code >= 500:
+            raise DiscordUnavailable(
+                f"Discord API error: {response.status_code}", response.status_code
+            )
+
     @staticmethod
     @lru_cache(maxsize=32)
     def get_auth_headers(user_auth_token: str) -> Dict[str, str]:
         return {
-            "User-Agent": "ICantChatDiscordApi (i-cant-chat.herokuapp.com, 1)",
+            "User-Agent": BaseDiscordApi.USER_AGENT,
             "Authorization": f"Bearer {user_auth_token}"
         }
 
     @staticmethod
     def raise_response_error(response):
         if "message" in response:
-            raise DiscordApiError(**response)
+            raise DiscordApiError(
+                response["message"], response.get("code", -1)
+            )
         else:
             raise DiscordApiError(response)
 
     @staticmethod
-    def request_token(data) -> DiscordTokenType:
-        response = requests.post(
-            DiscordApi.API_URL + DiscordApi.TOKEN_URL,
-            data=data, headers={
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-        )
+    def raise_for_rate_limit(response):
+        if response.status_code != 429:
+            return
 
         try:
             json_response = response.json()
-            if response.ok:
-                return DiscordTokenType(**json_response)
-            DiscordApi.raise_response_error(json_response)
         except ValueError:
-            raise DiscordApiError(response.text)
+            json_response = {}
+        retry_after = json_response.get('retry_after') \
+            or response.headers.get('Retry-After') or 1
+        raise DiscordRateLimited(
+            float(retry_after),
+            is_global=bool(json_response.get('global'))
+        )
 
     def get_auth_url(self, redirect_uri: str) -> str:
-        return self.API_URL + self.USER_OAUTH2_URL.format(
+        return self._api_url + self.USER_OAUTH2_URL.format(
             client_id=self._client_id,
             redirect_uri=urllib.parse.quote(redirect_uri)
         )
 
-    def get_access_token(self, code: str, redirect_uri: str) -> DiscordTokenType:
-        return DiscordApi.request_token({
+    def _access_token_data(self, code: str, redirect_uri: str) -> Dict[str, str]:
+        return {
             'client_id': self._client_id,
             'client_secret': self._client_secret,
             'grant_type': 'authorization_code',
             'code': code,
             'redirect_uri': redirect_uri,
             'scope': 'identify email'
-        })
+        }
 
-    def refresh_token(self, refresh_token: str, redirect_uri: str) -> DiscordTokenType:
-        return DiscordApi.request_token({
+    def _refresh_token_data(self, refresh_token: str, redirect_uri: str) -> Dict[str, str]:
+        return {
             'client_id': self._client_id,
             'client_secret': self._client_secret,
             'grant_type': 'refresh_token',
             'refresh_token': refresh_token,
             'redirect_uri': redirect_uri,
             'scope': 'identify email'
-        })
+        }
+
+    def _process_token_response(self, response) -> DiscordTokenType:
+        BaseDiscordApi.raise_for_rate_limit(response)
+        try:
+            json_response = response.json()
+            if response.status_code < 400:
+                return DiscordTokenType(**json_response)
+            BaseDiscordApi.raise_response_error(json_response)
+        except ValueError:
+            raise DiscordApiError(response.text)
 
     def _process_user_response(self, response) -> DiscordUserType:
+        BaseDiscordApi.raise_for_rate_limit(response)
         try:
             json_response = response.json()
-            if response.ok:
+            if response.status_code < 400:
                 return DiscordUserType(
                     id=json_response['id'],
                     username=json_response['username'],
                     avatar=json_response['avatar']
                 )
-            DiscordApi.raise_response_error(json_response)
+            BaseDiscordApi.raise_response_error(json_response)
         except ValueError:
             raise DiscordApiError(response.text)
 
+
+class DiscordApi(BaseDiscordApi):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> 'requests.Session':
+        """One keep-alive connection pool shared by every thread of the worker"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> 'requests.Session':
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update(self.DEFAULT_HEADERS)
+        session.headers["Connection"] = "keep-alive"
+
+        # Discord calls are not idempotent (token exchange, PATCH), so
+        # failed requests are never retried silently. Threads beyond the
+        # pool size wait for a free connection instead of opening more.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self._pool_size,
+            pool_block=True,
+            max_retries=0
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _request(self, method: str, endpoint: str, token: str = None,
+                 **kwargs) -> 'requests.Response':
+        import requests
+
+        route = f"{method} {endpoint}"
+        self._check_breaker()
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.acquire(route, token)
+            except RateLimited as e:
+                raise DiscordRateLimited(e.retry_after)
+
+        status = None
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, self._api_url + endpoint,
+                timeout=self._timeout, **kwargs
+            )
+            status = response.status_code
+        except requests.Timeout as e:
+            raise DiscordUnavailable(f"Discord API timeout: {e}")
+        except requests.RequestException as e:
+            raise DiscordUnavailable(f"Discord API is unreachable: {e}")
+        finally:
+            self._record_call(route, time.perf_counter() - start, status)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(route, token, status, response.headers)
+        self.raise_for_server_error(response)
+        return response
+
+    def request_token(self, data) -> DiscordTokenType:
+        response = self._request(
+            'POST', self.TOKEN_URL,
+            data=data, headers={
+                'Content-Type': 'application/x-www-form-urlencoded'
+            }
+        )
+        return self._process_token_response(response)
+
+    def get_access_token(self, code: str, redirect_uri: str) -> DiscordTokenType:
+        return self.request_token(self._access_token_data(code, redirect_uri))
+
+    def refresh_token(self, refresh_token: str, redirect_uri: str) -> DiscordTokenType:
+        return self.request_token(
+            self._refresh_token_data(refresh_token, redirect_uri)
+        )
+
+    def warm_up(self):
+        """Opens a pooled connection to Discord ahead of the first request"""
+        self._request('GET', self.GATEWAY_URL)
+
     def get_user(self, user_auth_token: str) -> DiscordUserType:
-        current_user_api_url = self.API_URL + "/users/@me"
         auth_headers = DiscordApi.get_auth_headers(user_auth_token)
-        response = requests.get(current_user_api_url, headers=auth_headers)
+        response = self._request('GET', self.USER_URL,
+            token=user_auth_token, headers=auth_headers
+        )
         return self._process_user_response(response)
 
     def change_username(self, user_auth_token: str, username: str) -> DiscordUserType:
-        change_username_api_url = self.API_URL + "/users/@me"
         auth_headers = DiscordApi.get_auth_headers(user_auth_token)
-        print(auth_headers)
-        response = requests.patch(change_username_api_url, 
-            headers=auth_headers, data=f"{{'username': {username}}}"
+        response = self._request('PATCH', self.USER_URL,
+            token=user_auth_token, headers=auth_headers,
+            json={'username': username}
+        )
+        return self._process_user_response(response)
+
+
+class AsyncDiscordApi(BaseDiscordApi):
+    """asyncio flavour of DiscordApi, used by the async views under ASGI.
+
+    httpx clients are bound to the event loop they were created in, so
+    one pooled client is kept per running loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._clients = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> 'httpx.AsyncClient':
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self._create_client()
+        return client
+
+    def _create_client(self) -> 'httpx.AsyncClient':
+        import httpx
+
+        connect_timeout, read_timeout = self._timeout
+        return httpx.AsyncClient(
+            headers=self.DEFAULT_HEADERS,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self._pool_size,
+                max_keepalive_connections=self._pool_size
+            )
+        )
+
+    async def close(self):
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def _request(self, method: str, endpoint: str, token: str = None,
+                       **kwargs) -> 'httpx.Response':
+        import httpx
+
+        route = f"{method} {endpoint}"
+        self._check_breaker()
+        if self.rate_limiter is not None:
+            try:
+                await self.rate_limiter.aacquire(route, token)
+            except RateLimited as e:
+                raise DiscordRateLimited(e.retry_after)
+
+        status = None
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, self._api_url + endpoint, **kwargs
+            )
+            status = response.status_code
+        except httpx.TimeoutException as e:
+            raise DiscordUnavailable(f"Discord API timeout: {e!r}")
+        except httpx.HTTPError as e:
+            raise DiscordUnavailable(f"Discord API is unreachable: {e!r}")
+        finally:
+            self._record_call(route, time.perf_counter() - start, status)
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aupdate(
+                route, token, status, response.headers
+            )
+        self.raise_for_server_error(response)
+        return response
+
+    async def request_token(self, data) -> DiscordTokenType:
+        response = await self._request(
+            'POST', self.TOKEN_URL,
+            data=data, headers={
+                'Content-Type': 'application/x-www-form-urlencoded'
+            }
+        )
+        return self._process_token_response(response)
+
+    async def get_access_token(self, code: str, redirect_uri: str) -> DiscordTokenType:
+        return await self.request_token(
+            self._access_token_data(code, redirect_uri)
+        )
+
+    async def refresh_token(self, refresh_token: str, redirect_uri: str) -> DiscordTokenType:
+        return await self.request_token(
+            self._refresh_token_data(refresh_token, redirect_uri)
+        )
+
+    async def get_user(self, user_auth_token: str) -> DiscordUserType:
+        auth_headers = AsyncDiscordApi.get_auth_headers(user_auth_token)
+        response = await self._request('GET', self.USER_URL,
+            token=user_auth_token, headers=auth_headers
+        )
+        return self._process_user_response(response)
+
+    async def change_username(self, user_auth_token: str, username: str) -> DiscordUserType:
+        auth_headers = AsyncDiscordApi.get_auth_headers(user_auth_token)
+        response = await self._request('PATCH', self.USER_URL,
+            token=user_auth_token, headers=auth_headers,
+            json={'username': username}
         )
-        print(response.text)
         return self._process_user_response(response)
 
 
-API = DiscordApi(CLIENT_ID, CLIENT_SECRET)
+_lock = threading.Lock()
+_breaker = None
+_api = None
+_async_api = None
+
+
+def get_breaker() -> Optional[CircuitBreaker]:
+    """Both transports talk to the same Discord, one failing opens it for
+    both"""
+    global _breaker
+    with _lock:
+        if _breaker is None and getattr(settings, 'DISCORD_BREAKER_ENABLED', True):
+            _breaker = CircuitBreaker(
+                threshold=getattr(settings, 'DISCORD_BREAKER_THRESHOLD', 5),
+                reset_timeout=getattr(settings, 'DISCORD_BREAKER_RESET_TIMEOUT', 30.0)
+            )
+        return _breaker
+
+
+def _api_options() -> dict:
+    rate_limiter = None
+    if getattr(settings, 'DISCORD_RATELIMIT_ENABLED', True):
+        rate_limiter = RateLimiter(
+            max_wait=getattr(settings, 'DISCORD_RATELIMIT_MAX_WAIT', 2.0)
+        )
+
+    return {
+        'rate_limiter': rate_limiter,
+        'breaker': get_breaker(),
+        'api_url': getattr(settings, 'DISCORD_API_URL', BaseDiscordApi.API_URL),
+        'pool_size': getattr(settings, 'DISCORD_API_POOL_SIZE', 10),
+        'timeout': (
+            getattr(settings, 'DISCORD_API_CONNECT_TIMEOUT', 3.05),
+            getattr(settings, 'DISCORD_API_READ_TIMEOUT', 10.0)
+        )
+    }
+
+
+def get_api() -> DiscordApi:
+    """The client shared by the threads of the process"""
+    global _api
+    if _api is None:
+        options = _api_options()
+        with _lock:
+            if _api is None:
+                _api = DiscordApi(settings.CLIENT_ID, settings.CLIENT_SECRET, **options)
+    return _api
+
+
+def get_async_api() -> AsyncDiscordApi:
+    """The client shared by the event loops of the process"""
+    global _async_api
+    if _async_api is None:
+        options = _api_options()
+        with _lock:
+            if _async_api is None:
+                _async_api = AsyncDiscordApi(
+                    settings.CLIENT_ID, settings.CLIENT_SECRET, **options
+                )
+    return _async_api
+
+
+def __getattr__(name):
+    # API and ASYNC_API used to be built on import
+    if name == 'API':
+        return get_api()
+    if name == 'ASYNC_API':
+        return get_async_api()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
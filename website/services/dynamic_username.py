@@ -0,0 +1,163 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import List
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from website.services import ServiceError, ServiceRetryError, discord
+from website.services.scheduler import TimerScheduler
+from website.models import DiscordUser, DynamicUsername
+
+
+MAX_USERNAMES = 20
+
+
+def set_dynamic_username(discord_user: DiscordUser, usernames: List[str],
+                         interval: timedelta, min_interval: timedelta) -> DynamicUsername:
+    usernames = [username for username in usernames if username]
+    if not (2 <= len(usernames) <= MAX_USERNAMES):
+        raise ServiceError(
+            "Ошибка динамического никнейма.",
+            f"Нужно от 2х до {MAX_USERNAMES} никнеймов."
+        )
+
+    if interval < min_interval:
+        raise ServiceError(
+            "Ошибка динамического никнейма.",
+            f"Интервал должен быть не меньше {int(min_interval.total_seconds())} сек."
+        )
+
+    if discord_user.token is None:
+        raise ServiceError(
+            "Ошибка получения токена.",
+            f"Токен пользователя {discord_user} не найден в базе."
+        )
+
+    for username in usernames:
+        discord.build_username_message(discord_user.token, username)
+
+    rotation, created = DynamicUsername.objects.update_or_create(
+        discord_user=discord_user,
+        defaults={
+            'usernames': "\n".join(usernames),
+            'interval': interval,
+            'position': 0,
+            'is_active': True,
+            'next_run_at': timezone.now()
+        }
+    )
+    return rotation
+
+
+def stop_dynamic_username(discord_user: DiscordUser) -> bool:
+    return bool(
+        DynamicUsername.objects
+            .filter(discord_user=discord_user, is_active=True)
+            .update(is_active=False, updated=timezone.now())
+    )
+
+
+def apply_rotation(rotation: DynamicUsername) -> DynamicUsername:
+    """Sets the next nickname of @rotation and moves it to the next run"""
+    now = timezone.now()
+    token = rotation.discord_user.token
+
+    if token is None:
+        rotation.is_active = False
+        return rotation
+
+    try:
+        if token.is_expired:
+            discord.refresh_token(token)
+        discord.create_username_message(token, rotation.current_username)
+        rotation.position = (rotation.position + 1) % len(rotation.username_list)
+        rotation.next_run_at = now + rotation.interval
+    except ServiceRetryError as e:
+        # after the bucket reset when rate limited, a Discord outage gives
+        # no hint so the next step waits the usual interval
+        rotation.next_run_at = now + (
+            timedelta(seconds=e.retry_after) if e.retry_after else rotation.interval
+        )
+    except ServiceError:
+        rotation.next_run_at = now + rotation.interval
+
+    return rotation
+
+
+def _apply_rotation_in_thread(rotation: DynamicUsername) -> DynamicUsername:
+    try:
+        return apply_rotation(rotation)
+    finally:
+        close_old_connections()
+
+
+class DynamicUsernameRunner:
+    """Keeps every active rotation in a TimerScheduler.
+
+    The database is read once at start and then only for rotations
+    changed since the previous sync, each tick loads and applies just the
+    due batch, and the new positions are written back with one query.
+    """
+    SYNC_OVERLAP = timedelta(seconds=1)
+
+    def __init__(self, batch_size: int = 100, workers: int = 4):
+        self.batch_size = batch_size
+        self.scheduler = TimerScheduler()
+        self._synced_at = None
+        # a single worker applies rotations in the runner's own thread
+        self._pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def sync(self) -> int:
+        started = timezone.now()
+        rotations = DynamicUsername.objects.only('id', 'is_active', 'next_run_at')
+        if self._synced_at is not None:
+            rotations = rotations.filter(updated__gte=self._synced_at)
+
+        count = 0
+        for rotation in rotations.iterator(chunk_size=2000):
+            if rotation.is_active:
+                self.scheduler.schedule(rotation.pk, rotation.next_run_at.timestamp())
+            else:
+                self.scheduler.cancel(rotation.pk)
+            count += 1
+
+        self._synced_at = started - self.SYNC_OVERLAP
+        return count
+
+    def tick(self) -> int:
+        due = self.scheduler.pop_due(timezone.now().timestamp(), self.batch_size)
+        if not due:
+            return 0
+
+        rotations = DynamicUsername.objects \
+            .select_related('discord_user__token') \
+            .filter(is_active=True) \
+            .in_bulk(due)
+
+        if self._pool is None:
+            applied = [apply_rotation(rotation) for rotation in rotations.values()]
+        else:
+            applied = list(self._pool.map(
+                _apply_rotation_in_thread, rotations.values()
+            ))
+        # is_active is left alone, users may stop a rotation meanwhile
+        DynamicUsername.objects.bulk_update(applied, ['position', 'next_run_at'])
+        DynamicUsername.objects \
+            .filter(pk__in=[rotation.pk for rotation in applied if not rotation.is_active]) \
+            .update(is_active=False)
+
+        for rotation in applied:
+            if rotation.is_active:
+                self.scheduler.schedule(rotation.pk, rotation.next_run_at.timestamp())
+        return len(applied)
+
+    def seconds_to_next_run(self, default: float) -> float:
+        next_fire_time = self.scheduler.next_fire_time()
+        if next_fire_time is None:
+            return default
+        return min(max(next_fire_time - timezone.now().timestamp(), 0), default)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
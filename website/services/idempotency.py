@@ -0,0 +1,88 @@
+"""Idempotency-Key support of the API.
+
+The first request with a key claims it, runs and stores its response.
+A repeated request gets the stored response back without running again,
+so a client retrying after a timeout does not change the nickname twice.
+Failed requests give the key up, so they can be retried. A claim is
+leased for IDEMPOTENCY_CLAIM_LEASE seconds only, a worker killed before
+it finished does not block the key longer than that. Finished keys
+expire after IDEMPOTENCY_KEY_TTL seconds and are deleted by purge().
+"""
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from website.models import IdempotencyKey
+from website.services import ServiceError
+
+
+IDEMPOTENCY_KEY_TTL = timedelta(
+    seconds=getattr(settings, 'IDEMPOTENCY_KEY_TTL', 24 * 60 * 60)
+)
+# longer than any request may run, see the gunicorn timeout
+IDEMPOTENCY_CLAIM_LEASE = timedelta(
+    seconds=getattr(settings, 'IDEMPOTENCY_CLAIM_LEASE', 60)
+)
+
+
+class IdempotencyKeyConflict(ServiceError):
+    """The key is in use by a running request or by other arguments"""
+
+
+def claim(user: User, key: str, request_hash: str) -> Optional[dict]:
+    """Claims @key for a new request and returns None, or returns the
+    stored response of a finished request with the key"""
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            IdempotencyKey.objects.create(
+                user=user, key=key, request_hash=request_hash,
+                expires_at=now + IDEMPOTENCY_CLAIM_LEASE
+            )
+        return None
+    except IntegrityError:
+        pass
+
+    record = IdempotencyKey.objects.filter(user=user, key=key).first()
+    if record is not None and record.expires_at <= now:
+        # expired but not purged yet, or the lease of a dead request
+        taken = IdempotencyKey.objects \
+            .filter(pk=record.pk, expires_at__lte=now) \
+            .update(request_hash=request_hash, response=None,
+                    expires_at=now + IDEMPOTENCY_CLAIM_LEASE)
+        if taken:
+            return None
+
+    if record is None or record.response is None:
+        raise IdempotencyKeyConflict(
+            "Запрос с этим ключом ещё выполняется.",
+            f"Повторите запрос с ключом {key} позже."
+        )
+    if record.request_hash != request_hash:
+        raise IdempotencyKeyConflict(
+            "Ключ уже использован.",
+            f"Ключ {key} использован для запроса с другими аргументами."
+        )
+    return record.response
+
+
+def complete(user: User, key: str, response: dict):
+    IdempotencyKey.objects.filter(user=user, key=key).update(
+        response=response, expires_at=timezone.now() + IDEMPOTENCY_KEY_TTL
+    )
+
+
+def release(user: User, key: str):
+    IdempotencyKey.objects.filter(user=user, key=key, response__isnull=True).delete()
+
+
+def purge() -> int:
+    """Removes expired keys"""
+    deleted, _ = IdempotencyKey.objects \
+        .filter(expires_at__lte=timezone.now()) \
+        .delete()
+    return deleted
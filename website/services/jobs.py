@@ -0,0 +1,128 @@
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from website.services import ServiceError, ServiceRetryError, discord
+from website.models import DiscordUser, UsernameChangeJob
+
+
+def _check_token(discord_user: DiscordUser):
+    if discord_user.token is None:
+        raise ServiceError(
+            "Ошибка получения токена.",
+            f"Токен пользователя {discord_user} не найден в базе."
+        )
+
+
+def enqueue_username_change(discord_user: DiscordUser, username: str) -> UsernameChangeJob:
+    """Validates @username and queues it, Discord is not called here"""
+    _check_token(discord_user)
+    message = discord.build_username_message(discord_user.token, username)
+
+    return UsernameChangeJob.objects.create(
+        discord_user=discord_user, text=message.text
+    )
+
+
+def enqueue_sentence(discord_user: DiscordUser, usernames: List[str],
+                     interval: float) -> List[UsernameChangeJob]:
+    """Validates every step of a sentence and queues them in order,
+    @interval seconds apart. Nothing is queued if a step is invalid."""
+    _check_token(discord_user)
+    messages = [
+        discord.build_username_message(discord_user.token, username)
+        for username in usernames
+    ]
+
+    now = timezone.now()
+    with transaction.atomic():
+        return [
+            UsernameChangeJob.objects.create(
+                discord_user=discord_user, text=message.text,
+                run_after=now + timedelta(seconds=interval * step)
+            )
+            for step, message in enumerate(messages)
+        ]
+
+
+def claim_jobs(batch_size: int) -> List[UsernameChangeJob]:
+    """Marks up to @batch_size due jobs as running and returns them.
+
+    Rows locked by other workers are skipped, so any number of
+    `run_username_jobs` processes can poll the same table.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            UsernameChangeJob.objects
+                .select_for_update(skip_locked=True, of=('self',))
+                .select_related('discord_user__token')
+                .filter(status=UsernameChangeJob.QUEUED, run_after__lte=now)
+                .order_by('run_after', 'id')[:batch_size]
+        )
+        UsernameChangeJob.objects \
+            .filter(pk__in=[job.pk for job in jobs]) \
+            .update(
+                status=UsernameChangeJob.RUNNING,
+                attempts=F('attempts') + 1,
+                updated=now
+            )
+
+    for job in jobs:
+        job.status = UsernameChangeJob.RUNNING
+        job.attempts += 1
+    return jobs
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before attempt number @attempts + 1, doubling each time"""
+    base = getattr(settings, 'USERNAME_JOB_RETRY_DELAY', 5)
+    return base * 2 ** (attempts - 1)
+
+
+def run_job(job: UsernameChangeJob, max_attempts: int = 5):
+    token = job.discord_user.token
+
+    try:
+        if token is None:
+            raise ServiceError(
+                "Ошибка получения токена.",
+                f"Токен пользователя {job.discord_user} не найден в базе."
+            )
+
+        if token.is_expired:
+            discord.refresh_token(token)
+
+        job.message = discord.create_username_message(token, job.text)
+        job.status = UsernameChangeJob.DONE
+        job.error = ""
+    except ServiceRetryError as e:
+        if job.attempts >= max_attempts:
+            job.status = UsernameChangeJob.FAILED
+        else:
+            # Discord being down gives no hint when to come back
+            delay = e.retry_after or retry_delay(job.attempts)
+            job.status = UsernameChangeJob.QUEUED
+            job.run_after = timezone.now() + timedelta(seconds=delay)
+        job.error = str(e)
+    except ServiceError as e:
+        job.status = UsernameChangeJob.FAILED
+        job.error = str(e)
+
+    job.save(update_fields=[
+        'message', 'status', 'error', 'run_after', 'updated'
+    ])
+
+
+def requeue_stale_jobs(timeout: timedelta) -> int:
+    """Returns jobs of crashed workers back to the queue"""
+    return UsernameChangeJob.objects \
+        .filter(
+            status=UsernameChangeJob.RUNNING,
+            updated__lt=timezone.now() - timeout
+        ) \
+        .update(status=UsernameChangeJob.QUEUED)
@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import time
+
+from datetime import timedelta
+from typing import Mapping, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from website.models import DiscordRateLimit
+
+
+class RateLimited(Exception):
+    def __init__(self, retry_after: float, is_global: bool = False):
+        self.retry_after = retry_after
+        self.is_global = is_global
+        super().__init__(f"Rate limited for {retry_after:.2f}s")
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Tracks Discord rate limit buckets in the database.
+
+    Buckets are kept per route and per token (the token is stored hashed),
+    plus one global bucket, so every gunicorn worker sees the budget spent
+    by the others. Before a request is sent its slot is reserved; if the
+    bucket is known to be exhausted the caller waits for the reset, or
+    gets RateLimited right away when the wait is longer than @max_wait.
+    """
+    GLOBAL_KEY = 'global'
+
+    def __init__(self, max_wait: float = 2.0):
+        self.max_wait = max_wait
+
+    @staticmethod
+    def bucket_key(route: str, token: Optional[str]) -> str:
+        owner = hashlib.sha256(token.encode()).hexdigest()[:16] if token else 'app'
+        return f"{route}:{owner}"
+
+    def reserve(self, route: str, token: Optional[str]) -> float:
+        """Returns 0 if the request may be sent or seconds until reset"""
+        now = timezone.now()
+        key = self.bucket_key(route, token)
+
+        exhausted_till = DiscordRateLimit.objects \
+            .filter(key__in=(key, self.GLOBAL_KEY), remaining__lte=0, reset_at__gt=now) \
+            .order_by('-reset_at') \
+            .values_list('reset_at', flat=True) \
+            .first()
+        if exhausted_till is not None:
+            return max((exhausted_till - now).total_seconds(), 0.001)
+
+        # Two workers may pass the check above at once, the one who loses
+        # the last slot gets a 429 from Discord and the bucket gets synced.
+        DiscordRateLimit.objects \
+            .filter(key=key, remaining__gt=0, reset_at__gt=now) \
+            .update(remaining=F('remaining') - 1)
+        return 0
+
+    def acquire(self, route: str, token: Optional[str]):
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = self.reserve(route, token)
+            if not wait:
+                return
+            if time.monotonic() + wait > deadline:
+                raise RateLimited(wait)
+            time.sleep(wait)
+
+    async def aacquire(self, route: str, token: Optional[str]):
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = await sync_to_async(self.reserve)(route, token)
+            if not wait:
+                return
+            if time.monotonic() + wait > deadline:
+                raise RateLimited(wait)
+            await asyncio.sleep(wait)
+
+    def update(self, route: str, token: Optional[str], status: int,
+               headers: Mapping[str, str]):
+        """Syncs bucket state with the X-RateLimit-* headers of a response"""
+        now = timezone.now()
+        retry_after = _header_float(headers, 'Retry-After')
+
+        if status == 429 and headers.get('X-RateLimit-Global'):
+            self._store(
+                self.GLOBAL_KEY, limit=0, remaining=0,
+                reset_at=now + timedelta(seconds=retry_after or 1)
+            )
+            return
+
+        limit = _header_float(headers, 'X-RateLimit-Limit')
+        remaining = _header_float(headers, 'X-RateLimit-Remaining')
+        reset_after = _header_float(headers, 'X-RateLimit-Reset-After')
+        if status == 429:
+            remaining = 0
+            reset_after = max(reset_after or 0, retry_after or 0) or 1
+
+        if remaining is None or reset_after is None:
+            return
+
+        self._store(
+            self.bucket_key(route, token),
+            bucket=headers.get('X-RateLimit-Bucket', ''),
+            limit=int(limit or 0),
+            remaining=int(remaining),
+            reset_at=now + timedelta(seconds=reset_after)
+        )
+
+    async def aupdate(self, route: str, token: Optional[str], status: int,
+                      headers: Mapping[str, str]):
+        await sync_to_async(self.update)(route, token, status, headers)
+
+    @staticmethod
+    def _store(key: str, **values):
+        if DiscordRateLimit.objects.filter(key=key).update(**values):
+            return
+        try:
+            with transaction.atomic():
+                DiscordRateLimit.objects.create(key=key, **values)
+        except IntegrityError:
+            DiscordRateLimit.objects.filter(key=key).update(**values)
+
+    @staticmethod
+    def purge() -> int:
+        """Removes buckets whose window is over"""
+        deleted, _ = DiscordRateLimit.objects \
+            .filter(reset_at__lte=timezone.now()) \
+            .delete()
+        return deleted
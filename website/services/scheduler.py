@@ -0,0 +1,67 @@
+import heapq
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class TimerScheduler:
+    """Min-heap of timers keyed by their next fire time.
+
+    Scheduling, cancelling and popping a due timer are O(log n), so a tick
+    only touches the timers that are due instead of every registered one.
+    Rescheduled and cancelled timers leave stale heap entries behind; they
+    are skipped when popped and compacted away once they dominate the heap.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._timers: Dict[Hashable, Tuple[float, int]] = {}
+        # tie breaker, also tells current entries from stale ones
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def schedule(self, key: Hashable, when: float):
+        self._sequence += 1
+        self._timers[key] = (when, self._sequence)
+        heapq.heappush(self._heap, (when, self._sequence, key))
+        self._compact()
+
+    def cancel(self, key: Hashable):
+        self._timers.pop(key, None)
+        self._compact()
+
+    def next_fire_time(self) -> Optional[float]:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float, limit: int) -> List[Hashable]:
+        """Removes and returns up to @limit keys due at @now, earliest first"""
+        due = []
+        while len(due) < limit:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            when, sequence, key = heapq.heappop(self._heap)
+            del self._timers[key]
+            due.append(key)
+        return due
+
+    def _is_stale(self, entry: Tuple[float, int, Hashable]) -> bool:
+        when, sequence, key = entry
+        return self._timers.get(key, (None, None))[1] != sequence
+
+    def _drop_stale(self):
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _compact(self):
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._timers):
+            self._heap = [
+                (when, sequence, key)
+                for key, (when, sequence) in self._timers.items()
+            ]
+            heapq.heapify(self._heap)
@@ -0,0 +1,180 @@
+"""Usage rollups behind the stats page.
+
+Every new UsernameMessage is added to three small tables: the totals of
+its day, the count of its user on that day (a row there means the user
+was active) and the uses of its nickname. Days are taken in TIME_ZONE.
+The stats page reads these rows instead of grouping the messages.
+
+The rollups outlive the messages: archived messages stay counted, so
+check_rollups() compares with the messages only the days fully in the
+database.
+"""
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Sum, Value
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+
+from website.models import DailyUsage, NicknameUsage, UserDailyUsage, UsernameMessage
+from website.services.archive import get_retention
+
+
+BACKFILL_CHUNK_SIZE = 10000
+
+
+def _day(sent: datetime) -> date:
+    return timezone.localdate(sent) if timezone.is_aware(sent) else sent.date()
+
+
+def _add(model, lookup: dict, counts: dict, latest: dict = None) -> bool:
+    """Adds @counts to the row matching @lookup, @latest fields keep the
+    larger value. Returns True if the row had to be created."""
+    latest = latest or {}
+    values = {name: F(name) + value for name, value in counts.items()}
+    values.update({
+        name: Greatest(F(name), Value(value, output_field=model._meta.get_field(name)))
+        for name, value in latest.items()
+    })
+    if model.objects.filter(**lookup).update(**values):
+        return False
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **counts, **latest)
+        return True
+    except IntegrityError:
+        model.objects.filter(**lookup).update(**values)
+        return False
+
+
+def _apply(user_days: Dict[Tuple[int, date], int], nicknames: Dict[str, int],
+           last_used: Dict[str, datetime]):
+    days, new_users = Counter(), Counter()
+    with transaction.atomic():
+        for (discord_user_pk, day), count in user_days.items():
+            days[day] += count
+            if _add(UserDailyUsage, {'discord_user_id': discord_user_pk, 'date': day},
+                    {'messages': count}):
+                new_users[day] += 1
+        for day, count in days.items():
+            _add(DailyUsage, {'date': day}, {'messages': count, 'users': new_users[day]})
+        for text, count in nicknames.items():
+            _add(NicknameUsage, {'text': text}, {'uses': count},
+                 {'last_used': last_used[text]})
+
+
+def record_messages(messages: Iterable[UsernameMessage]):
+    """Adds new messages to the rollups"""
+    user_days, nicknames, last_used = Counter(), Counter(), {}
+    for message in messages:
+        user_days[(message.discord_user_id, _day(message.sent))] += 1
+        nicknames[message.text] += 1
+        last_used[message.text] = max(last_used.get(message.text, message.sent), message.sent)
+    if nicknames:
+        _apply(user_days, nicknames, last_used)
+
+
+def backfill(chunk_size: int = BACKFILL_CHUNK_SIZE) -> int:
+    """Rebuilds the rollups from the messages in the database, @chunk_size
+    ids at a time. Messages saved meanwhile are counted by the receivers,
+    archived messages are lost. Returns the number of counted messages."""
+    with transaction.atomic():
+        for model in (DailyUsage, UserDailyUsage, NicknameUsage):
+            model.objects.all().delete()
+        bounds = UsernameMessage.objects.aggregate(first=Min('pk'), last=Max('pk'))
+
+    if bounds['first'] is None:
+        return 0
+    counted = 0
+    for start in range(bounds['first'], bounds['last'] + 1, chunk_size):
+        chunk = UsernameMessage.objects \
+            .filter(pk__gte=start, pk__lt=min(start + chunk_size, bounds['last'] + 1)) \
+            .order_by()
+        user_days = {
+            (row['discord_user_id'], row['day']): row['count']
+            for row in chunk
+                .values('discord_user_id', day=TruncDate('sent'))
+                .annotate(count=Count('pk'))
+        }
+        nicknames, last_used = {}, {}
+        for row in chunk.values('text').annotate(count=Count('pk'), last=Max('sent')):
+            nicknames[row['text']] = row['count']
+            last_used[row['text']] = row['last']
+        if nicknames:
+            _apply(user_days, nicknames, last_used)
+            counted += sum(nicknames.values())
+    return counted
+
+
+def _first_complete_day():
+    first_sent = UsernameMessage.objects \
+        .order_by('sent') \
+        .values_list('sent', flat=True) \
+        .first()
+    if first_sent is None:
+        return None
+    # the oldest day may be partly archived
+    first_day = _day(first_sent)
+    return first_day + timedelta(days=1) if get_retention() is not None else first_day
+
+
+def check_rollups(since: date = None) -> List[str]:
+    """Describes every disagreement found, an empty list if there is none.
+
+    The rollups are checked against each other for all days and against
+    the messages for the days since @since, by default the first day
+    whose messages are all in the database.
+    """
+    problems = []
+
+    per_user = {
+        row['date']: row for row in UserDailyUsage.objects
+            .values('date')
+            .annotate(messages=Sum('messages'), users=Count('pk'))
+    }
+    days = {usage.date: usage for usage in DailyUsage.objects.all()}
+    for day in sorted(set(per_user) | set(days)):
+        usage, user_usage = days.get(day), per_user.get(day)
+        totals = (usage.messages, usage.users) if usage else (0, 0)
+        user_totals = (user_usage['messages'], user_usage['users']) if user_usage else (0, 0)
+        if totals != user_totals:
+            problems.append(
+                f"{day}: day totals {totals}, user totals {user_totals} (messages, users)"
+            )
+
+    day_messages = sum(usage.messages for usage in days.values())
+    nickname_uses = NicknameUsage.objects.aggregate(total=Sum('uses'))['total'] or 0
+    if day_messages != nickname_uses:
+        problems.append(f"{day_messages} messages by day, {nickname_uses} by nickname")
+
+    since = since or _first_complete_day()
+    if since is None:
+        return problems
+    since_start = datetime.combine(since, time())
+    if settings.USE_TZ:
+        since_start = timezone.make_aware(since_start)
+    counted = {
+        (row['discord_user_id'], row['day']): row['count']
+        for row in UsernameMessage.objects
+            .filter(sent__gte=since_start)
+            .order_by()
+            .values('discord_user_id', day=TruncDate('sent'))
+            .annotate(count=Count('pk'))
+    }
+    recorded = {
+        (row['discord_user_id'], row['date']): row['messages']
+        for row in UserDailyUsage.objects
+            .filter(date__gte=since)
+            .values('discord_user_id', 'date', 'messages')
+    }
+    for discord_user_pk, day in sorted(set(counted) | set(recorded), key=lambda key: key[1]):
+        messages = counted.get((discord_user_pk, day), 0)
+        rollup = recorded.get((discord_user_pk, day), 0)
+        if messages != rollup:
+            problems.append(
+                f"{day}, user {discord_user_pk}: {messages} messages, {rollup} in the rollup"
+            )
+    return problems
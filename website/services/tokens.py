@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Tuple
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from website.services import ServiceError, discord
+from website.models import DiscordToken
+
+
+def _refresh(token: DiscordToken, leeway: timedelta) -> bool:
+    try:
+        discord.refresh_token(token, leeway)
+        return True
+    except ServiceError:
+        return False
+
+
+def _refresh_in_thread(token: DiscordToken, leeway: timedelta) -> bool:
+    try:
+        return _refresh(token, leeway)
+    finally:
+        close_old_connections()
+
+
+def refresh_expiring_tokens(leeway: timedelta, batch_size: int = 50,
+                            workers: int = 4) -> Tuple[int, int]:
+    """Refreshes tokens in use that expire within @leeway.
+
+    Tokens are taken in batches of @batch_size, each batch is refreshed
+    by at most @workers concurrent OAuth calls. Returns the number of
+    refreshed and failed tokens.
+    """
+    refreshed = failed = 0
+    last_pk = 0
+    horizon = timezone.now() + leeway
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while True:
+            tokens = list(
+                DiscordToken.objects
+                    .filter(
+                        expires_at__lt=horizon,
+                        discord_user__isnull=False,
+                        pk__gt=last_pk
+                    )
+                    .order_by('pk')[:batch_size]
+            )
+            if not tokens:
+                break
+            last_pk = tokens[-1].pk
+
+            if pool is None:
+                results = [_refresh(token, leeway) for token in tokens]
+            else:
+                results = pool.map(
+                    lambda token: _refresh_in_thread(token, leeway), tokens
+                )
+
+            for ok in results:
+                if ok:
+                    refreshed += 1
+                else:
+                    failed += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return refreshed, failed
+
+
+def delete_orphaned_tokens(chunk_size: int = 1000) -> int:
+    """Deletes expired tokens no user points to anymore"""
+    deleted = 0
+    while True:
+        pks = list(
+            DiscordToken.objects
+                .filter(discord_user__isnull=True, expires_at__lt=timezone.now())
+                .values_list('pk', flat=True)[:chunk_size]
+        )
+        if not pks:
+            return deleted
+        # an orphan has no owner whose cached token could be stale, so the
+        # post_delete receivers and their owner lookups are skipped
+        deleted += DiscordToken.objects \
+            .filter(pk__in=pks, discord_user__isnull=True) \
+            ._raw_delete(DiscordToken.objects.db)
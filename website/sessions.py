@@ -0,0 +1,36 @@
+"""Session engine picked by the SESSION_MODE setting.
+
+    SESSION_ENGINE = 'website.sessions'
+    SESSION_MODE = 'cached_db'
+
+"db" (the default) reads the session row on every request. "cached_db"
+reads it from the default cache and writes through to the database, so
+a steady page view makes no session query; the cache has to be shared
+by the workers to help much. "signed_cookies" keeps the session in the
+cookie itself and needs no storage at all, but a session cannot be
+revoked on the server: signing out only clears the cookie of that
+browser.
+"""
+from importlib import import_module
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+
+
+def get_engine():
+    mode = getattr(settings, 'SESSION_MODE', 'db')
+    if mode not in ENGINES:
+        raise ImproperlyConfigured(
+            f"SESSION_MODE must be one of {', '.join(ENGINES)}, not {mode!r}."
+        )
+    return import_module(ENGINES[mode])
+
+
+SessionStore = get_engine().SessionStore
@@ -1,20 +1,73 @@
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from website.models import DiscordUser
+from website import cache
+from website.models import DiscordToken, DiscordUser, UsernameMessage
+from website.services import stats
 
 
 @receiver(post_save, sender=User)
 def create_discord_user(sender, instance, created, **kwargs):
     if created:
-        discord_user = DiscordUser.objects.create(
+        # sign in passes the Discord profile along, so it is a single insert
+        DiscordUser.objects.create(
             user=instance,
-            discord_user_id=instance.username
+            discord_user_id=instance.username,
+            **getattr(instance, 'discord_profile', {})
         )
-        discord_user.save()
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    instance.discord_user.save()
\ No newline at end of file
+def _token_owner_id(token: DiscordToken):
+    if DiscordToken.discord_user.is_cached(token):
+        return token.discord_user.discord_user_id
+    return DiscordUser.objects \
+        .filter(token_id=token.pk) \
+        .values_list('discord_user_id', flat=True) \
+        .first()
+
+
+def _message_owner_id(message: UsernameMessage):
+    if UsernameMessage.discord_user.is_cached(message):
+        return message.discord_user.user_id
+    return DiscordUser.objects \
+        .filter(pk=message.discord_user_id) \
+        .values_list('user_id', flat=True) \
+        .first()
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_session_user(sender, instance, **kwargs):
+    cache.invalidate('session_user', instance.pk)
+
+
+@receiver([post_save, post_delete], sender=DiscordUser)
+def invalidate_discord_user(sender, instance, **kwargs):
+    cache.invalidate('discord_user', instance.discord_user_id)
+    cache.invalidate('user_token', instance.discord_user_id)
+    cache.invalidate('session_user', instance.user_id)
+    cache.bump_version('page', instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=DiscordToken)
+def invalidate_user_token(sender, instance, created=False, **kwargs):
+    # a new token has no owner yet
+    if created:
+        return
+
+    discord_user_id = _token_owner_id(instance)
+    if discord_user_id is not None:
+        cache.invalidate('user_token', discord_user_id)
+
+
+@receiver(post_save, sender=UsernameMessage)
+def record_usage(sender, instance, created, **kwargs):
+    if created:
+        stats.record_messages([instance])
+
+
+@receiver([post_save, post_delete], sender=UsernameMessage)
+def invalidate_username_messages(sender, instance, **kwargs):
+    cache.invalidate('username_messages', instance.discord_user_id)
+    if cache.is_enabled():
+        cache.bump_version('page', _message_owner_id(instance))
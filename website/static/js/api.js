@@ -1,12 +1,11 @@
 'use strict';
 
 function addMessage(date, text, style) {
-    let message = 
-        "<li class=\"alert " + style + " d-flex\">" +
-        "   <span class=\"text-muted mr-2\">" + date + "</span>" + 
-        "   <span class=\"website-message-text\">" + text + "</span>"+
-        "</li>";
-    $(message).hide().prependTo("#message-history").slideDown("fast");
+    // nicknames come from users, never insert them as HTML
+    let message = $("<li class=\"alert d-flex\"></li>").addClass(style);
+    $("<span class=\"text-muted mr-2\"></span>").text(date).appendTo(message);
+    $("<span class=\"website-message-text\"></span>").text(text).appendTo(message);
+    message.hide().prependTo("#message-history").slideDown("fast");
 }
 
 function addNicknameMessage(date, text) {
@@ -21,8 +20,116 @@ function addErrorMessage(date, text) {
     addMessage(date, text, "website-error-message");
 }
 
-function updateUsername(username, successCallback, warningCallback, errorCallback) {
+function appendHistoryMessage(date, text) {
+    let message = $("<li class=\"alert website-message d-flex\"></li>");
+    $("<span class=\"text-muted mr-2\"></span>").text(date).appendTo(message);
+    $("<span class=\"website-message-text\"></span>").text(text).appendTo(message);
+    message.appendTo("#message-history");
+}
+
+function loadMessageHistory(history) {
+    let cursor = history.data("next-cursor");
+    if (!cursor || history.data("loading")) {
+        return;
+    }
+
+    history.data("loading", true);
     $.ajax({
+        url: history.data("history-url"),
+        dataType: 'json',
+        type: 'GET',
+        data: {
+            'cursor': cursor,
+            // the end of the history is in the archive
+            'archive': 1
+        },
+        success: function(data, textStatus, xhr) {
+            history.data("loading", false);
+            if (data["status"] !== "success") {
+                history.data("next-cursor", "");
+                return;
+            }
+
+            data["data"]["messages"].forEach(function(message) {
+                appendHistoryMessage(message["sent"], message["text"]);
+            });
+            history.data("next-cursor", data["data"]["next_cursor"] || "");
+            fillMessageHistory(history);
+        },
+        error: function(xhr, textStatus, errorThrown) {
+            history.data("loading", false);
+            history.data("next-cursor", "");
+        },
+        xhrFields: {
+            withCredentials: true
+        }
+    });
+}
+
+// loads the next page when the list is scrolled close to its end
+function fillMessageHistory(history) {
+    let element = history[0];
+    if (element.scrollHeight - element.scrollTop - element.clientHeight < 100) {
+        loadMessageHistory(history);
+    }
+}
+
+function escapeRegExp(text) {
+    return text.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+}
+
+let nicknameRules = null;
+
+// same checks as website/validators.py, rules are rendered by {% nickname_rules %}
+function validateNickname(nickname) {
+    if (nicknameRules === null) {
+        let rulesElement = document.getElementById("nickname-rules");
+        if (rulesElement === null) {
+            return null;
+        }
+
+        let rules = JSON.parse(rulesElement.textContent);
+        let restricted = rules["restrictedWords"].map(escapeRegExp);
+        restricted.push("[" + escapeRegExp(rules["restrictedChars"]) + "]");
+        rules["restrictedRegExp"] = new RegExp(restricted.join("|"));
+        nicknameRules = rules;
+    }
+
+    let normalized = nickname.normalize("NFKC").replace(/\s+/g, " ").trim();
+    // code points, as len() counts them on the server
+    let length = Array.from(normalized).length;
+    if (length < nicknameRules["minLength"] || length > nicknameRules["maxLength"]) {
+        return nicknameRules["lengthMessage"];
+    }
+    if (nicknameRules["restrictedRegExp"].test(normalized.toLowerCase())) {
+        return nicknameRules["restrictedMessage"];
+    }
+    return null;
+}
+
+// username changes are sent one after another without blocking the page
+let requestQueue = [];
+let requestRunning = false;
+
+function enqueueRequest(options) {
+    requestQueue.push(options);
+    runNextRequest();
+}
+
+function runNextRequest() {
+    if (requestRunning || requestQueue.length === 0) {
+        return;
+    }
+
+    requestRunning = true;
+    $.ajax(requestQueue.shift()).always(function() {
+        requestRunning = false;
+        runNextRequest();
+    });
+}
+
+function updateUsername(username, successCallback, warningCallback, errorCallback) {
+    enqueueRequest({
         url: '/api/username-chat/',
         dataType: 'json',
         type: 'POST',
@@ -31,7 +138,6 @@ function updateUsername(username, successCallback, warningCallback, errorCallbac
             'username': username
         },
         success: function(data, textStatus, xhr) {
-            console.log(textStatus, data)
             let date = data["date"];
             let status = data["status"];
             let type = data["type"];
@@ -50,13 +156,106 @@ function updateUsername(username, successCallback, warningCallback, errorCallbac
         },
         xhrFields: {
             withCredentials: true
+        }
+    });
+}
+
+
+function sendSentence(sentence, successCallback, warningCallback, errorCallback) {
+    enqueueRequest({
+        url: '/api/username-chat/sentence/',
+        dataType: 'json',
+        type: 'POST',
+        data: {
+            'csrfmiddlewaretoken': getCookie('csrftoken'),
+            'sentence': sentence
+        },
+        success: function(data, textStatus, xhr) {
+            let usernames = data["data"] ? data["data"]["usernames"] : [];
+
+            if (data["status"] === "success") {
+                successCallback(data["date"], data["type"], usernames);
+            } else if (data["status"] === "warning") {
+                warningCallback(data["date"], data["type"], data["text"], usernames);
+            } else {
+                errorCallback(data["date"], data["type"], data["text"]);
+            }
+        },
+        error: function(xhr, textStatus, errorThrown) {
+            errorCallback("now", textStatus, errorThrown);
+        },
+        xhrFields: {
+            withCredentials: true
+        }
+    });
+}
+
+
+const FEED_POLL_DELAY = 2000;
+
+// changes made in any tab arrive here, including this one
+function handleFeedEvent(event) {
+    if (event["type"] === "message") {
+        addNicknameMessage(event["sent"], event["text"]);
+    } else if (event["type"] === "job" && event["status"] === "failed") {
+        addErrorMessage(event["date"], event["error"]);
+    }
+}
+
+function pollFeed(url, cursor) {
+    $.ajax({
+        url: url,
+        dataType: 'json',
+        type: 'GET',
+        data: {
+            'cursor': cursor
         },
-        async: false
+        success: function(data, textStatus, xhr) {
+            if (data["status"] === "success") {
+                data["data"]["events"].forEach(handleFeedEvent);
+                cursor = data["data"]["cursor"];
+            }
+        },
+        complete: function() {
+            setTimeout(function() {
+                pollFeed(url, cursor);
+            }, FEED_POLL_DELAY);
+        },
+        xhrFields: {
+            withCredentials: true
+        }
     });
 }
 
+function startLiveFeed(history) {
+    let cursor = history.data("events-cursor");
+    let streamUrl = history.data("events-stream-url");
+
+    if (streamUrl && window.EventSource) {
+        // reconnects resume from the last event id on their own
+        let source = new EventSource(streamUrl + "?cursor=" + encodeURIComponent(cursor));
+        ["message", "job"].forEach(function(type) {
+            source.addEventListener(type, function(event) {
+                handleFeedEvent(JSON.parse(event.data));
+            });
+        });
+        return;
+    }
+
+    pollFeed(history.data("events-url"), cursor);
+}
+
 
 $(document).ready(function() {
+    let history = $("#message-history");
+    if (history.length) {
+        history.on("scroll", function() {
+            fillMessageHistory(history);
+        });
+        fillMessageHistory(history);
+        startLiveFeed(history);
+    }
+
     $("#set-original-nickname").click(function() {
         let originalNickname = $("#original-nickname").text();
         $("#nickname").val(originalNickname);
@@ -74,14 +273,20 @@ $(document).ready(function() {
         let nicknameElement = $("#nickname");
         let nickname = nicknameElement.val();
 
+        let validationError = validateNickname(nickname);
+        if (validationError !== null) {
+            nicknameElement.css("border-color", ERROR_COLOR);
+            error.text(validationError);
+            error.show();
+            return;
+        }
+
         updateUsername(nickname, 
             function(date, successType, newNickname) {
                 nicknameElement.css("border-color", INFO_COLOR);
                 nicknameElement.val("");
                 info.text(successType);
                 info.show();
-
-                addNicknameMessage(date, nickname);
             },
 
             function(date, warningType, warningText) {
@@ -101,4 +306,46 @@ $(document).ready(function() {
             }
         );
     });
+
+    $("#send-sentence").click(function() {
+        let error = $("#nickname-error");
+        let hint = $("#nickname-hint");
+        let info = $("#nickname-info");
+        let button = $(this);
+
+        error.hide();
+        hint.hide();
+        info.hide();
+
+        let nicknameElement = $("#nickname");
+        button.addClass("disabled");
+
+        sendSentence(nicknameElement.val(),
+            function(date, successType, usernames) {
+                button.removeClass("disabled");
+                nicknameElement.css("border-color", INFO_COLOR);
+                nicknameElement.val("");
+                info.text(successType);
+                info.show();
+            },
+
+            function(date, warningType, warningText, usernames) {
+                button.removeClass("disabled");
+                nicknameElement.css("border-color", WARN_COLOR);
+                hint.text(warningType);
+                hint.show();
+
+                addWarningMessage(date, warningText);
+            },
+
+            function(date, errorType, errorText) {
+                button.removeClass("disabled");
+                nicknameElement.css("border-color", ERROR_COLOR);
+                error.text(errorType);
+                error.show();
+
+                addErrorMessage(date, errorText);
+            }
+        );
+    });
 });
\ No newline at end of file
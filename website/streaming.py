@@ -0,0 +1,115 @@
+"""Server-Sent Events stream of the live feed, served under ASGI only.
+
+Django 3.1 cannot stream from async views, so the stream is a plain ASGI
+application placed in front of Django in i_cant_chat/asgi.py:
+
+    application = EventStreamRouter(get_asgi_application())
+
+Each connection polls website.selectors.get_feed_events() and pushes
+whatever is new. Under WSGI the front end falls back to long-polling
+the `website:events` url.
+"""
+import asyncio
+import io
+import json
+
+from importlib import import_module
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.core.handlers.asgi import ASGIRequest
+
+from website.auth import get_request_discord_user
+from website.selectors import decode_feed_cursor, get_feed_cursor, get_feed_events
+
+
+EVENTS_STREAM_PATH = '/api/events/stream/'
+POLL_INTERVAL = 1.0
+# comment lines keep proxies from closing an idle stream
+KEEPALIVE_INTERVAL = 15.0
+
+
+def _get_discord_user(request):
+    engine = import_module(settings.SESSION_ENGINE)
+    request.session = engine.SessionStore(
+        request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    )
+    request.user = auth.get_user(request)
+    return get_request_discord_user(request)
+
+
+def _format_event(event: dict, cursor: str) -> bytes:
+    data = json.dumps(event, ensure_ascii=False)
+    return f"id: {cursor}\nevent: {event['type']}\ndata: {data}\n\n".encode()
+
+
+async def _send_status(send, status: int):
+    await send({'type': 'http.response.start', 'status': status, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def event_stream(scope, receive, send):
+    request = ASGIRequest(scope, io.BytesIO())
+    discord_user = await sync_to_async(_get_discord_user)(request)
+    if discord_user is None:
+        return await _send_status(send, 403)
+
+    # EventSource sends the id of the last event when it reconnects
+    cursor = request.META.get('HTTP_LAST_EVENT_ID') or request.GET.get('cursor')
+    try:
+        if cursor:
+            decode_feed_cursor(cursor)
+        else:
+            cursor = await sync_to_async(get_feed_cursor)(discord_user.pk)
+    except ValueError:
+        return await _send_status(send, 400)
+
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [
+            (b'content-type', b'text/event-stream; charset=utf-8'),
+            (b'cache-control', b'no-cache'),
+            # nginx and the Heroku router must not buffer the stream
+            (b'x-accel-buffering', b'no'),
+        ]
+    })
+
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    idle = 0.0
+    try:
+        while not disconnected.done():
+            events, cursor = await sync_to_async(get_feed_events)(
+                discord_user.pk, cursor
+            )
+            body = b"".join(_format_event(event, cursor) for event in events)
+            if not body and idle >= KEEPALIVE_INTERVAL:
+                body = b": keepalive\n\n"
+            if body:
+                idle = 0.0
+                await send({
+                    'type': 'http.response.body', 'body': body, 'more_body': True
+                })
+
+            await asyncio.wait([disconnected], timeout=POLL_INTERVAL)
+            idle += POLL_INTERVAL
+    finally:
+        disconnected.cancel()
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+class EventStreamRouter:
+    """Serves EVENTS_STREAM_PATH itself and passes the rest to Django"""
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == EVENTS_STREAM_PATH:
+            return await event_stream(scope, receive, send)
+        return await self.application(scope, receive, send)
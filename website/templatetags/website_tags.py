@@ -0,0 +1,13 @@
+from django import template
+from django.utils.html import json_script
+
+from website.validators import nickname_rules as get_nickname_rules
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def nickname_rules():
+    """Renders the nickname rules for validateNickname() in api.js"""
+    return json_script(get_nickname_rules(), 'nickname-rules')
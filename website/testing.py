@@ -0,0 +1,246 @@
+"""Helpers for tests and benchmarks: a local stand-in for the Discord API
+and a throwaway database"""
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from website import cache
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile, @values must be sorted"""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(values)) - 1, 0)
+    return values[rank]
+
+
+@contextmanager
+def test_database():
+    """Runs the block against a fresh test database, benchmarks only"""
+    setup_test_environment()
+    test_settings = settings.DATABASES['default'].setdefault('TEST', {})
+    if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+        # in-memory databases lock whole tables for concurrent writers
+        test_settings['NAME'] = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+
+    old_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, keepdb=False
+    )
+    cache.get_cache().clear()
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+class FakeDiscordHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # benchmarks open hundreds of connections at once
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # clients that time out close the connection under our feet
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeDiscordHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open, so the client pool can reuse them.
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.fake.connection_opened()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self, method: str):
+        body = self._read_body()
+        fake = self.server.fake
+        path = urllib.parse.urlsplit(self.path).path
+        fake.record(method, path, self.headers, body)
+
+        if fake.latency:
+            time.sleep(fake.latency)
+
+        status, payload, headers = fake.respond(method, path, self.headers, body)
+        self._send_json(status, payload, headers)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+
+class FakeDiscordServer:
+    """Serves the OAuth2 token and /users/@me endpoints on localhost.
+
+    Usage:
+        with FakeDiscordServer() as discord:
+            api = DiscordApi('id', 'secret', api_url=discord.api_url)
+
+    @rate_limit is a (requests, seconds) pair applied per route and token,
+    answered with X-RateLimit-* headers and 429 like Discord does.
+    @error_rate is the share of requests answered with 500.
+    """
+    API_PREFIX = '/api/v6'
+
+    def __init__(self, latency: float = 0.0, rate_limit: tuple = None,
+                 error_rate: float = 0.0):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self._windows = {}
+        self.connections = 0
+        self.requests = []
+        # access token -> user payload
+        self.users = {}
+        # user payload the codes exchanged at /oauth2/token belong to
+        self.oauth_user = None
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.API_PREFIX}"
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def record(self, method: str, path: str, headers, body: bytes):
+        with self._lock:
+            self.requests.append((method, path, dict(headers), body))
+
+    def add_user(self, access_token: str, user_id: str, username: str,
+                 avatar: str = None):
+        self.users[access_token] = {
+            'id': user_id, 'username': username, 'avatar': avatar
+        }
+
+    def issue_token(self) -> dict:
+        return {
+            'access_token': uuid.uuid4().hex,
+            'token_type': 'Bearer',
+            'expires_in': 604800,
+            'refresh_token': uuid.uuid4().hex,
+            'scope': 'identify email'
+        }
+
+    def _rate_limit_headers(self, method: str, path: str, headers):
+        limit, per = self.rate_limit
+        key = (method, path, headers.get('Authorization'))
+        now = time.monotonic()
+        with self._lock:
+            started, used = self._windows.get(key, (now, 0))
+            if now - started >= per:
+                started, used = now, 0
+            used += 1
+            self._windows[key] = (started, used)
+
+        reset_after = per - (now - started)
+        return used <= limit, {
+            'X-RateLimit-Bucket': f"{method}{path}",
+            'X-RateLimit-Limit': str(limit),
+            'X-RateLimit-Remaining': str(max(limit - used, 0)),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}"
+        }
+
+    def respond(self, method: str, path: str, headers, body: bytes):
+        if self.error_rate and random.random() < self.error_rate:
+            return 500, {'message': '500: Internal Server Error', 'code': 0}, {}
+
+        if self.rate_limit is None:
+            return self.handle(method, path, headers, body)
+
+        allowed, limit_headers = self._rate_limit_headers(method, path, headers)
+        if not allowed:
+            retry_after = float(limit_headers['X-RateLimit-Reset-After'])
+            limit_headers['Retry-After'] = str(retry_after)
+            return 429, {
+                'message': 'You are being rate limited.',
+                'retry_after': retry_after,
+                'global': False
+            }, limit_headers
+
+        status, payload, response_headers = self.handle(method, path, headers, body)
+        return status, payload, dict(limit_headers, **response_headers)
+
+    def handle(self, method: str, path: str, headers, body: bytes):
+        if path.startswith(self.API_PREFIX):
+            path = path[len(self.API_PREFIX):]
+
+        if method == 'POST' and path == '/oauth2/token':
+            token = self.issue_token()
+            if self.oauth_user is not None:
+                self.users[token['access_token']] = self.oauth_user
+            return 200, token, {}
+
+        if path == '/users/@me':
+            token = headers.get('Authorization', '')[len('Bearer '):]
+            user = self.users.get(token)
+            if user is None:
+                return 401, {'message': '401: Unauthorized', 'code': 0}, {}
+
+            if method == 'PATCH':
+                user['username'] = json.loads(body or b'{}')['username']
+            return 200, user, {}
+
+        return 404, {'message': '404: Not Found', 'code': 0}, {}
+
+    def start(self):
+        self._server = FakeDiscordHttpServer(('127.0.0.1', 0), FakeDiscordHandler)
+        self._server.fake = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
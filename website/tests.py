@@ -1,3 +1,1386 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.test import (
+    RequestFactory, SimpleTestCase, TestCase, TransactionTestCase,
+    modify_settings, override_settings
+)
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from website import assets, cache, metrics, selectors, sessions, streaming, validators
+from website.middleware import MetricsMiddleware
+from website.models import (
+    ArchivedMessage, DailyUsage, DiscordToken, DiscordUser, DynamicUsername,
+    IdempotencyKey, NicknameUsage, UsernameChangeJob, UsernameMessage
+)
+from website.services import (
+    ServiceError, archive, discord, idempotency, jobs, stats, tokens
+)
+from website.services.discord_api import (
+    AsyncDiscordApi, CircuitBreaker, CircuitOpen, DiscordApi, DiscordApiError,
+    DiscordRateLimited, DiscordTokenType, DiscordUnavailable, DiscordUserType
+)
+from website.services.ratelimit import RateLimiter
+from website.services.scheduler import TimerScheduler
+from website.testing import FakeDiscordServer
+from website.views import api
+
+
+class DiscordApiTransportTests(SimpleTestCase):
+    def setUp(self):
+        self.discord = FakeDiscordServer().start()
+        self.addCleanup(self.discord.stop)
+        self.discord.add_user('token', '42', 'nickname')
+        self.api = DiscordApi(
+            'client-id', 'client-secret',
+            api_url=self.discord.api_url, pool_size=4, timeout=(1, 0.5)
+        )
+        self.addCleanup(self.api.close)
+
+    def test_sequential_calls_reuse_connection(self):
+        for _ in range(5):
+            self.assertEqual(self.api.get_user('token').username, 'nickname')
+
+        self.assertEqual(self.discord.connections, 1)
+
+    def test_concurrent_calls_are_bounded_by_pool(self):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            users = list(pool.map(lambda _: self.api.get_user('token'), range(40)))
+
+        self.assertEqual(len(users), 40)
+        self.assertLessEqual(self.discord.connections, 4)
+
+    def test_threads_beyond_pool_size_wait(self):
+        self.discord.latency = 0.05
+
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            users = list(pool.map(lambda _: self.api.get_user('token'), range(24)))
+
+        self.assertEqual(len(users), 24)
+        self.assertLessEqual(self.discord.connections, 4)
+
+    def test_change_username_sends_json(self):
+        user = self.api.change_username('token', 'new name')
+
+        self.assertEqual(user.username, 'new name')
+        method, path, headers, body = self.discord.requests[-1]
+        self.assertEqual((method, path), ('PATCH', '/api/v6/users/@me'))
+        self.assertEqual(body, b'{"username": "new name"}')
+
+    def test_read_timeout_raises_api_error(self):
+        self.discord.latency = 1
+
+        with self.assertRaises(DiscordApiError):
+            self.api.get_user('token')
+
+    def test_latency_stats(self):
+        self.api.get_user('token')
+        with self.assertRaises(DiscordApiError):
+            self.api.get_user('unknown')
+        self.api.request_token({'grant_type': 'refresh_token'})
+
+        stats = self.api.stats.snapshot()
+        self.assertEqual(stats['GET /users/@me']['count'], 2)
+        self.assertEqual(stats['GET /users/@me']['errors'], 1)
+        self.assertEqual(stats['POST /oauth2/token']['count'], 1)
+        self.assertGreater(stats['POST /oauth2/token']['avg'], 0)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.discord = FakeDiscordServer(error_rate=1).start()
+        self.addCleanup(self.discord.stop)
+        self.discord.add_user('token', '42', 'nickname')
+        self.breaker = CircuitBreaker(threshold=3, reset_timeout=60)
+        self.api = DiscordApi(
+            'client-id', 'client-secret',
+            api_url=self.discord.api_url, breaker=self.breaker
+        )
+        self.addCleanup(self.api.close)
+
+    def fail(self, calls: int):
+        for _ in range(calls):
+            with self.assertRaises(DiscordUnavailable):
+                self.api.get_user('token')
+
+    def test_opens_after_failures_and_fails_fast(self):
+        self.fail(3)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpen):
+            self.api.get_user('token')
+        self.assertEqual(len(self.discord.requests), 3)
+
+    def test_client_errors_do_not_count(self):
+        self.discord.error_rate = 0
+        for _ in range(5):
+            with self.assertRaises(DiscordApiError):
+                self.api.get_user('unknown')
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_trial_call_after_reset_timeout(self):
+        self.fail(3)
+        self.breaker.reset_timeout = 0
+
+        # the trial fails and opens the breaker again
+        self.fail(1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+        self.discord.error_rate = 0
+        self.assertEqual(self.api.get_user('token').username, 'nickname')
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+
+class RateLimiterTests(TestCase):
+    def setUp(self):
+        self.discord = FakeDiscordServer(rate_limit=(2, 60)).start()
+        self.addCleanup(self.discord.stop)
+        self.discord.add_user('token', '42', 'nickname')
+        self.discord.add_user('other', '43', 'other')
+        self.api = DiscordApi(
+            'id', 'secret', api_url=self.discord.api_url,
+            rate_limiter=RateLimiter(max_wait=0)
+        )
+        self.addCleanup(self.api.close)
+
+    def test_exhausted_bucket_is_not_requested(self):
+        self.api.get_user('token')
+        self.api.get_user('token')
+
+        with self.assertRaises(DiscordRateLimited) as error:
+            self.api.get_user('token')
+
+        self.assertEqual(len(self.discord.requests), 2)
+        self.assertGreater(error.exception.retry_after, 50)
+
+    def test_buckets_are_per_token(self):
+        self.api.get_user('token')
+        self.api.get_user('token')
+
+        self.assertEqual(self.api.get_user('other').username, 'other')
+
+    def test_429_is_recorded(self):
+        # another worker spent the budget without this process knowing
+        self.discord.rate_limit = (0, 60)
+
+        with self.assertRaises(DiscordRateLimited):
+            self.api.change_username('token', 'new name')
+        with self.assertRaises(DiscordRateLimited):
+            self.api.change_username('token', 'new name')
+
+        self.assertEqual(len(self.discord.requests), 1)
+
+    def test_waits_for_short_reset(self):
+        self.discord.rate_limit = (1, 0.2)
+        self.api.rate_limiter.max_wait = 1
+
+        self.api.get_user('token')
+        self.api.get_user('token')
+
+        self.assertEqual(len(self.discord.requests), 2)
+
+
+class AsyncApiTests(TestCase):
+    def setUp(self):
+        self.discord = FakeDiscordServer().start()
+        self.addCleanup(self.discord.stop)
+        self.discord.add_user('token', '42', 'nickname')
+
+        self.async_api = AsyncDiscordApi(
+            'id', 'secret', api_url=self.discord.api_url
+        )
+        patcher = mock.patch(
+            'website.services.discord.get_async_api', return_value=self.async_api
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create(username='42')
+        discord_user = self.user.discord_user
+        discord_user.token = DiscordToken.objects.create(
+            access_token='token', token_type='Bearer',
+            expires_in=timedelta(days=7), refresh_token='refresh',
+            scope='identify email', redirect_uri='http://testserver/'
+        )
+        discord_user.save()
+        self.factory = RequestFactory()
+
+    async def test_change_username_async(self):
+        request = self.factory.post('/api/username-chat/', {'username': 'new name'})
+        request.user = self.user
+
+        response = await api.change_username_async(request)
+        await self.async_api.close()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['status'], 'success')
+        self.assertEqual(self.discord.users['token']['username'], 'new name')
+        messages = UsernameMessage.objects.filter(text='new name')
+        self.assertTrue(await sync_to_async(messages.exists)())
+
+
+class DiscordUserTestCase(TestCase):
+    """Logged in user '42' with a valid token, Discord is a local stand-in"""
+
+    def setUp(self):
+        cache.get_cache().clear()
+        cache.reset_stats()
+        self.discord = FakeDiscordServer().start()
+        self.addCleanup(self.discord.stop)
+        self.discord.add_user('token', '42', 'nickname')
+
+        patcher = mock.patch(
+            'website.services.discord.get_api',
+            return_value=DiscordApi('id', 'secret', api_url=self.discord.api_url)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create(username='42')
+        self.discord_user = self.user.discord_user
+        self.discord_user.token = DiscordToken.objects.create(
+            access_token='token', token_type='Bearer',
+            expires_in=timedelta(days=7), refresh_token='refresh',
+            scope='identify email', redirect_uri='http://testserver/'
+        )
+        self.discord_user.save()
+        self.client.force_login(self.user)
+
+
+class SignInTests(DiscordUserTestCase):
+    REDIRECT_URI = 'http://testserver/discord/auth'
+
+    def test_new_user(self):
+        self.discord.oauth_user = {'id': '43', 'username': 'newcomer', 'avatar': 'a_1'}
+
+        # savepoint, token, user lookup, user, discord user, release
+        with self.assertNumQueries(6):
+            user = discord.sign_in('code', self.REDIRECT_URI)
+
+        discord_user = DiscordUser.objects.select_related('token').get(user=user)
+        self.assertEqual(discord_user.discord_user_id, '43')
+        self.assertEqual(discord_user.username, 'newcomer')
+        self.assertEqual(discord_user.avatar, 'a_1')
+        self.assertIsNotNone(discord_user.token)
+
+    def test_returning_user(self):
+        self.discord.oauth_user = {'id': '42', 'username': 'renamed', 'avatar': None}
+        selectors.get_discord_user('42')
+
+        # savepoint, token, user lookup, discord user, release
+        with self.assertNumQueries(5):
+            user = discord.sign_in('code', self.REDIRECT_URI)
+
+        self.assertEqual(user, self.user)
+        discord_user = selectors.get_discord_user('42')
+        self.assertEqual(discord_user.username, 'renamed')
+        self.assertNotEqual(discord_user.token_id, self.discord_user.token_id)
+
+    def test_private_profile_cache_is_not_trusted(self):
+        self.discord.oauth_user = {'id': '42', 'username': 'renamed', 'avatar': None}
+        discord.cache_profile(DiscordUserType('42', 'renamed', None))
+        # another worker stored an older profile after this worker cached it
+        DiscordUser.objects.filter(pk=self.discord_user.pk).update(username='stale')
+
+        discord.sign_in('code', self.REDIRECT_URI)
+
+        self.discord_user.refresh_from_db()
+        self.assertEqual(self.discord_user.username, 'renamed')
+
+    def test_login_view(self):
+        self.discord.oauth_user = {'id': '42', 'username': 'renamed', 'avatar': None}
+        self.client.logout()
+
+        # 5 for sign in, a new session is created and then saved by the
+        # middleware, login() updates last_login
+        with self.assertNumQueries(13):
+            response = self.client.get('/discord/auth/', {'code': 'code'})
+
+        self.assertRedirects(response, '/', fetch_redirect_response=False)
+
+    def test_signed_in_user_gets_the_token_owner(self):
+        self.discord.oauth_user = {'id': '99', 'username': 'other', 'avatar': None}
+        token_pk = self.discord_user.token_id
+
+        self.client.get('/discord/auth/', {'code': 'code'})
+
+        self.assertEqual(
+            self.client.session['_auth_user_id'], str(User.objects.get(username='99').pk)
+        )
+        self.assertEqual(selectors.get_discord_user('42').token_id, token_pk)
+        self.assertEqual(
+            [request[1] for request in self.discord.requests],
+            ['/api/v6/oauth2/token', '/api/v6/users/@me']
+        )
+
+    def test_sign_in_fails_while_discord_is_unavailable(self):
+        unavailable = mock.patch.object(
+            discord.get_api(), 'get_user', side_effect=DiscordUnavailable("timeout")
+        )
+
+        with unavailable, self.assertRaises(ServiceError):
+            discord.sign_in('code', self.REDIRECT_URI)
+
+        self.assertEqual(
+            selectors.get_discord_user('42').token_id, self.discord_user.token_id
+        )
+
+
+class NicknameValidationTests(DiscordUserTestCase):
+    def test_rules(self):
+        self.assertIsNone(validators.nickname_error("  new   name "))
+        self.assertIsNone(validators.nickname_error("ник"))
+        self.assertEqual(validators.nickname_error(" x "), validators.LENGTH_MESSAGE)
+        self.assertEqual(validators.nickname_error("x" * 33), validators.LENGTH_MESSAGE)
+        # fullwidth forms are folded by NFKC
+        self.assertEqual(
+            validators.nickname_error("ａ＠ｂ"), validators.RESTRICTED_MESSAGE
+        )
+        self.assertEqual(
+            validators.nickname_error("EveryOne"), validators.RESTRICTED_MESSAGE
+        )
+
+    def test_api_rejects_before_queries(self):
+        with self.assertNumQueries(0):
+            response = self.client.post('/api/username-chat/', {'username': 'a@b'})
+
+        self.assertEqual(response.json()['status'], 'error')
+        self.assertEqual(response.json()['text'], validators.RESTRICTED_MESSAGE)
+        self.assertEqual(self.discord.requests, [])
+
+    def test_normalized_nickname_is_used(self):
+        username = 'a' + ' ' * 40 + 'b'
+
+        response = self.client.post('/api/username-chat/', {'username': username})
+
+        self.assertEqual(response.json()['status'], 'success')
+        self.assertEqual(self.discord.requests[-1][3], b'{"username": "a b"}')
+        self.assertEqual(UsernameMessage.objects.get().text, 'a b')
+
+    def test_normalized_nickname_is_queued(self):
+        username = 'c' + ' ' * 40 + 'd'
+
+        self.client.post('/api/username-chat/', {'username': username, 'queue': '1'})
+        call_command('run_username_jobs', '--once', stdout=io.StringIO())
+
+        job = UsernameChangeJob.objects.get()
+        self.assertEqual(job.text, 'c d')
+        self.assertEqual(job.message.text, 'c d')
+        self.assertEqual(self.discord.users['token']['username'], 'c d')
+
+    def test_model_validator(self):
+        message = UsernameMessage(discord_user=self.discord_user, text='#')
+
+        with self.assertRaises(ValidationError):
+            message.full_clean()
+
+
+@override_settings(SENTENCE_STEP_INTERVAL=0)
+class SentenceTests(DiscordUserTestCase):
+    def test_split(self):
+        self.assertEqual(
+            validators.split_sentence("я иду домой"), ["я иду", "домой"]
+        )
+        self.assertEqual(validators.split_sentence("идём и"), ["идём и"])
+        self.assertEqual(
+            validators.split_sentence("first name\nsecond"),
+            ["first name", "second"]
+        )
+
+    def test_sentence_is_applied_in_order(self):
+        response = self.client.post(
+            '/api/username-chat/sentence/', {'sentence': 'hello dear friend'}
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['data']['usernames'], ['hello', 'dear', 'friend'])
+        self.assertEqual(self.discord.requests, [])
+
+        call_command('run_username_jobs', '--once', stdout=io.StringIO())
+
+        patches = [request for request in self.discord.requests if request[0] == 'PATCH']
+        self.assertEqual(len(patches), 3)
+        self.assertEqual(self.discord.users['token']['username'], 'friend')
+        messages = selectors.get_username_messages(self.discord_user, 5)
+        self.assertEqual([message.text for message in messages], ['friend', 'dear', 'hello'])
+        # every step is stored when it is applied
+        self.assertEqual(len({message.sent for message in messages}), 3)
+
+    def test_invalid_word_stops_everything(self):
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                '/api/username-chat/sentence/', {'sentence': 'hello @everyone'}
+            )
+
+        self.assertEqual(response.json()['status'], 'error')
+        self.assertEqual(self.discord.requests, [])
+
+    @override_settings(SENTENCE_STEP_INTERVAL=30)
+    def test_steps_are_spaced_out_by_the_queue(self):
+        self.client.post('/api/username-chat/sentence/', {'sentence': 'one two three'})
+
+        run_after = list(
+            UsernameChangeJob.objects.order_by('pk').values_list('run_after', flat=True)
+        )
+        self.assertEqual(
+            [later - earlier for earlier, later in zip(run_after, run_after[1:])],
+            [timedelta(seconds=30)] * 2
+        )
+
+        call_command('run_username_jobs', '--once', stdout=io.StringIO())
+
+        self.assertEqual(self.discord.users['token']['username'], 'one')
+        self.assertEqual(
+            UsernameChangeJob.objects.filter(status=UsernameChangeJob.QUEUED).count(), 2
+        )
+
+
+class IdempotencyTests(DiscordUserTestCase):
+    def patches(self):
+        return [request for request in self.discord.requests if request[0] == 'PATCH']
+
+    def test_current_username_is_not_sent(self):
+        self.client.post('/api/username-chat/', {'username': 'renamed'})
+        self.discord_user.refresh_from_db()
+        self.assertEqual(self.discord_user.username, 'renamed')
+
+        response = self.client.post('/api/username-chat/', {'username': ' renamed '})
+
+        self.assertEqual(response.json()['status'], 'success')
+        self.assertEqual(response.json()['type'], "Никнейм уже установлен.")
+        self.assertEqual(len(self.patches()), 1)
+        self.assertEqual(UsernameMessage.objects.count(), 1)
+
+    def test_change_by_another_worker_is_seen(self):
+        self.client.post('/api/username-chat/', {'username': 'renamed'})
+        selectors.get_user_token('42')
+        # renamed elsewhere, this worker's cached token still says 'renamed'
+        DiscordUser.objects.filter(pk=self.discord_user.pk).update(username='other')
+
+        self.client.post('/api/username-chat/', {'username': 'renamed'})
+
+        self.assertEqual(len(self.patches()), 2)
+        self.assertEqual(UsernameMessage.objects.count(), 2)
+
+    def test_repeated_key_runs_once(self):
+        responses = [
+            self.client.post(
+                '/api/username-chat/', {'username': 'renamed'},
+                HTTP_IDEMPOTENCY_KEY='retry-1'
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(len(self.patches()), 1)
+        self.assertEqual(responses[0].status_code, responses[1].status_code)
+        first, second = (response.json() for response in responses)
+        first.pop('date'), second.pop('date')
+        self.assertEqual(first, second)
+        self.assertEqual(first['type'], "Никнейм успешно изменен.")
+
+    def test_key_with_other_arguments(self):
+        self.client.post(
+            '/api/username-chat/', {'username': 'renamed'},
+            HTTP_IDEMPOTENCY_KEY='retry-1'
+        )
+
+        response = self.client.post(
+            '/api/username-chat/', {'username': 'other'},
+            HTTP_IDEMPOTENCY_KEY='retry-1'
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(len(self.patches()), 1)
+
+    def test_failed_request_gives_the_key_up(self):
+        self.discord_user.token.delete()
+
+        response = self.client.post(
+            '/api/username-chat/', {'username': 'renamed'},
+            HTTP_IDEMPOTENCY_KEY='retry-1'
+        )
+
+        self.assertEqual(response.json()['status'], 'error')
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_claim_of_dead_request_expires(self):
+        self.assertIsNone(idempotency.claim(self.user, 'retry-1', 'hash'))
+        self.assertLessEqual(
+            IdempotencyKey.objects.get().expires_at,
+            timezone.now() + idempotency.IDEMPOTENCY_CLAIM_LEASE
+        )
+        with self.assertRaises(idempotency.IdempotencyKeyConflict):
+            idempotency.claim(self.user, 'retry-1', 'hash')
+
+        # the worker was killed, the lease runs out instead of the day
+        IdempotencyKey.objects.update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertIsNone(idempotency.claim(self.user, 'retry-1', 'hash'))
+
+        idempotency.complete(self.user, 'retry-1', {'status': 'success'})
+        self.assertGreater(
+            IdempotencyKey.objects.get().expires_at,
+            timezone.now() + idempotency.IDEMPOTENCY_CLAIM_LEASE
+        )
+
+    def test_purge(self):
+        idempotency.claim(self.user, 'old', 'hash')
+        idempotency.claim(self.user, 'new', 'hash')
+        IdempotencyKey.objects.filter(key='old').update(expires_at=timezone.now())
+
+        self.assertEqual(idempotency.purge(), 1)
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list('key', flat=True)), ['new']
+        )
+
+
+@override_settings(EVENTS_LONG_POLL_TIMEOUT=0)
+class LiveFeedTests(DiscordUserTestCase):
+    def test_poll_returns_new_messages_and_jobs(self):
+        cursor = self.client.get('/api/events/').json()['data']['cursor']
+        message = UsernameMessage.objects.create(
+            discord_user=self.discord_user, text='hello'
+        )
+        UsernameChangeJob.objects.create(
+            discord_user=self.discord_user, text='later',
+            status=UsernameChangeJob.FAILED, error='no'
+        )
+
+        data = self.client.get('/api/events/', {'cursor': cursor}).json()['data']
+
+        self.assertEqual(
+            [(event['type'], event['text']) for event in data['events']],
+            [('message', 'hello'), ('job', 'later')]
+        )
+        self.assertEqual(data['events'][0]['id'], message.pk)
+        again = self.client.get('/api/events/', {'cursor': data['cursor']})
+        self.assertEqual(again.json()['data']['events'], [])
+
+    def test_index_renders_feed_cursor(self):
+        message = UsernameMessage.objects.create(
+            discord_user=self.discord_user, text='hello'
+        )
+
+        cursor = self.client.get('/').context['events_cursor']
+
+        self.assertEqual(selectors.decode_feed_cursor(cursor)[0], message.pk)
+
+    async def test_event_stream(self):
+        cursor = await sync_to_async(selectors.get_feed_cursor)(self.discord_user.pk)
+        await sync_to_async(UsernameMessage.objects.create)(
+            discord_user=self.discord_user, text='hello'
+        )
+
+        sent = []
+        first_body = asyncio.Event()
+
+        async def send(message):
+            sent.append(message)
+            if message.get('body'):
+                first_body.set()
+
+        async def receive():
+            await first_body.wait()
+            return {'type': 'http.disconnect'}
+
+        cookie = f"{settings.SESSION_COOKIE_NAME}={self.client.session.session_key}"
+        scope = {
+            'type': 'http', 'method': 'GET', 'path': streaming.EVENTS_STREAM_PATH,
+            'query_string': f'cursor={cursor}'.encode(),
+            'headers': [(b'cookie', cookie.encode())]
+        }
+        await asyncio.wait_for(streaming.event_stream(scope, receive, send), 5)
+
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn(b'event: message', sent[1]['body'])
+        self.assertIn(b'"text": "hello"', sent[1]['body'])
+
+
+class UsernameJobQueueTests(DiscordUserTestCase):
+    def test_queued_change_is_applied_by_worker(self):
+        response = self.client.post(
+            '/api/username-chat/', {'username': 'new name', 'queue': '1'}
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(self.discord.requests, [])
+        status_url = response.json()['data']['status_url']
+        self.assertEqual(self.client.get(status_url).json()['status'], 'warning')
+
+        call_command('run_username_jobs', '--once', stdout=io.StringIO())
+
+        job = UsernameChangeJob.objects.get()
+        self.assertEqual(job.status, UsernameChangeJob.DONE)
+        self.assertEqual(job.message.text, 'new name')
+        self.assertEqual(self.discord.users['token']['username'], 'new name')
+        self.assertEqual(self.client.get(status_url).json()['status'], 'success')
+
+    @override_settings(USERNAME_JOB_RETRY_DELAY=10)
+    def test_job_is_retried_while_discord_is_unavailable(self):
+        self.client.post('/api/username-chat/', {'username': 'new name', 'queue': '1'})
+        self.discord.error_rate = 1
+
+        call_command('run_username_jobs', '--once', stdout=io.StringIO())
+
+        job = UsernameChangeJob.objects.get()
+        self.assertEqual(job.status, UsernameChangeJob.QUEUED)
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=5))
+
+        self.discord.error_rate = 0
+        UsernameChangeJob.objects.update(run_after=timezone.now())
+        call_command('run_username_jobs', '--once', stdout=io.StringIO())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UsernameChangeJob.DONE)
+        self.assertEqual(self.discord.users['token']['username'], 'new name')
+
+    def test_retry_delay_doubles(self):
+        with self.settings(USERNAME_JOB_RETRY_DELAY=5):
+            self.assertEqual(
+                [jobs.retry_delay(attempts) for attempts in (1, 2, 3)], [5, 10, 20]
+            )
+
+    def test_status_of_foreign_job(self):
+        response = self.client.get('/api/username-chat/jobs/100/')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class DynamicUsernameTests(DiscordUserTestCase):
+    def test_rotation_is_applied_by_runner(self):
+        response = self.client.post('/api/dynamic-username/', {
+            'usernames': 'first\nsecond', 'interval': '60'
+        })
+        self.assertEqual(response.json()['status'], 'success')
+
+        call_command(
+            'run_dynamic_usernames', '--once', '--workers', '1',
+            stdout=io.StringIO()
+        )
+
+        rotation = DynamicUsername.objects.get()
+        self.assertEqual(rotation.position, 1)
+        self.assertGreater(rotation.next_run_at, timezone.now())
+        self.assertEqual(self.discord.users['token']['username'], 'first')
+
+    def test_unavailable_discord_waits_the_interval(self):
+        self.client.post('/api/dynamic-username/', {
+            'usernames': 'first\nsecond', 'interval': '60'
+        })
+        self.discord.error_rate = 1
+
+        call_command(
+            'run_dynamic_usernames', '--once', '--workers', '1',
+            stdout=io.StringIO()
+        )
+
+        rotation = DynamicUsername.objects.get()
+        self.assertEqual(rotation.position, 0)
+        self.assertGreater(rotation.next_run_at, timezone.now() + timedelta(seconds=50))
+
+    def test_interval_below_minimum(self):
+        response = self.client.post('/api/dynamic-username/', {
+            'usernames': 'first\nsecond', 'interval': '1'
+        })
+
+        self.assertEqual(response.json()['status'], 'error')
+        self.assertFalse(DynamicUsername.objects.exists())
+
+
+class TimerSchedulerTests(SimpleTestCase):
+    def test_pops_due_in_order(self):
+        scheduler = TimerScheduler()
+        scheduler.schedule('b', 2)
+        scheduler.schedule('a', 1)
+        scheduler.schedule('c', 5)
+        scheduler.schedule('b', 3)
+        scheduler.cancel('c')
+
+        self.assertEqual(scheduler.pop_due(10, limit=1), ['a'])
+        self.assertEqual(scheduler.pop_due(10, limit=10), ['b'])
+        self.assertEqual(len(scheduler), 0)
+        self.assertIsNone(scheduler.next_fire_time())
+
+
+class TokenSweeperTests(DiscordUserTestCase):
+    def test_refreshes_expiring_and_deletes_orphaned_tokens(self):
+        token = self.discord_user.token
+        token.set_expiry(timedelta(minutes=5))
+        token.save()
+        orphan = DiscordToken.objects.create(
+            access_token='old', token_type='Bearer',
+            expires_in=timedelta(seconds=0), refresh_token='old',
+            scope='identify email', redirect_uri='http://testserver/'
+        )
+
+        call_command(
+            'refresh_tokens', '--leeway', '600', '--workers', '1',
+            stdout=io.StringIO()
+        )
+
+        token.refresh_from_db()
+        self.assertNotEqual(token.access_token, 'token')
+        self.assertGreater(token.expires_at, timezone.now() + timedelta(days=1))
+        self.assertFalse(DiscordToken.objects.filter(pk=orphan.pk).exists())
+
+    def test_orphans_are_deleted_in_bulk(self):
+        DiscordToken.objects.bulk_create([
+            DiscordToken(
+                access_token=f'old {i}', token_type='Bearer',
+                expires_in=timedelta(seconds=0), expires_at=timezone.now(),
+                refresh_token='old', scope='identify', redirect_uri=''
+            )
+            for i in range(5)
+        ])
+
+        # one select and one delete per chunk, then the empty select
+        with self.assertNumQueries(3):
+            self.assertEqual(tokens.delete_orphaned_tokens(), 5)
+        self.assertTrue(DiscordToken.objects.filter(pk=self.discord_user.token_id).exists())
+
+
+class SingleFlightRefreshTests(TransactionTestCase):
+    def setUp(self):
+        self.token = DiscordToken.objects.create(
+            access_token='expired', token_type='Bearer',
+            expires_in=timedelta(seconds=0), refresh_token='refresh',
+            scope='identify email', redirect_uri='http://testserver/'
+        )
+        self.calls = []
+
+    def fake_refresh(self, refresh_token, redirect_uri):
+        self.calls.append(refresh_token)
+        time.sleep(0.2)
+        return DiscordTokenType(
+            access_token=f'fresh {len(self.calls)}', token_type='Bearer',
+            expires_in=604800, refresh_token=f'refresh {len(self.calls)}',
+            scope='identify email'
+        )
+
+    def refresh_in_thread(self, _):
+        # each request holds its own copy of the row
+        token = DiscordToken.objects.get(pk=self.token.pk)
+        try:
+            discord.refresh_token(token)
+            return token.access_token
+        finally:
+            connection.close()
+
+    def test_one_upstream_refresh_per_expiry(self):
+        with mock.patch.object(discord.get_api(), 'refresh_token', self.fake_refresh):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                access_tokens = set(pool.map(self.refresh_in_thread, range(8)))
+
+        self.assertEqual(self.calls, ['refresh'])
+        self.assertEqual(access_tokens, {'fresh 1'})
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.refresh_token, 'refresh 1')
+
+
+class MessageHistoryTests(DiscordUserTestCase):
+    def setUp(self):
+        super().setUp()
+        UsernameMessage.objects.bulk_create([
+            UsernameMessage(discord_user=self.discord_user, text=f'name {i}')
+            for i in range(7)
+        ])
+        # equal dates are ordered by pk
+        UsernameMessage.objects.update(sent=timezone.now())
+
+    def get_page(self, **params):
+        response = self.client.get('/api/username-chat/history/', params)
+        self.assertEqual(response.json()['status'], 'success')
+        return response.json()['data']
+
+    def test_pages_cover_history_once(self):
+        texts, cursor = [], None
+        while True:
+            page = self.get_page(count=3, **({'cursor': cursor} if cursor else {}))
+            texts += [message['text'] for message in page['messages']]
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual(texts, [f'name {i}' for i in reversed(range(7))])
+
+    def test_page_query_uses_foreign_key(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get_page(count=3)
+
+        history_query = queries.captured_queries[-1]['sql']
+        self.assertIn('"discord_user_id" =', history_query)
+        self.assertNotIn('OFFSET', history_query)
+
+    def test_bad_cursor(self):
+        response = self.client.get('/api/username-chat/history/', {'cursor': 'bad'})
+
+        self.assertEqual(response.json()['type'], 'Wrong arguments.')
+
+    def test_page_continues_preview(self):
+        response = self.client.get('/')
+        cursor = response.context['history_cursor']
+
+        page = self.get_page(cursor=cursor)
+        self.assertEqual(page['messages'][0]['text'], 'name 1')
+
+
+class ArchiveTests(DiscordUserTestCase):
+    def setUp(self):
+        super().setUp()
+        UsernameMessage.objects.bulk_create([
+            UsernameMessage(discord_user=self.discord_user, text=f'name {i}')
+            for i in range(6)
+        ])
+        now = timezone.now()
+        for i, message in enumerate(UsernameMessage.objects.order_by('pk')):
+            # two in January, two in February, two recent
+            sent = [datetime(2020, 1, 10 + i, tzinfo=dt_timezone.utc),
+                    datetime(2020, 2, 8 + i, tzinfo=dt_timezone.utc),
+                    now][i // 2]
+            UsernameMessage.objects.filter(pk=message.pk).update(sent=sent)
+
+    def test_archive_and_read_back(self):
+        call_command('archive_messages', days=30, batch_size=3, stdout=io.StringIO())
+
+        self.assertEqual(ArchivedMessage.objects.count(), 4)
+        self.assertEqual(UsernameMessage.objects.count(), 2)
+
+        texts, cursor = [], None
+        while True:
+            params = {'count': 3, 'archive': 1, **({'cursor': cursor} if cursor else {})}
+            data = self.client.get('/api/username-chat/history/', params).json()['data']
+            texts += [message['text'] for message in data['messages']]
+            cursor = data['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(texts, [f'name {i}' for i in reversed(range(6))])
+
+        data = self.client.get('/api/username-chat/history/', {'count': 10}).json()['data']
+        self.assertEqual(len(data['messages']), 2)
+
+    def test_interrupted_batch_stays_in_history(self):
+        with mock.patch.object(archive, '_delete_messages', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                archive.archive_messages(timedelta(days=30))
+
+        self.assertFalse(ArchivedMessage.objects.exists())
+        self.assertEqual(archive.archive_messages(timedelta(days=30)), 4)
+
+    def test_archive_is_read_with_one_query(self):
+        archive.archive_messages(timedelta(days=30))
+        newest = ArchivedMessage.objects.order_by('-sent').first()
+
+        with self.assertNumQueries(1):
+            archived = archive.get_archived_messages(
+                self.discord_user.pk, 2, (newest.sent, newest.pk)
+            )
+        self.assertEqual([m.text for m in archived], ['name 2', 'name 1'])
+
+    def test_jobs_lose_archived_messages(self):
+        message = UsernameMessage.objects.order_by('pk').first()
+        job = UsernameChangeJob.objects.create(
+            discord_user=self.discord_user, text=message.text,
+            status=UsernameChangeJob.DONE, message=message
+        )
+
+        archive.archive_messages(timedelta(days=30))
+
+        job.refresh_from_db()
+        self.assertIsNone(job.message)
+        self.assertEqual(len(archive.get_archived_messages(self.discord_user.pk, 10)), 4)
+
+    def test_retention_required(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_messages')
+
+
+class ExportTests(DiscordUserTestCase):
+    def setUp(self):
+        super().setUp()
+        other = User.objects.create(username='43').discord_user
+        UsernameMessage.objects.bulk_create([
+            UsernameMessage(discord_user=self.discord_user, text='first, "quoted"'),
+            UsernameMessage(discord_user=self.discord_user, text='second'),
+            UsernameMessage(discord_user=other, text='other'),
+        ])
+        UsernameMessage.objects.filter(text='second').update(
+            sent=datetime(2020, 5, 1, tzinfo=dt_timezone.utc)
+        )
+
+    def export(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_user_export(self):
+        lines = self.export('/export/messages/').splitlines()
+
+        self.assertEqual(
+            [json.loads(line)['text'] for line in lines], ['first, "quoted"', 'second']
+        )
+        self.assertEqual(json.loads(lines[0])['discord_user_id'], '42')
+
+    def test_csv_with_bounds(self):
+        content = self.export('/export/messages/', format='csv', until='2021-01-01')
+
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(rows[0], list(selectors.EXPORT_FIELDS))
+        self.assertEqual([row[2] for row in rows[1:]], ['second'])
+
+        content = self.export('/export/messages/', format='csv', since='2021-01-01')
+        self.assertEqual(
+            [row[2] for row in csv.reader(io.StringIO(content))][1:], ['first, "quoted"']
+        )
+
+    def test_bad_arguments(self):
+        self.assertEqual(self.client.get('/export/messages/', {'since': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get('/export/messages/', {'format': 'xml'}).status_code, 400)
+
+    def test_full_export_is_staff_only(self):
+        self.assertEqual(self.client.get('/export/messages/all/').status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        self.assertEqual(len(self.export('/export/messages/all/').splitlines()), 3)
+
+
+class AdminTests(DiscordUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user.is_staff = self.user.is_superuser = True
+        self.user.save()
+        self.url = reverse('admin:website_usernamemessage_changelist')
+
+    def add_messages(self, count):
+        # messages of different users, each one is shown with its user
+        start = UsernameMessage.objects.count()
+        UsernameMessage.objects.bulk_create([
+            UsernameMessage(
+                discord_user=User.objects.create(username=f'user {i}').discord_user,
+                text=f'name {i}'
+            )
+            for i in range(start, start + count)
+        ])
+
+    def count_queries(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        self.add_messages(3)
+        small, _ = self.count_queries(self.url)
+
+        self.add_messages(120)
+        full, response = self.count_queries(self.url)
+        self.assertEqual(full, small)
+        self.assertEqual(len(response.context['cl'].result_list), 100)
+
+        searched, _ = self.count_queries(self.url, q='user 7')
+        self.assertLessEqual(searched, small)
+
+    def test_older_link_continues_below_page(self):
+        self.add_messages(150)
+        _, response = self.count_queries(self.url)
+        page = list(response.context['cl'].result_list)
+        older_url = response.context['cl'].older_url
+        self.assertIn('id__lt=', older_url)
+
+        _, response = self.count_queries(self.url + older_url)
+        older = list(response.context['cl'].result_list)
+        self.assertEqual(len(older), 50)
+        self.assertLess(older[0].pk, page[-1].pk)
+        self.assertIsNone(response.context['cl'].older_url)
+
+    def test_other_changelists(self):
+        self.add_messages(5)
+        for model in ('discorduser', 'usernamechangejob', 'dynamicusername'):
+            queries, _ = self.count_queries(reverse(f'admin:website_{model}_changelist'))
+            self.assertLessEqual(queries, 8, model)
+
+
+class UsageStatsTests(DiscordUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.other = User.objects.create(username='43').discord_user
+
+    def test_messages_are_rolled_up(self):
+        for discord_user, text in ((self.discord_user, 'one'), (self.discord_user, 'two'),
+                                   (self.other, 'one')):
+            UsernameMessage.objects.create(discord_user=discord_user, text=text)
+
+        usage = DailyUsage.objects.get()
+        self.assertEqual((usage.date, usage.messages, usage.users),
+                         (timezone.localdate(), 3, 2))
+        self.assertEqual(
+            {row.text: row.uses for row in NicknameUsage.objects.all()}, {'one': 2, 'two': 1}
+        )
+        self.assertEqual(stats.check_rollups(), [])
+
+    def test_backfill_and_check(self):
+        UsernameMessage.objects.bulk_create([
+            UsernameMessage(discord_user=user, text='old')
+            for user in (self.discord_user, self.discord_user, self.other)
+        ])
+        UsernameMessage.objects.update(sent=datetime(2020, 1, 1, 12, tzinfo=dt_timezone.utc))
+        UsernameMessage.objects.create(discord_user=self.other, text='new')
+
+        problems = stats.check_rollups()
+        self.assertIn("2020-01-01, user", problems[0])
+        with self.assertRaises(CommandError):
+            call_command('check_usage', stderr=io.StringIO())
+
+        call_command('backfill_usage', chunk_size=2, stdout=io.StringIO())
+        self.assertEqual(stats.check_rollups(), [])
+        self.assertEqual(DailyUsage.objects.get(date='2020-01-01').users, 2)
+        self.assertEqual(NicknameUsage.objects.get(text='old').uses, 3)
+
+        DailyUsage.objects.filter(date='2020-01-01').update(users=5)
+        self.assertEqual(len(stats.check_rollups()), 1)
+
+    def test_stats_page(self):
+        UsernameMessage.objects.create(discord_user=self.other, text='popular')
+        self.client.logout()
+
+        with self.assertNumQueries(5):
+            response = self.client.get('/stats/')
+        self.assertContains(response, 'popular')
+        self.assertEqual(response.context['active_users']['day'], 1)
+
+        with self.assertNumQueries(0):
+            self.client.get('/stats/')
+
+
+@override_settings(CACHES=dict(settings.CACHES, selectors={
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'LOCATION': 'shared-cache-tests'
+}))
+class SharedCacheTestCase(DiscordUserTestCase):
+    """The configured local selector cache stands in for a shared one"""
+
+    def setUp(self):
+        super().setUp()
+        for patcher in (
+            mock.patch('website.cache._cache', None),
+            mock.patch('website.cache.is_shared', return_value=True)
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        cache.get_cache().clear()
+
+
+class PageCacheTests(SharedCacheTestCase):
+    def test_not_modified_until_message(self):
+        response = self.client.get('/')
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get('/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        UsernameMessage.objects.create(discord_user=self.discord_user, text='hello')
+        response = self.client.get('/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'hello')
+
+    def test_anonymous_page_is_not_conditional(self):
+        self.client.logout()
+
+        self.assertNotIn('ETag', self.client.get('/'))
+
+    def test_profile_fragment_follows_version(self):
+        self.discord_user.username = 'nickname'
+        self.discord_user.save()
+        self.assertContains(self.client.get('/discord/user/'), '@nickname')
+
+        # update() sends no post_save, the cached fragment stays
+        DiscordUser.objects.filter(pk=self.discord_user.pk).update(username='renamed')
+        self.assertContains(self.client.get('/discord/user/'), '@nickname')
+
+        self.discord_user.refresh_from_db()
+        self.discord_user.save()
+        self.assertContains(self.client.get('/discord/user/'), '@renamed')
+
+    def test_private_cache_keeps_no_pages(self):
+        cache.is_shared.return_value = False
+        response = self.client.get('/')
+        self.assertNotIn('ETag', response)
+
+        # stored by another process, no receiver runs here
+        UsernameMessage.objects.bulk_create([
+            UsernameMessage(discord_user=self.discord_user, text='hello')
+        ])
+        self.assertContains(self.client.get('/'), 'hello')
+
+
+@modify_settings(MIDDLEWARE={'prepend': 'website.middleware.MetricsMiddleware'})
+class MetricsTests(DiscordUserTestCase):
+    def test_view_and_discord_call_metrics(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.get('/')
+        self.client.post('/api/username-chat/', {'username': 'new name'})
+
+        response = self.client.get('/metrics/')
+
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('website_request_duration_seconds_count{view="website:index"}', body)
+        self.assertIn('website_request_db_queries_count{view="website:index"}', body)
+        self.assertIn(
+            'website_discord_call_duration_seconds_count'
+            '{endpoint="PATCH /users/@me",status="200"}', body
+        )
+
+    async def test_middleware_stays_async(self):
+        async def view(request):
+            request.resolver_match = resolve('/stats/')
+            return HttpResponse()
+
+        middleware = MetricsMiddleware(view)
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+
+        response = await middleware(RequestFactory().get('/stats/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'website_request_duration_seconds_count{view="website:stats"}',
+            metrics.render().decode()
+        )
+
+    def test_breaker_state(self):
+        breaker = CircuitBreaker(threshold=1)
+        breaker.record(None)
+        self.assertIn('website_discord_breaker_state 2.0', metrics.render().decode())
+
+        breaker.reset()
+        self.assertIn('website_discord_breaker_state 0.0', metrics.render().decode())
+
+    def test_gunicorn_workers_use_multiprocess_values(self):
+        # what a preloading master does: read the config, then load the app
+        script = (
+            "import runpy; runpy.run_path('gunicorn.conf.py'); "
+            "import i_cant_chat.wsgi; from website import metrics; "
+            "print(type(metrics.DISCORD_BREAKER_OPENED._value).__name__)"
+        )
+        env = {
+            name: value for name, value in os.environ.items()
+            if name != 'prometheus_multiproc_dir'
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            result = subprocess.run(
+                [sys.executable, '-c', script], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, env=dict(env, TMPDIR=tmp)
+            )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'MmapedValue')
+
+    def test_access(self):
+        self.assertEqual(self.client.get('/metrics/').status_code, 403)
+
+        with override_settings(METRICS_TOKEN='secret'):
+            response = self.client.get(
+                '/metrics/', HTTP_AUTHORIZATION='Bearer secret'
+            )
+        self.assertEqual(response.status_code, 200)
+
+
+class SelectorCacheTests(SharedCacheTestCase):
+    def test_repeated_reads_hit_cache(self):
+        selectors.get_discord_user('42')
+        selectors.get_user_token('42')
+        selectors.get_username_messages(self.discord_user, 5)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(selectors.get_discord_user('42'), self.discord_user)
+            self.assertEqual(selectors.get_user_token('42'), self.discord_user.token)
+            self.assertEqual(selectors.get_username_messages(self.discord_user, 5), [])
+        self.assertEqual(cache.stats()['discord_user']['hits'], 1)
+
+    def test_shared_only_selectors_skip_local_cache(self):
+        cache.is_shared.return_value = False
+        selectors.get_session_user(self.user.pk)
+        selectors.get_username_messages(self.discord_user, 5)
+
+        with self.assertNumQueries(2):
+            selectors.get_session_user(self.user.pk)
+            selectors.get_username_messages(self.discord_user, 5)
+
+    def test_saves_and_deletes_invalidate(self):
+        self.assertEqual(selectors.get_username_messages(self.discord_user, 5), [])
+        message = UsernameMessage.objects.create(
+            discord_user=self.discord_user, text='hello'
+        )
+        self.assertEqual(selectors.get_username_messages(self.discord_user, 5), [message])
+
+        message.delete()
+        self.assertEqual(selectors.get_username_messages(self.discord_user, 5), [])
+
+        token = selectors.get_user_token('42')
+        token.access_token = 'changed'
+        token.save()
+        self.assertEqual(selectors.get_user_token('42').access_token, 'changed')
+
+    @override_settings(SELECTOR_CACHE_ENABLED=False)
+    def test_disabled(self):
+        selectors.get_discord_user('42')
+
+        with self.assertNumQueries(1):
+            selectors.get_discord_user('42')
+
+
+class AssetsTests(SimpleTestCase):
+    def test_purge_css(self):
+        css = (
+            "/* comment */ :root{--a:1}"
+            ".btn,.badge{color:red}.btn:not(.disabled):hover{color:blue}"
+            "@media (min-width:1px){.badge{x:1}.row .col{x:2}}"
+            "@font-face{font-family:\"F\"}"
+        )
+        self.assertEqual(
+            assets.purge_css(css, {"btn", "row", "col"}),
+            ":root{--a:1}.btn{color:red}.btn:not(.disabled):hover{color:blue}"
+            "@media (min-width:1px){.row .col{x:2}}@font-face{font-family:\"F\"}"
+        )
+
+    def test_minify_css_keeps_strings_and_combinators(self):
+        self.assertEqual(
+            assets.minify_css('a :hover , b > c {\n  content: " ;  " ;\n}'),
+            'a :hover,b>c{content:" ;  "}'
+        )
+
+    def test_minify_js(self):
+        source = (
+            "'use strict';\n\n// comment\nfunction f(a) {\n"
+            "    /* block */ return a.replace(/\\/\\//g, \"//\") / 2\n}\n"
+        )
+        self.assertEqual(
+            assets.minify_js(source),
+            "'use strict';\nfunction f(a) {\n"
+            "return a.replace(/\\/\\//g, \"//\") / 2\n}"
+        )
+
+
+class BootTests(DiscordUserTestCase):
+    # seconds the project's own modules may spend importing, Django and
+    # the libraries are left out as they do not change with this code
+    IMPORT_TIME_BUDGET = float(os.environ.get('WSGI_IMPORT_TIME_BUDGET', 0.5))
+    PROJECT_PACKAGES = ('i_cant_chat', 'website')
+    # only needed once Discord is called
+    LAZY_MODULES = ('requests', 'httpx')
+
+    def import_times(self) -> dict:
+        """Self time of every module imported by the WSGI app, in seconds"""
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import i_cant_chat.wsgi'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        times = {}
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and '|' in line:
+                own, _, name = line[len('import time:'):].split('|')
+                if own.strip().isdigit():
+                    times[name.strip()] = int(own) / 1e6
+        return times
+
+    def test_wsgi_import_time(self):
+        times = self.import_times()
+
+        own_time = sum(
+            seconds for name, seconds in times.items()
+            if name.split('.')[0] in self.PROJECT_PACKAGES
+        )
+        self.assertLess(own_time, self.IMPORT_TIME_BUDGET)
+        for name in self.LAZY_MODULES:
+            self.assertNotIn(name, times)
+
+    @mock.patch('website.warmup._discord_ready', False)
+    def test_ready(self):
+        with mock.patch('website.warmup.get_api', discord.get_api):
+            response = self.client.get('/ready/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'database': True, 'discord': True})
+        self.assertEqual(self.discord.requests[-1][1], '/api/v6/gateway')
+
+
+@override_settings(
+    AUTHENTICATION_BACKENDS=['website.auth.CachedUserBackend'],
+    SESSION_ENGINE='django.contrib.sessions.backends.cached_db'
+)
+@modify_settings(MIDDLEWARE={
+    'remove': 'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'append': 'website.middleware.CachedAuthenticationMiddleware'
+})
+class SessionUserTests(SharedCacheTestCase):
+
+    def test_steady_page_view_makes_no_queries(self):
+        # the session was started with ModelBackend by force_login()
+        self.client.get('/discord/user/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/discord/user/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['discord_user'], self.discord_user)
+        self.assertEqual(
+            self.client.session['_auth_user_backend'], 'website.auth.CachedUserBackend'
+        )
+
+    def test_saved_user_is_loaded_again(self):
+        self.client.get('/')
+        self.discord_user.username = 'renamed'
+        self.discord_user.save()
+
+        response = self.client.get('/discord/user/')
+        self.assertEqual(response.context['discord_user'].username, 'renamed')
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/discord/user/').status_code, 403)
+
+    def test_private_cache_is_not_used(self):
+        self.client.get('/discord/user/')
+        # another worker's save runs receivers in that worker only
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with mock.patch('website.cache.is_shared', return_value=False):
+            self.assertEqual(self.client.get('/discord/user/').status_code, 403)
+
+    def test_session_mode(self):
+        with override_settings(SESSION_MODE='signed_cookies'):
+            self.assertEqual(
+                sessions.get_engine().__name__,
+                'django.contrib.sessions.backends.signed_cookies'
+            )
+        with override_settings(SESSION_MODE='redis'):
+            with self.assertRaises(ImproperlyConfigured):
+                sessions.get_engine()
 
-# Create your tests here.
@@ -1,9 +1,14 @@
+from django.conf import settings
 from django.urls import include, path
 
 from website import views
-from website.views import api, discord, news
+from website.views import api, discord, export, health, metrics, news, stats
 
 
+# Under ASGI the Discord round-trips are served by the async views, see
+# i_cant_chat/asgi.py.
+ASYNC_SERVING = getattr(settings, 'ASYNC_SERVING', False)
+
 app_name = 'website'
 urlpatterns = [
     path('', views.index, name='index'),
@@ -13,23 +18,43 @@ urlpatterns = [
         path('', api.api_root, name='api'),
         
         path('username-chat/', include([
-            path('', api.change_username),
+            path('', api.change_username_async if ASYNC_SERVING
+                     else api.change_username),
+            path('sentence/', api.change_username_sentence,
+                 name='username_sentence'),
+            path('history/', api.username_history,
+                 name='username_history'),
+            path('jobs/<int:job_id>/', api.username_job_status,
+                 name='username_job'),
         ])),
         
+        path('events/', api.events_poll_async if ASYNC_SERVING
+                        else api.events_poll, name='events'),
+
         path('dynamic-username/', include([
             path('', api.dynamic_username_root),
+            path('stop/', api.dynamic_username_stop),
         ])),
     ])),
 
+    path('export/', include([
+        path('messages/', export.user_messages, name='export_messages'),
+        path('messages/all/', export.all_messages, name='export_all_messages'),
+    ])),
+
     path('discord/', include([
         path('user/', discord.discord_user_info, name='user'),
         
         path('auth/', include([
-            path('', discord.discord_auth, name='discord_auth'),
+            path('', discord.discord_auth_async if ASYNC_SERVING
+                     else discord.discord_auth, name='discord_auth'),
             path('url/', discord.discord_auth_url,
                  name='discord_auth_url'),
         ])),
     ])),
 
     path('news/', views.news.news_root, name='news'),
+    path('stats/', stats.stats_root, name='stats'),
+    path('metrics/', metrics.metrics_root, name='metrics'),
+    path('ready/', health.ready, name='ready'),
 ]
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Nickname rules shared by the model, the API and the front end.
+
+Discord compares nicknames after NFKC normalization with surrounding
+whitespace trimmed and inner runs of whitespace collapsed, so the rules
+are checked against that form. nickname_rules() feeds the same limits
+and messages to validateNickname() in api.js.
+"""
+import re
+import unicodedata
+
+from typing import Dict, List, Optional
+
+from django.core.exceptions import ValidationError
+
+
+NICKNAME_MIN_LENGTH = 2
+NICKNAME_MAX_LENGTH = 32
+RESTRICTED_WORDS = ("everyone", "here", "discordtag")
+RESTRICTED_CHARS = "@#:`"
+SENTENCE_MAX_STEPS = 10
+
+LENGTH_MESSAGE = (
+    f"Длина никнейма должна быть от {NICKNAME_MIN_LENGTH}х "
+    f"до {NICKNAME_MAX_LENGTH}х символов."
+)
+RESTRICTED_MESSAGE = (
+    "Никнейм не должен содержать следующие символы: '"
+    + "', '".join(RESTRICTED_WORDS + tuple(RESTRICTED_CHARS)) + "'."
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_RESTRICTED_RE = re.compile(
+    "|".join(map(re.escape, RESTRICTED_WORDS))
+    + "|[" + re.escape(RESTRICTED_CHARS) + "]"
+)
+
+
+def normalize_nickname(value: str) -> str:
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", value)).strip()
+
+
+def nickname_error(value: str) -> Optional[str]:
+    """Returns the message of the first broken rule or None"""
+    value = normalize_nickname(value)
+    if not (NICKNAME_MIN_LENGTH <= len(value) <= NICKNAME_MAX_LENGTH):
+        return LENGTH_MESSAGE
+    if _RESTRICTED_RE.search(value.casefold()):
+        return RESTRICTED_MESSAGE
+    return None
+
+
+def validate_nickname(value: str) -> str:
+    """Returns the normalized nickname, the one to store and send"""
+    error = nickname_error(value)
+    if error is not None:
+        raise ValidationError(error, code='invalid_nickname')
+    return normalize_nickname(value)
+
+
+def split_sentence(sentence: str) -> List[str]:
+    """A newline separated list is taken as is, otherwise every word is a
+    nickname and words shorter than the minimum join a neighbour"""
+    if "\n" in sentence:
+        return [line.strip() for line in sentence.splitlines() if line.strip()]
+
+    usernames = []
+    for word in sentence.split():
+        if usernames and len(usernames[-1]) < NICKNAME_MIN_LENGTH:
+            usernames[-1] += " " + word
+        else:
+            usernames.append(word)
+    if len(usernames) > 1 and len(usernames[-1]) < NICKNAME_MIN_LENGTH:
+        last = usernames.pop()
+        usernames[-1] += " " + last
+    return usernames
+
+
+def validate_sentence(value: str):
+    usernames = split_sentence(value)
+    if not (1 <= len(usernames) <= SENTENCE_MAX_STEPS):
+        raise ValidationError(
+            f"Фраза должна состоять из 1-{SENTENCE_MAX_STEPS} никнеймов.",
+            code='invalid_sentence'
+        )
+
+    for username in usernames:
+        error = nickname_error(username)
+        if error is not None:
+            raise ValidationError(f"«{username}»: {error}", code='invalid_nickname')
+
+
+def nickname_rules() -> Dict:
+    return {
+        'minLength': NICKNAME_MIN_LENGTH,
+        'maxLength': NICKNAME_MAX_LENGTH,
+        'restrictedWords': list(RESTRICTED_WORDS),
+        'restrictedChars': RESTRICTED_CHARS,
+        'lengthMessage': LENGTH_MESSAGE,
+        'restrictedMessage': RESTRICTED_MESSAGE
+    }
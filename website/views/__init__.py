@@ -1,15 +1,100 @@
+import hashlib
+
+from datetime import datetime, timezone as dt_timezone
+from typing import Optional
+
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.contrib.auth import logout as default_logout
+from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from website import cache
+from website.auth import get_request_discord_user
+from website.models import DiscordUser
+from website.selectors import (
+    encode_feed_cursor, get_username_messages, next_message_cursor
+)
+from website.streaming import EVENTS_STREAM_PATH
+
+
+# messages rendered with the page, the rest is loaded by the history API
+HISTORY_PREVIEW_COUNT = 5
+# the fragments are versioned, the timeout only frees the space of old ones
+PAGE_FRAGMENT_TIMEOUT = getattr(settings, 'PAGE_FRAGMENT_TIMEOUT', 24 * 60 * 60)
+
+
+def message_history_context(discord_user: DiscordUser) -> dict:
+    page_version = cache.get_version('page', discord_user.user_id) \
+        if discord_user is not None else None
+    last_messages = get_username_messages(discord_user, HISTORY_PREVIEW_COUNT)
+    return {
+        "discord_user": discord_user,
+        "last_messages": last_messages,
+        "history_cursor": next_message_cursor(
+            last_messages, HISTORY_PREVIEW_COUNT
+        ),
+        # the live feed starts right after the rendered messages
+        "events_cursor": encode_feed_cursor(
+            last_messages[0].pk if last_messages else 0, timezone.now()
+        ),
+        "events_stream_url": EVENTS_STREAM_PATH
+            if getattr(settings, 'ASYNC_SERVING', False) else "",
+        # bumped by website.signals when the messages or the profile change,
+        # the fragments are kept next to the version in the shared cache
+        "page_version": page_version,
+        "fragment_cache": cache.CACHE_ALIAS
+            if page_version is not None else 'default',
+        "fragment_timeout": PAGE_FRAGMENT_TIMEOUT
+            if page_version is not None else 0
+    }
+
+
+def _page_version(request) -> Optional[int]:
+    if not request.user.is_authenticated:
+        return None
+    return cache.get_version('page', request.user.pk)
+
+
+def _page_etag(request, *args, **kwargs) -> Optional[str]:
+    version = _page_version(request)
+    if version is None:
+        return None
+    # the page carries a token made from the CSRF cookie, a new cookie
+    # needs a new page
+    get_token(request)
+    csrf_cookie = hashlib.sha1(request.META['CSRF_COOKIE'].encode()).hexdigest()[:8]
+    return f"{request.user.pk}-{version}-{csrf_cookie}"
+
+
+def _page_last_modified(request, *args, **kwargs) -> Optional[datetime]:
+    version = _page_version(request)
+    if version is None:
+        return None
+    modified = datetime.fromtimestamp(version / 1000, dt_timezone.utc)
+    # a page of the previous user of the browser is never fresh
+    if request.user.last_login is not None:
+        modified = max(modified, request.user.last_login)
+    return modified
+
 
-from website.selectors import get_discord_user, get_username_messages
+def user_page(view):
+    """Answers repeated GETs of a signed in user's page with 304 until the
+    page version changes"""
+    view = condition(etag_func=_page_etag, last_modified_func=_page_last_modified)(view)
+    # browsers have to ask every time instead of guessing the freshness
+    return cache_control(private=True, no_cache=True)(view)
 
 
+@user_page
 def index(request):
     context = {}
     if request.user.is_authenticated:
-        discord_user_id = request.user.username
-        context["discord_user"] = get_discord_user(discord_user_id)
-        context["last_messages"] = get_username_messages(discord_user_id, 5)
+        context = message_history_context(
+            get_request_discord_user(request)
+        )
 
     return render(request, 'website/index.html', context=context)
 
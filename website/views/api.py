@@ -1,18 +1,36 @@
-from typing import Dict
-from datetime import datetime
+import asyncio
+import hashlib
+import time
+from typing import Dict, Optional
+from datetime import datetime, timedelta
 from collections import namedtuple
+from functools import wraps
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.http import JsonResponse
+from django.template.defaultfilters import date as format_date
+from django.urls import reverse
 from django.utils.dateformat import format
 
-from i_cant_chat.settings import DATETIME_FORMAT
+from website.auth import get_request_discord_user
+from website.selectors import (
+    get_feed_cursor, get_feed_events, get_user_token, get_username_job,
+    get_username_messages_page
+)
+from website.services import ServiceError, discord, dynamic_username, idempotency, jobs
+from website.models import (
+    DiscordToken, DynamicUsername, UsernameChangeJob, UsernameMessage
+)
+from website.validators import split_sentence, validate_nickname, validate_sentence
 
-from website.selectors import get_user_token
-from website.services import ServiceError, discord
-from website.models import DiscordToken, UsernameMessage
 
-
-ApiResponse = namedtuple('ApiResponse', ['status', 'type', 'text'])
+# @data is optional payload, @code is the HTTP status of the response
+ApiResponse = namedtuple(
+    'ApiResponse', ['status', 'type', 'text', 'data', 'code'],
+    defaults=(None, 200)
+)
 
 
 class ApiMethod:
@@ -28,12 +46,6 @@ class ApiMethod:
         text='You are not authenticated.'
     )
 
-    WRONG_METHOD_ERROR = ApiResponse(
-        status='error',
-        type='Wrong method type',
-        text='You should use POST method only.'
-    )
-
     WRONG_ARGS_PASSED_ERROR = ApiResponse(
         status='error',
         type='Wrong arguments.',
@@ -46,56 +58,234 @@ class ApiMethod:
         text='Got empty response from the API method.'
     )
 
-    def __init__(self, method_args: set=set(), implemented: bool=True):
+    IDEMPOTENCY_KEY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+    IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+    def __init__(self, method_args: set=set(), implemented: bool=True,
+                 http_methods: set={"POST"}, validators: dict={},
+                 idempotent: bool=False):
         self._method_args = method_args
         self._implemented = implemented
+        self._http_methods = http_methods
+        # arg name -> Django validator, run before anything touches the DB
+        self._validators = validators
+        # requests with an Idempotency-Key header run once per key
+        self._idempotent = idempotent
+        self.WRONG_METHOD_ERROR = ApiResponse(
+            status='error',
+            type='Wrong method type',
+            text=f'You should use {", ".join(sorted(http_methods))} method only.'
+        )
 
     @staticmethod
     def get_date():
-        return format(datetime.now(), DATETIME_FORMAT)
+        return format(datetime.now(), settings.DATETIME_FORMAT)
+
+    @staticmethod
+    def to_json_response(result: ApiResponse) -> JsonResponse:
+        dict_result = result._asdict()
+        code = dict_result.pop("code")
+        if dict_result["data"] is None:
+            del dict_result["data"]
+        dict_result["date"] = ApiMethod.get_date()
+        return JsonResponse(dict_result, status=code)
 
     @staticmethod
     def api_response(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return ApiMethod.to_json_response(await func(*args, **kwargs))
+            return async_wrapper
+
+        @wraps(func)
         def wrapper(*args, **kwargs):
             result:ApiResponse = func(*args, **kwargs)
-            dict_result = result._asdict()
-            dict_result["date"] = ApiMethod.get_date()
-            return JsonResponse(dict_result)
+            return ApiMethod.to_json_response(result)
         return wrapper
 
+    def _check_request(self, request, kwargs) -> Optional[ApiResponse]:
+        """Returns an error response or fills @kwargs with method args.
+
+        Checks that need no queries go first, so malformed requests are
+        rejected before the session and the user are loaded.
+        """
+        if not self._implemented:
+            return self.NOT_IMPLEMENTED_WARN
+
+        if request.method not in self._http_methods:
+            return self.WRONG_METHOD_ERROR
+
+        params = request.POST if request.method == "POST" else request.GET
+        if not all(arg in params.keys() for arg in self._method_args):
+            return self.WRONG_ARGS_PASSED_ERROR
+
+        # validators may return the cleaned value to use instead
+        cleaned = {}
+        for arg, validator in self._validators.items():
+            try:
+                cleaned[arg] = validator(params[arg])
+            except ValidationError as e:
+                return ApiResponse(
+                    status='error',
+                    type='Invalid argument.',
+                    text=" ".join(e.messages)
+                )
+
+        if self._idempotent and len(self._get_idempotency_key(request) or "") \
+                > self.IDEMPOTENCY_KEY_MAX_LENGTH:
+            return self.WRONG_ARGS_PASSED_ERROR
+
+        if not request.user.is_authenticated:
+            return self.NOT_AUTH_ERROR
+
+        for method_arg in self._method_args:
+            value = cleaned.get(method_arg)
+            kwargs[method_arg] = params[method_arg] if value is None else value
+
+    def _get_idempotency_key(self, request) -> Optional[str]:
+        if not self._idempotent:
+            return None
+        return request.META.get(self.IDEMPOTENCY_KEY_HEADER) or None
+
+    @staticmethod
+    def _request_hash(request) -> str:
+        params = request.POST if request.method == "POST" else request.GET
+        arguments = sorted(
+            (name, value) for name, values in params.lists()
+            if name != "csrfmiddlewaretoken" for value in values
+        )
+        return hashlib.sha256(
+            repr((request.method, request.path, arguments)).encode()
+        ).hexdigest()
+
+    def _claim(self, request, key: str) -> Optional[ApiResponse]:
+        """Returns the response stored for @key or None if the request
+        has to run"""
+        try:
+            stored = idempotency.claim(request.user, key, self._request_hash(request))
+        except idempotency.IdempotencyKeyConflict as e:
+            return ApiResponse(status="error", type=e.text, text=e.details, code=409)
+        return ApiResponse(**stored) if stored is not None else None
+
+    @staticmethod
+    def _finish(request, key: str, result: Optional[ApiResponse]):
+        # failed requests give the key up, so they can be retried with it
+        if result is None or result.status == "error":
+            idempotency.release(request.user, key)
+        else:
+            idempotency.complete(request.user, key, result._asdict())
+
     def __call__(self, func):
+        if asyncio.iscoroutinefunction(func):
+            return self._wrap_async(func)
+
         @ApiMethod.api_response
+        @wraps(func)
         def wrapper(*args, **kwargs) -> ApiResponse:
             request = args[0] # must be request
-            if not self._implemented:
-                return self.NOT_IMPLEMENTED_WARN
+            error = self._check_request(request, kwargs)
+            if error is not None:
+                return error
 
-            if not request.user.is_authenticated:
-                return self.NOT_AUTH_ERROR
-            
-            if request.method != "POST":
-                return self.WRONG_METHOD_ERROR
+            key = self._get_idempotency_key(request)
+            if key is None:
+                return self._run(func, args, kwargs)
 
-            if not all(arg in request.POST.keys() for arg in self._method_args):
-                return self.WRONG_ARGS_PASSED_ERROR
+            stored = self._claim(request, key)
+            if stored is not None:
+                return stored
+            result = None
+            try:
+                result = self._run(func, args, kwargs)
+                return result
+            finally:
+                self._finish(request, key, result)
+        return wrapper
+
+    def _run(self, func, args, kwargs) -> ApiResponse:
+        try:
+            return func(*args, **kwargs) or self.EMPTY_RESPONSE_ERROR
+        except ServiceError as e:
+            return ApiResponse(status="error", type=e.text, text=e.details)
+
+    def _wrap_async(self, func):
+        @ApiMethod.api_response
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> ApiResponse:
+            request = args[0] # must be request
+            # session and user are loaded lazily from the database
+            error = await sync_to_async(self._check_request)(request, kwargs)
+            if error is not None:
+                return error
 
-            for method_arg in self._method_args:
-                kwargs[method_arg] = request.POST[method_arg]
+            key = self._get_idempotency_key(request)
+            if key is None:
+                return await self._arun(func, args, kwargs)
 
+            stored = await sync_to_async(self._claim)(request, key)
+            if stored is not None:
+                return stored
+            result = None
             try:
-                return func(*args, **kwargs) or self.EMPTY_RESPONSE_ERROR
-            except ServiceError as e:
-                return ApiResponse(status="error", type=e.text, text=e.details)
+                result = await self._arun(func, args, kwargs)
+                return result
+            finally:
+                await sync_to_async(self._finish)(request, key, result)
         return wrapper
 
+    async def _arun(self, func, args, kwargs) -> ApiResponse:
+        try:
+            return await func(*args, **kwargs) or self.EMPTY_RESPONSE_ERROR
+        except ServiceError as e:
+            return ApiResponse(status="error", type=e.text, text=e.details)
+
 
 @ApiMethod(implemented=False)
 def api_root(request):
     pass
 
 
-@ApiMethod({"username"})
+def _use_queue(request) -> bool:
+    return request.POST.get("queue") == "1" \
+        or getattr(settings, 'USERNAME_CHANGE_QUEUE', False)
+
+
+def _enqueue_username_change(request, username: str) -> ApiResponse:
+    discord_user = get_request_discord_user(request)
+    job: UsernameChangeJob = jobs.enqueue_username_change(discord_user, username)
+
+    return ApiResponse(
+        status="success",
+        type="Изменение никнейма поставлено в очередь.",
+        text=job.text,
+        data=_job_data(job),
+        code=202
+    )
+
+
+def _job_data(job: UsernameChangeJob) -> Dict:
+    return {
+        "job": job.pk,
+        "status": job.status,
+        "error": job.error,
+        "status_url": reverse('website:username_job', args=[job.pk])
+    }
+
+
+def _username_unchanged(username: str) -> ApiResponse:
+    return ApiResponse(
+        status="success",
+        type="Никнейм уже установлен.",
+        text=username
+    )
+
+
+@ApiMethod({"username"}, validators={"username": validate_nickname}, idempotent=True)
 def change_username(request, username=""):
+    if _use_queue(request):
+        return _enqueue_username_change(request, username)
+
     discord_user_id = request.user.username
     token: DiscordToken = get_user_token(discord_user_id)
 
@@ -112,6 +302,8 @@ def change_username(request, username=""):
     username_message: UsernameMessage = discord.create_username_message(
         token, username
     )
+    if username_message is None:
+        return _username_unchanged(username)
 
     return ApiResponse(
         status="success",
@@ -120,6 +312,228 @@ def change_username(request, username=""):
     )
 
 
-@ApiMethod(implemented=False)
-def dynamic_username_root(request):
-    pass
+@ApiMethod({"username"}, validators={"username": validate_nickname}, idempotent=True)
+async def change_username_async(request, username=""):
+    if _use_queue(request):
+        return await sync_to_async(_enqueue_username_change)(request, username)
+
+    discord_user_id = request.user.username
+    token: DiscordToken = await sync_to_async(get_user_token)(discord_user_id)
+
+    if token is None:
+        return ApiResponse(
+            status="error",
+            type="Ошибка получения токена.",
+            text=f"Токен пользователя {discord_user_id} не найден в базе."
+        )
+
+    if token.is_expired:
+        await discord.arefresh_token(token)
+
+    username_message: UsernameMessage = await discord.acreate_username_message(
+        token, username
+    )
+    if username_message is None:
+        return _username_unchanged(username)
+
+    return ApiResponse(
+        status="success",
+        type="Никнейм успешно изменен.",
+        text=username_message.text
+    )
+
+
+@ApiMethod({"sentence"}, validators={"sentence": validate_sentence}, idempotent=True)
+def change_username_sentence(request, sentence=""):
+    usernames = split_sentence(sentence)
+    # the steps are spaced out by the job workers, not in the request
+    queued = jobs.enqueue_sentence(
+        get_request_discord_user(request), usernames,
+        interval=getattr(settings, 'SENTENCE_STEP_INTERVAL', 1.0)
+    )
+
+    return ApiResponse(
+        status="success",
+        type="Фраза поставлена в очередь.",
+        text=" ".join(job.text for job in queued),
+        data={
+            "usernames": [job.text for job in queued],
+            "total": len(usernames),
+            "jobs": [_job_data(job) for job in queued]
+        },
+        code=202
+    )
+
+
+@ApiMethod(http_methods={"GET"})
+def username_job_status(request, job_id: int):
+    job: UsernameChangeJob = get_username_job(request.user.username, job_id)
+
+    if job is None:
+        return ApiResponse(
+            status="error",
+            type="Задача не найдена.",
+            text=f"Задача {job_id} не найдена.",
+            code=404
+        )
+
+    if job.status == UsernameChangeJob.FAILED:
+        return ApiResponse(
+            status="error", type="Ошибка изменения никнейма.",
+            text=job.error, data=_job_data(job)
+        )
+
+    if job.status == UsernameChangeJob.DONE:
+        return ApiResponse(
+            status="success", type="Никнейм успешно изменен.",
+            text=job.text, data=_job_data(job)
+        )
+
+    return ApiResponse(
+        status="warning", type="Изменение никнейма в очереди.",
+        text=job.text, data=_job_data(job)
+    )
+
+
+HISTORY_PAGE_SIZE = 20
+HISTORY_MAX_PAGE_SIZE = 100
+
+
+@ApiMethod(http_methods={"GET"})
+def username_history(request):
+    try:
+        count = int(request.GET.get("count", HISTORY_PAGE_SIZE))
+        messages, next_cursor = get_username_messages_page(
+            get_request_discord_user(request),
+            min(max(count, 1), HISTORY_MAX_PAGE_SIZE),
+            request.GET.get("cursor"),
+            # the archive is read only on request, once the history ends
+            archive=request.GET.get("archive") in ("1", "true")
+        )
+    except ValueError:
+        return ApiMethod.WRONG_ARGS_PASSED_ERROR
+
+    return ApiResponse(
+        status="success",
+        type="История никнеймов.",
+        text="",
+        data={
+            "messages": [
+                {
+                    "id": message.pk,
+                    "text": message.text,
+                    "sent": format_date(message.sent, settings.DATETIME_FORMAT)
+                }
+                for message in messages
+            ],
+            "next_cursor": next_cursor
+        }
+    )
+
+
+EVENTS_POLL_INTERVAL = 1.0
+
+
+def _long_poll_timeout() -> float:
+    # a sync worker is held for the whole wait, so it is opt-in under WSGI
+    default = 20.0 if getattr(settings, 'ASYNC_SERVING', False) else 0.0
+    return getattr(settings, 'EVENTS_LONG_POLL_TIMEOUT', default)
+
+
+def _events_response(events, cursor: str) -> ApiResponse:
+    return ApiResponse(
+        status="success",
+        type="События.",
+        text="",
+        data={"events": events, "cursor": cursor}
+    )
+
+
+DISCORD_USER_ERROR = ApiResponse(
+    status="error",
+    type="Ошибка получения пользователя.",
+    text="Пользователь Discord не найден в базе."
+)
+
+
+@ApiMethod(http_methods={"GET"})
+def events_poll(request):
+    """Long-poll fallback of the event stream served by website.streaming"""
+    discord_user = get_request_discord_user(request)
+    if discord_user is None:
+        return DISCORD_USER_ERROR
+
+    deadline = time.monotonic() + _long_poll_timeout()
+    try:
+        cursor = request.GET.get("cursor") or get_feed_cursor(discord_user.pk)
+        while True:
+            events, cursor = get_feed_events(discord_user.pk, cursor)
+            if events or time.monotonic() >= deadline:
+                return _events_response(events, cursor)
+            time.sleep(EVENTS_POLL_INTERVAL)
+    except ValueError:
+        return ApiMethod.WRONG_ARGS_PASSED_ERROR
+
+
+@ApiMethod(http_methods={"GET"})
+async def events_poll_async(request):
+    discord_user = await sync_to_async(get_request_discord_user)(request)
+    if discord_user is None:
+        return DISCORD_USER_ERROR
+
+    deadline = time.monotonic() + _long_poll_timeout()
+    try:
+        cursor = request.GET.get("cursor") \
+            or await sync_to_async(get_feed_cursor)(discord_user.pk)
+        while True:
+            events, cursor = await sync_to_async(get_feed_events)(
+                discord_user.pk, cursor
+            )
+            if events or time.monotonic() >= deadline:
+                return _events_response(events, cursor)
+            await asyncio.sleep(EVENTS_POLL_INTERVAL)
+    except ValueError:
+        return ApiMethod.WRONG_ARGS_PASSED_ERROR
+
+
+@ApiMethod({"usernames", "interval"})
+def dynamic_username_root(request, usernames="", interval=""):
+    try:
+        interval = timedelta(seconds=int(interval))
+    except ValueError:
+        return ApiMethod.WRONG_ARGS_PASSED_ERROR
+
+    min_interval = timedelta(
+        seconds=getattr(settings, 'DYNAMIC_USERNAME_MIN_INTERVAL', 60)
+    )
+    rotation: DynamicUsername = dynamic_username.set_dynamic_username(
+        get_request_discord_user(request),
+        usernames.splitlines(), interval, min_interval
+    )
+
+    return ApiResponse(
+        status="success",
+        type="Динамический никнейм запущен.",
+        text=", ".join(rotation.username_list),
+        data={
+            "usernames": rotation.username_list,
+            "interval": int(rotation.interval.total_seconds())
+        }
+    )
+
+
+@ApiMethod()
+def dynamic_username_stop(request):
+    if not dynamic_username.stop_dynamic_username(
+            get_request_discord_user(request)):
+        return ApiResponse(
+            status="warning",
+            type="Динамический никнейм не запущен.",
+            text="Нечего останавливать."
+        )
+
+    return ApiResponse(
+        status="success",
+        type="Динамический никнейм остановлен.",
+        text=""
+    )
@@ -1,11 +1,14 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth import login
+from django.contrib.auth.models import User
 from django.shortcuts import render, redirect
 from django.urls import reverse
 
+from website.auth import get_request_discord_user
 from website.services import ServiceError, discord
-from website.selectors import get_discord_user, get_username_messages
-from website.views import error_403, error_500
-from website.models import DiscordToken, DiscordUser
+from website.views import (
+    error_403, error_500, message_history_context, user_page
+)
 
 
 def _get_absolute_url(request, url_name: str) -> str:
@@ -26,14 +29,30 @@ def discord_auth(request):
 
     try:
         redirect_uri = _get_absolute_url(request, 'website:discord_auth')
-        token: DiscordToken = discord.create_token(code, redirect_uri)
-        user: DiscordUser = discord.create_user(token)
+        user: User = discord.sign_in(code, redirect_uri)
         login(request, user)
         return redirect('website:index')
     except ServiceError as e:
         return error_500(request, details=str(e))
 
 
+async def discord_auth_async(request):
+    code = request.GET.get('code', None)
+    if code is None:
+        return await sync_to_async(error_500)(
+            request, details="Нет кода для аутентификации."
+        )
+
+    try:
+        redirect_uri = _get_absolute_url(request, 'website:discord_auth')
+        user: User = await discord.asign_in(code, redirect_uri)
+        await sync_to_async(login)(request, user)
+        return redirect('website:index')
+    except ServiceError as e:
+        return await sync_to_async(error_500)(request, details=str(e))
+
+
+@user_page
 def discord_user_info(request):
     if not request.user.is_authenticated:
         return error_403(request, details="Необходимо войти с помощью Discord.")
@@ -41,8 +60,6 @@ def discord_user_info(request):
     # request.user.username should be equal to 
     # request.user.discord_user.discord_user_id, if it is not - 
     # None will be returned
-    discord_user_id = request.user.username
-    return render(request, 'website/user.html', context={
-        'discord_user': get_discord_user(discord_user_id),
-        'last_messages': get_username_messages(discord_user_id, 5)
-    })
+    return render(request, 'website/user.html', context=message_history_context(
+        get_request_discord_user(request)
+    ))
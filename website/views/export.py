@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+
+from datetime import datetime, time
+from typing import Iterator, Optional
+
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from website.auth import get_request_discord_user
+from website.selectors import EXPORT_FIELDS, iter_username_messages
+from website.views import error_403
+
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def _parse_bound(value: Optional[str]) -> Optional[datetime]:
+    """ISO date or date-time, dates mean their midnight"""
+    if not value:
+        return None
+    moment = parse_datetime(value)
+    if moment is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(f"Bad date: {value}")
+        moment = datetime.combine(date, time())
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment, timezone.utc)
+    return moment
+
+
+def _ndjson_chunks(rows) -> Iterator[str]:
+    lines = []
+    for pk, discord_user_id, text, sent in rows:
+        lines.append(json.dumps({
+            'id': pk,
+            'discord_user_id': discord_user_id,
+            'text': text,
+            'sent': sent.isoformat()
+        }, ensure_ascii=False) + "\n")
+        if len(lines) == EXPORT_CHUNK_SIZE:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def _csv_chunks(rows) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for i, (pk, discord_user_id, text, sent) in enumerate(rows, 1):
+        writer.writerow((pk, discord_user_id, text, sent.isoformat()))
+        if i % EXPORT_CHUNK_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _export(request, discord_user_pk: Optional[int], filename: str):
+    export_format = request.GET.get('format', 'ndjson')
+    if export_format not in EXPORT_CONTENT_TYPES:
+        return HttpResponseBadRequest(f"Unknown format: {export_format}")
+    try:
+        since = _parse_bound(request.GET.get('since'))
+        until = _parse_bound(request.GET.get('until'))
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
+
+    rows = iter_username_messages(
+        discord_user_pk, since, until, chunk_size=EXPORT_CHUNK_SIZE
+    )
+    chunks = _csv_chunks(rows) if export_format == 'csv' else _ndjson_chunks(rows)
+    response = StreamingHttpResponse(
+        chunks, content_type=EXPORT_CONTENT_TYPES[export_format]
+    )
+    response['Content-Disposition'] = \
+        f'attachment; filename="{filename}.{export_format}"'
+    return response
+
+
+def user_messages(request):
+    if not request.user.is_authenticated:
+        return error_403(request, details="Необходимо войти с помощью Discord.")
+
+    discord_user = get_request_discord_user(request)
+    if discord_user is None:
+        return error_403(request, details="Нет пользователя Discord.")
+    return _export(request, discord_user.pk, f"nicknames-{discord_user.discord_user_id}")
+
+
+def all_messages(request):
+    if not (request.user.is_authenticated and request.user.is_staff):
+        return error_403(request)
+    return _export(request, None, "nicknames")
@@ -0,0 +1,11 @@
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+
+from website import warmup
+
+
+@never_cache
+def ready(request):
+    checks = warmup.warm_up()
+    # Discord being down takes the nickname features only
+    return JsonResponse(checks, status=200 if checks['database'] else 503)
@@ -0,0 +1,23 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from website import metrics
+
+
+def _has_access(request) -> bool:
+    if request.user.is_authenticated and request.user.is_staff:
+        return True
+
+    # scrapers authenticate with "Authorization: Bearer <METRICS_TOKEN>"
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    header = request.META.get('HTTP_AUTHORIZATION', '')
+    return bool(token) and hmac.compare_digest(header, f"Bearer {token}")
+
+
+def metrics_root(request):
+    if not _has_access(request):
+        return HttpResponse(status=403)
+
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
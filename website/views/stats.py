@@ -0,0 +1,20 @@
+from django.shortcuts import render
+
+from website.selectors import get_active_users, get_daily_usage, get_top_nicknames
+
+
+STATS_DAYS = 30
+TOP_NICKNAMES_COUNT = 10
+
+
+def stats_root(request):
+    return render(request, 'website/stats.html', context={
+        'days': STATS_DAYS,
+        'daily_usage': get_daily_usage(STATS_DAYS),
+        'top_nicknames': get_top_nicknames(TOP_NICKNAMES_COUNT),
+        'active_users': {
+            'day': get_active_users(1),
+            'week': get_active_users(7),
+            'month': get_active_users(STATS_DAYS),
+        },
+    })
@@ -0,0 +1,49 @@
+"""Readiness checks that warm a worker up on the way.
+
+A fresh worker used to pay on its first request for the URLconf and the
+views import, the database connection and the TLS handshake with
+Discord. warm_up() does all of it ahead: gunicorn runs it in every
+worker before it takes requests (see gunicorn.conf.py), and the
+`website:ready` url runs it for the router and uptime checks.
+
+Only the sync client is warmed up, the async one keeps a pool per event
+loop and opens it on the first call.
+"""
+from typing import Dict
+
+from django.db import DatabaseError, connection
+from django.urls import get_resolver
+
+from website.services.discord_api import DiscordApiError, get_api
+
+
+# Discord is called until the first success only, readiness checks must
+# not spend the rate limit
+_discord_ready = False
+
+
+def check_database() -> bool:
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return True
+    except DatabaseError:
+        return False
+
+
+def check_discord() -> bool:
+    global _discord_ready
+    if not _discord_ready:
+        try:
+            get_api().warm_up()
+            _discord_ready = True
+        except DiscordApiError:
+            pass
+    return _discord_ready
+
+
+def warm_up() -> Dict[str, bool]:
+    """Loads the views and opens the pooled connections. Returns the
+    state of every dependency, only the database is required."""
+    get_resolver().url_patterns
+    return {'database': check_database(), 'discord': check_discord()}